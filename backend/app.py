@@ -1,12 +1,16 @@
 from flask import Flask
 from flask_cors import CORS
-from config.db import db, migrate
-from config.settings import Settings
+from config.db import init_app as init_db
+from config.settings import Settings, get_bool
 from models import * 
 from models.user import User
 from routes.auth_route import auth_bp
 from routes.resume_route import resume_bp
 from routes.round1_route import round1_bp
+from routes.health_route import health_bp
+from routes.metrics_route import metrics_bp
+from tools.whisper_stt import model_manager
+from utils import compression
 
 from dotenv import load_dotenv
 
@@ -16,8 +20,7 @@ load_dotenv()
 app = Flask(__name__)
 app.config.from_object(Settings)
 
-db.init_app(app)
-migrate.init_app(app, db)
+init_db(app)
 
 CORS(app, 
      resources={r"/*": {"origins": ["http://localhost:5173", "http://127.0.0.1:5173"]}}, 
@@ -26,9 +29,21 @@ CORS(app,
      methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"])
 
 
+if get_bool(Settings.RESPONSE_COMPRESSION):
+    compression.init_app(app)
+
+
 app.register_blueprint(auth_bp,url_prefix="/api/auth")
 app.register_blueprint(resume_bp, url_prefix="/api")
 app.register_blueprint(round1_bp, url_prefix="/api/round1")
+app.register_blueprint(health_bp, url_prefix="/api/health")
+app.register_blueprint(metrics_bp)
+
+if (
+    get_bool(Settings.WHISPER_WARMUP_ON_START)
+    and Settings.STT_BACKEND != "sidecar"
+):
+    model_manager.warmup()
 
 
 
@@ -0,0 +1,240 @@
+"""ASGI entrypoint: async round 1 endpoints in front of the Flask app.
+
+    uvicorn asgi:app --workers 2
+
+Served by ``Round1AsyncService`` (model calls awaited, blocking work on thread
+pools), so one process can hold hundreds of in-flight interview steps:
+
+    POST /api/round1/start
+    GET  /api/round1/get-question-audio
+    POST /api/round1/submit-answer/<id>     (except ?mode=async, which uses the job queue)
+    POST /api/round1/end-interview
+
+Every other request goes to the unchanged Flask views through asgiref's WSGI
+adapter. ``gunicorn app:app`` keeps serving the fully sync path.
+
+The async handlers run inside a Flask request context built from the ASGI
+scope. Auth, form parsing, cookies, CORS and ``after_request`` behave as in
+the Flask views.
+"""
+import io
+import logging
+import re
+import sys
+import time
+from urllib.parse import parse_qs
+
+from asgiref.wsgi import WsgiToAsgi
+from flask import jsonify, request
+
+from app import app as flask_app
+from config.settings import Settings, get_bool
+from middleware.auth_middleware import authenticate_access_token, authenticate_refresh_token
+from services.round1_async_service import get_async_service
+from tools.audio_decode import AudioDecodeError, UploadTooLarge, decode_audio, iter_stream
+from utils.JWT_token import get_token_from_request, set_token_cookies
+
+
+logger = logging.getLogger(__name__)
+
+# Multipart framing on top of the audio itself
+_BODY_SLACK = 1024 * 1024
+
+
+class _HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def _build_environ(scope, body: bytes) -> dict:
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", "").encode("utf-8").decode("latin-1"),
+        "PATH_INFO": scope["path"].encode("utf-8").decode("latin-1"),
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    server = scope.get("server") or ("localhost", 80)
+    environ["SERVER_NAME"], environ["SERVER_PORT"] = server[0], str(server[1] or 80)
+    if scope.get("client"):
+        environ["REMOTE_ADDR"] = scope["client"][0]
+    for raw_name, raw_value in scope.get("headers", []):
+        name = raw_name.decode("latin-1").upper().replace("-", "_")
+        value = raw_value.decode("latin-1")
+        if name == "CONTENT_TYPE":
+            environ["CONTENT_TYPE"] = value
+            continue
+        if name == "CONTENT_LENGTH":
+            continue
+        key = f"HTTP_{name}"
+        environ[key] = f"{environ[key]},{value}" if key in environ else value
+    return environ
+
+
+async def _read_body(receive, limit: int) -> bytes:
+    body = bytearray()
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            raise _HTTPError(400, "Client disconnected")
+        body += message.get("body", b"")
+        if len(body) > limit:
+            raise _HTTPError(413, "Audio file too large")
+        if not message.get("more_body"):
+            return bytes(body)
+
+
+async def _authenticate(svc):
+    """Mirror ``auth_required``: access token first, then a silent refresh."""
+    token = get_token_from_request(request, token_name="access_token")
+    if token:
+        try:
+            user = await svc.run_blocking(authenticate_access_token, token)
+        except Exception:
+            user = None
+        if user:
+            return user.id, None
+    refresh = request.cookies.get("refresh_token") or get_token_from_request(request, "refresh_token")
+    if refresh:
+        user, new_access = await svc.run_blocking(authenticate_refresh_token, refresh)
+        if user:
+            return user.id, new_access
+    return None, None
+
+
+def _decode_upload():
+    """Same input handling as the sync submit-answer view; runs on a worker thread."""
+    if request.mimetype.startswith("audio/"):
+        source = request.stream
+    else:
+        audio_file = request.files.get("audio")
+        if not audio_file:
+            raise _HTTPError(400, "Audio file required")
+        source = audio_file.stream
+    try:
+        return decode_audio(iter_stream(source), max_bytes=Settings.ROUND1_MAX_UPLOAD_BYTES)
+    except UploadTooLarge as e:
+        raise _HTTPError(413, str(e))
+    except AudioDecodeError as e:
+        raise _HTTPError(400, str(e))
+
+
+async def start_round_1(svc, user_id):
+    include_audio = get_bool(request.args.get("include_audio"))
+    result = await svc.start_round_1(user_id, include_audio=include_audio)
+    return result, 200 if "error" not in result else 400
+
+
+async def get_question_audio(svc, user_id):
+    q = await svc.get_question_audio(user_id)
+    if not q:
+        return {"round_status": "no_more_questions", "message": "No more questions"}, 200
+    if q.get("round_status") == "generating":
+        return q, 202
+    return q, 200 if "error" not in q else 400
+
+
+async def submit_answer(svc, user_id, question_id):
+    started = time.perf_counter()
+    audio = await svc.run_blocking(_decode_upload)
+    decode_ms = round((time.perf_counter() - started) * 1000, 1)
+    result = await svc.submit_answer(user_id, int(question_id), audio)
+    result.setdefault("timings", {})["decode_ms"] = decode_ms
+    return result, 200 if "error" not in result else 400
+
+
+async def end_interview(svc, user_id):
+    result = await svc.end_round_1(user_id)
+    return result, 200 if "error" not in result else 400
+
+
+ROUTES = [
+    ("POST", re.compile(r"^/api/round1/start$"), start_round_1),
+    ("GET", re.compile(r"^/api/round1/get-question-audio$"), get_question_audio),
+    ("POST", re.compile(r"^/api/round1/submit-answer/(\d+)$"), submit_answer),
+    ("POST", re.compile(r"^/api/round1/end-interview$"), end_interview),
+]
+
+
+def _submit_mode(scope) -> str:
+    """The submit-answer mode as the Flask view reads it: ``?mode=`` or ``ROUND1_SUBMIT_MODE``."""
+    query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+    return ((query.get("mode") or [""])[0] or Settings.ROUND1_SUBMIT_MODE).lower()
+
+
+class Round1ASGI:
+    def __init__(self, flask_app):
+        self.flask_app = flask_app
+        self.wsgi = WsgiToAsgi(flask_app)
+
+    def _match(self, scope):
+        for method, pattern, handler in ROUTES:
+            m = pattern.match(scope["path"])
+            if m and scope["method"] == method:
+                if handler is submit_answer and _submit_mode(scope) == "async":
+                    return None, ()  # job-queue path stays on the sync view
+                return handler, m.groups()
+        return None, ()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        if scope["type"] != "http":
+            return
+        handler, args = self._match(scope)
+        if handler is None:
+            await self.wsgi(scope, receive, send)
+            return
+
+        svc = get_async_service(self.flask_app)
+        try:
+            body = await _read_body(receive, Settings.ROUND1_MAX_UPLOAD_BYTES + _BODY_SLACK)
+        except _HTTPError as e:
+            body, early_error = b"", e
+        else:
+            early_error = None
+
+        with self.flask_app.request_context(_build_environ(scope, body)):
+            try:
+                if early_error is not None:
+                    raise early_error
+                user_id, new_access = await _authenticate(svc)
+                if user_id is None:
+                    payload, status = {"error": "Unauthorized"}, 401
+                else:
+                    payload, status = await handler(svc, user_id, *args)
+            except _HTTPError as e:
+                payload, status, new_access = {"error": e.message}, e.status, None
+            except Exception:
+                logger.exception("ASGI round1 handler failed path=%s", scope["path"])
+                payload, status, new_access = {"error": "Internal server error"}, 500, None
+
+            resp = self.flask_app.make_response((jsonify(payload), status))
+            if new_access:
+                set_token_cookies(resp, access_token=new_access)
+            # CORS headers and any other after_request hooks
+            resp = self.flask_app.process_response(resp)
+            headers = [(k.encode("latin-1"), v.encode("latin-1")) for k, v in resp.headers.to_wsgi_list()]
+            data = resp.get_data()
+
+        await send({"type": "http.response.start", "status": resp.status_code, "headers": headers})
+        await send({"type": "http.response.body", "body": data})
+
+
+app = Round1ASGI(flask_app)
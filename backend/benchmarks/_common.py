@@ -0,0 +1,148 @@
+"""Shared setup for the backend benchmarks.
+
+Benchmarks run against a throwaway SQLite database and call the real Flask app
+through its test client. Run them from ``backend/``:
+
+    python -m benchmarks.bench_submit_answer
+"""
+import json
+import math
+import os
+import statistics
+import struct
+import tempfile
+import time
+import wave
+from typing import Callable, Dict, List
+
+
+EVAL_JSON = json.dumps({"score": 7, "feedback": "ok", "meets_requirement": True, "improvements": [], "dimensions": {}})
+SUMMARY = {"overall_score": 70, "pass": True, "strengths": [], "gaps": [], "recommendations": []}
+
+
+def load_app(db_url: str = None, **env):
+    """Import the Flask app bound to a fresh database and create the schema."""
+    if db_url is None:
+        fd, path = tempfile.mkstemp(suffix=".db", prefix="bench_")
+        os.close(fd)
+        db_url = f"sqlite:///{path}"
+    os.environ["DATABASE_URL"] = db_url
+    os.environ.setdefault("JWT_SECRET", "bench-secret")
+    for key, value in env.items():
+        os.environ[key] = str(value)
+
+    from app import app
+    from config.db import db
+
+    app.config["SQLALCHEMY_DATABASE_URI"] = db_url
+    with app.app_context():
+        db.create_all()
+    return app
+
+
+def seed_user(app, email: str = "bench@example.com", resume: str = "Python developer", jd: str = "Backend role"):
+    """Create a user with resume/JD and return ``(user_id, auth_headers)``."""
+    from config.db import db
+    from models.user import User
+    from utils.JWT_token import create_access_token
+
+    with app.app_context():
+        user = User(name="Bench", email=email, resume_text=resume, job_description=jd)
+        user.set_password("Bench-pass-1")
+        db.session.add(user)
+        db.session.commit()
+        token = create_access_token(user.id)
+        return user.id, {"Authorization": f"Bearer {token}"}
+
+
+def seed_round(app, user_id: int, num_questions: int) -> List[int]:
+    """Create interview + round 1 with ``num_questions`` unanswered questions."""
+    from config.db import db
+    from models import Interview, InterviewRound, InterviewQuestion
+
+    with app.app_context():
+        interview = Interview(user_id=user_id, status="in_progress")
+        db.session.add(interview)
+        db.session.flush()
+        round1 = InterviewRound(interview_id=interview.id, round_number=1, status="in_progress")
+        db.session.add(round1)
+        db.session.flush()
+        questions = [
+            InterviewQuestion(round_id=round1.id, question_text=f"Question {i}?")
+            for i in range(num_questions)
+        ]
+        db.session.add_all(questions)
+        db.session.commit()
+        return [q.id for q in questions]
+
+
+def stub_external_calls(num_questions: int) -> None:
+    """Replace the model, Whisper and gTTS with canned answers."""
+    from utils.interview_shared import InterviewUtils
+
+    def fake_invoke(messages, call_site, template_version, use_cache=True):
+        if call_site == "evaluate_answer":
+            return EVAL_JSON
+        if call_site == "evaluate_round_batch":
+            # No per-question evaluations: exercises the one-by-one fallback as well
+            return json.dumps({"evaluations": [], "summary": SUMMARY})
+        return json.dumps(SUMMARY)
+
+    InterviewUtils._invoke_llm = staticmethod(fake_invoke)
+    InterviewUtils.speech_to_text = staticmethod(lambda audio: "simulated transcript")
+    InterviewUtils.generate_question_texts = staticmethod(
+        lambda user, num_q=5, round_id=None: [f"Question {i}?" for i in range(num_questions)]
+    )
+    InterviewUtils.text_to_speech = staticmethod(lambda text: "/static/audio/stub.mp3")
+    InterviewUtils.cached_audio_url = staticmethod(lambda text: "/static/audio/stub.mp3")
+
+
+def make_sample(seconds: float = 8.0, rate: int = 16000) -> str:
+    """Write a mono 16 kHz tone to a temp wav file (used when --audio is not given)."""
+    fd, path = tempfile.mkstemp(suffix=".wav", prefix="bench_stt_")
+    os.close(fd)
+    with wave.open(path, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        frames = b"".join(
+            struct.pack("<h", int(8000 * math.sin(2 * math.pi * 440 * i / rate)))
+            for i in range(int(seconds * rate))
+        )
+        w.writeframes(frames)
+    return path
+
+
+def timed(fn: Callable, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    """Return mean/p50/p95/p99 in milliseconds."""
+    if not latencies:
+        return {"n": 0}
+    ordered = sorted(latencies)
+
+    def pct(p):
+        return ordered[min(len(ordered) - 1, int(round(p * (len(ordered) - 1))))] * 1000
+
+    return {
+        "n": len(ordered),
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "p50_ms": pct(0.50),
+        "p95_ms": pct(0.95),
+        "p99_ms": pct(0.99),
+    }
+
+
+def print_table(title: str, rows: List[Dict], columns: List[str]) -> None:
+    print(f"\n{title}")
+    print("  ".join(f"{c:>14}" for c in columns))
+    for row in rows:
+        cells = []
+        for c in columns:
+            v = row.get(c, "")
+            cells.append(f"{v:>14.2f}" if isinstance(v, float) else f"{str(v):>14}")
+        print("  ".join(cells))
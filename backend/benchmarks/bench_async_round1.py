@@ -0,0 +1,157 @@
+"""Load test: sync Flask views vs the ASGI entrypoint for submit-answer.
+
+The LLM is replaced by a sleep (``time.sleep`` on the sync path,
+``asyncio.sleep`` on the async one). Whisper is replaced by a ``time.sleep``
+on both paths. The numbers therefore show how many in-flight interview steps
+each mode can hold, not OpenAI speed.
+
+The sync mode bounds concurrency with ``--web-workers`` slots, like gunicorn
+threads. The async mode drives ``asgi.app`` in-process through httpx's ASGI
+transport with ``--clients`` concurrent requests.
+
+    python -m benchmarks.bench_async_round1 --users 100 --clients 200 --eval-s 2
+"""
+import argparse
+import asyncio
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks._common import load_app, make_sample, seed_user, seed_round, summarize, print_table
+
+EVAL_JSON = '{"score": 7, "feedback": "ok", "meets_requirement": true, "improvements": [], "dimensions": {}}'
+SUMMARY_JSON = '{"overall_score": 70, "pass": true, "strengths": [], "gaps": [], "recommendations": []}'
+
+
+def patch_latency(stt_s: float, llm_s: float) -> None:
+    from utils.interview_shared import InterviewUtils
+
+    def fake_stt(audio):
+        time.sleep(stt_s)
+        return "simulated transcript"
+
+    def canned(call_site):
+        return EVAL_JSON if call_site == "evaluate_answer" else SUMMARY_JSON
+
+    def fake_invoke(messages, call_site, template_version, use_cache=True):
+        time.sleep(llm_s)
+        return canned(call_site)
+
+    async def fake_ainvoke(messages, call_site, template_version, use_cache=True):
+        await asyncio.sleep(llm_s)
+        return canned(call_site)
+
+    InterviewUtils.speech_to_text = staticmethod(fake_stt)
+    InterviewUtils._invoke_llm = staticmethod(fake_invoke)
+    InterviewUtils._ainvoke_llm = staticmethod(fake_ainvoke)
+
+
+def seed(app, users: int, questions: int, tag: str):
+    work = []
+    for i in range(users):
+        user_id, headers = seed_user(app, email=f"{tag}{i}@example.com")
+        for qid in seed_round(app, user_id, questions):
+            work.append((qid, headers))
+    return work
+
+
+def run_sync(app, work, web_workers: int, audio: bytes):
+    slots = threading.BoundedSemaphore(web_workers)
+    latencies, errors = [], 0
+    lock = threading.Lock()
+
+    def one(item):
+        nonlocal errors
+        qid, headers = item
+        with slots:
+            client = app.test_client()
+            start = time.perf_counter()
+            resp = client.post(
+                f"/api/round1/submit-answer/{qid}",
+                data={"audio": (io.BytesIO(audio), "answer.wav")},
+                headers=headers,
+                content_type="multipart/form-data",
+            )
+            elapsed = time.perf_counter() - start
+        with lock:
+            latencies.append(elapsed)
+            errors += resp.status_code != 200
+
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(work)) as pool:
+        list(pool.map(one, work))
+    return latencies, time.perf_counter() - wall_start, errors
+
+
+async def run_async(asgi_app, work, clients: int, audio: bytes):
+    import httpx
+
+    sem = asyncio.Semaphore(clients)
+    latencies, errors = [], 0
+    transport = httpx.ASGITransport(app=asgi_app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        async def one(item):
+            nonlocal errors
+            qid, headers = item
+            async with sem:
+                start = time.perf_counter()
+                resp = await client.post(
+                    f"/api/round1/submit-answer/{qid}",
+                    files={"audio": ("answer.wav", audio, "audio/wav")},
+                    headers=headers,
+                )
+                latencies.append(time.perf_counter() - start)
+                errors += resp.status_code != 200
+
+        wall_start = time.perf_counter()
+        await asyncio.gather(*(one(item) for item in work))
+    return latencies, time.perf_counter() - wall_start, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--questions", type=int, default=5)
+    parser.add_argument("--clients", type=int, default=200, help="concurrent requests in async mode")
+    parser.add_argument("--web-workers", type=int, default=8, help="sync worker threads")
+    parser.add_argument("--stt-workers", type=int, default=1, help="Whisper threads in async mode (inference is serialized)")
+    parser.add_argument("--stt-s", type=float, default=0.1)
+    parser.add_argument("--eval-s", type=float, default=2.0)
+    parser.add_argument("--audio-seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    app = load_app(
+        TTS_PRESYNTHESIZE="False",
+        QUESTION_POOL_DEPTH=0,
+        LLM_CACHE_ENABLED="False",
+        ASYNC_STT_WORKERS=args.stt_workers,
+        ASYNC_BLOCKING_WORKERS=max(32, args.clients // 4),
+    )
+    patch_latency(args.stt_s, args.eval_s)
+    with open(make_sample(args.audio_seconds), "rb") as f:
+        audio = f.read()
+
+    from asgi import app as asgi_app
+
+    rows = []
+    work = seed(app, args.users, args.questions, "sync")
+    latencies, wall, errors = run_sync(app, work, args.web_workers, audio)
+    rows.append({"mode": f"sync/{args.web_workers}thr", "req_per_s": len(work) / wall, "errors": errors,
+                 **summarize(latencies)})
+
+    work = seed(app, args.users, args.questions, "async")
+    latencies, wall, errors = asyncio.run(run_async(asgi_app, work, args.clients, audio))
+    rows.append({"mode": f"asgi/{args.clients}c", "req_per_s": len(work) / wall, "errors": errors,
+                 **summarize(latencies)})
+
+    print_table(
+        f"submit-answer x{args.users * args.questions}, LLM {args.eval_s}s, STT {args.stt_s}s",
+        rows,
+        ["mode", "req_per_s", "errors", "mean_ms", "p50_ms", "p95_ms", "p99_ms"],
+    )
+
+
+if __name__ == "__main__":
+    main()
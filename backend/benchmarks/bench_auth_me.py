@@ -0,0 +1,86 @@
+"""Requests/sec on /api/auth/me with DB-backed vs cached access-token verification.
+
+The seeded user carries a large resume/JD so the cost of loading the full
+``users`` row shows up the way it does in production. SQL statements per
+request are counted with an engine event listener.
+
+    python -m benchmarks.bench_auth_me --requests 2000 --clients 8 --resume-kb 50
+"""
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks._common import load_app, seed_user, summarize, print_table
+
+
+def run(app, path: str, headers, requests: int, clients: int):
+    latencies = []
+    lock = threading.Lock()
+
+    def one(_):
+        client = app.test_client()
+        start = time.perf_counter()
+        resp = client.get(path, headers=headers)
+        elapsed = time.perf_counter() - start
+        assert resp.status_code == 200, resp.status_code
+        with lock:
+            latencies.append(elapsed)
+
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        list(pool.map(one, range(requests)))
+    return latencies, time.perf_counter() - wall_start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--resume-kb", type=int, default=50, help="size of the seeded resume and JD")
+    parser.add_argument("--path", default="/api/auth/me",
+                        help="authenticated GET route to hit, e.g. /api/round1/get-interview-status")
+    parser.add_argument("--db-url", help="database URL (default: temp SQLite file)")
+    args = parser.parse_args()
+
+    app = load_app(args.db_url)
+    blob = "x" * (args.resume_kb * 1024)
+    _, headers = seed_user(app, resume=blob, jd=blob)
+
+    from sqlalchemy import event
+    from config.db import db
+    from config.settings import Settings
+    from utils.identity_cache import get_identity_cache
+
+    statements = {"n": 0}
+    with app.app_context():
+        engine = db.engine
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count(*_):
+        statements["n"] += 1
+
+    rows = []
+    for mode in ("db", "cached"):
+        Settings.AUTH_VERIFY_MODE = mode
+        get_identity_cache().clear()
+        run(app, args.path, headers, min(50, args.requests), 1)  # warm up
+        statements["n"] = 0
+        latencies, wall = run(app, args.path, headers, args.requests, args.clients)
+        rows.append({
+            "mode": mode,
+            "req_per_s": args.requests / wall,
+            "sql_per_req": statements["n"] / args.requests,
+            **summarize(latencies),
+        })
+
+    print_table(
+        f"GET {args.path}, {args.requests} requests, {args.clients} clients, {args.resume_kb} KB resume/JD",
+        rows,
+        ["mode", "req_per_s", "sql_per_req", "mean_ms", "p50_ms", "p95_ms", "p99_ms"],
+    )
+    print(get_identity_cache().stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Prompt tokens and wall time: per-answer evaluation vs deferred batch evaluation.
+
+Without ``--live`` only prompt tokens are counted (tiktoken), which needs no
+API key. With ``--live`` both flows call the real model with the response
+cache bypassed. The report then also includes provider-reported usage and
+wall time.
+
+    python -m benchmarks.bench_batch_eval --resume resume.txt --jd jd.txt --live
+"""
+import argparse
+import json
+import os
+import time
+from types import SimpleNamespace
+
+from benchmarks._common import print_table
+
+SAMPLE_QA = [
+    ("Walk me through a backend service you designed end to end.",
+     "I built an order service in Flask with Postgres, added Redis caching and cut p95 latency by half."),
+    ("How do you handle disagreements about technical direction?",
+     "I write down the options with trade-offs, ask for data, and we agree on a small experiment."),
+    ("A deploy doubles error rates. What do you do first?",
+     "Roll back, check dashboards and logs for the failing endpoint, then reproduce in staging."),
+    ("Which Python testing tools have you used and why?",
+     "pytest with fixtures and factory_boy, plus hypothesis for parsers."),
+    ("Tell me about the project you are most proud of.",
+     "A migration of a monolith's reporting module into a separate service with zero downtime."),
+]
+
+
+def count_tokens(messages) -> int:
+    import tiktoken
+
+    enc = tiktoken.encoding_for_model("gpt-3.5-turbo")
+    # ~4 tokens of chat framing per message, as in OpenAI's cookbook estimate
+    return sum(len(enc.encode(m.content)) + 4 for m in messages) + 3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--resume", help="resume text file (default: short sample)")
+    parser.add_argument("--jd", help="job description text file (default: short sample)")
+    parser.add_argument("--live", action="store_true", help="call the model and time both flows")
+    args = parser.parse_args()
+
+    if not args.live:
+        # The module-level ChatOpenAI client only needs a key to be constructed
+        os.environ.setdefault("OPENAI_API_KEY", "sk-offline-benchmark")
+    from utils.interview_shared import InterviewUtils, _token_usage, llm
+
+    resume = open(args.resume).read() if args.resume else "Backend engineer, 5 years Python, Flask, Postgres, AWS."
+    jd = open(args.jd).read() if args.jd else "Senior backend engineer: Python, REST APIs, SQL, cloud."
+    questions = [
+        SimpleNamespace(id=i + 1, question_text=q, answer_text=a) for i, (q, a) in enumerate(SAMPLE_QA)
+    ]
+    placeholder_eval = {
+        "score": 7, "feedback": "Solid answer with a concrete example.", "criteria_met": True,
+        "improvements": ["Quantify impact"], "dimensions": {"relevance": 8, "clarity": 7, "depth": 6, "examples": 7},
+    }
+
+    per_answer_msgs = [
+        InterviewUtils._eval_messages(q.question_text, q.answer_text, resume, jd) for q in questions
+    ]
+    summary_msgs = InterviewUtils._summary_messages([placeholder_eval] * len(questions), resume, jd)
+    batch_msgs = InterviewUtils._batch_messages(questions, [], resume, jd)
+
+    rows = [
+        {
+            "flow": "per_answer",
+            "llm_calls": len(per_answer_msgs) + 1,
+            "prompt_tokens": sum(count_tokens(m) for m in per_answer_msgs) + count_tokens(summary_msgs),
+        },
+        {"flow": "deferred", "llm_calls": 1, "prompt_tokens": count_tokens(batch_msgs)},
+    ]
+
+    if args.live:
+        def run(msgs_list):
+            usage = {"prompt_tokens": 0, "completion_tokens": 0}
+            start = time.perf_counter()
+            for msgs in msgs_list:
+                resp = llm.invoke(msgs)
+                for k, v in _token_usage(resp).items():
+                    usage[k] += v
+            return usage, time.perf_counter() - start
+
+        usage, wall = run(per_answer_msgs + [summary_msgs])
+        rows[0].update({"api_prompt": usage["prompt_tokens"], "api_completion": usage["completion_tokens"], "wall_s": wall})
+        usage, wall = run([batch_msgs])
+        rows[1].update({"api_prompt": usage["prompt_tokens"], "api_completion": usage["completion_tokens"], "wall_s": wall})
+
+    columns = ["flow", "llm_calls", "prompt_tokens"]
+    if args.live:
+        columns += ["api_prompt", "api_completion", "wall_s"]
+    print_table(f"Round evaluation for {len(questions)} answers", rows, columns)
+    print(json.dumps({"resume_chars": len(resume), "jd_chars": len(jd)}))
+
+
+if __name__ == "__main__":
+    main()
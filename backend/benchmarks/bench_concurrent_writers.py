@@ -0,0 +1,128 @@
+"""Many candidates submitting answers at once against one SQLite file.
+
+Every candidate gets its own user and round 1 and submits all of its answers
+from its own thread through the Flask test client. The model, Whisper and gTTS
+are stubbed to return at once, so the database is the only shared resource and
+each request is mostly commits. Each preset runs in a fresh process, because
+engine options are fixed when the app is created:
+
+* legacy: rollback journal, synchronous=FULL, pysqlite's 5 s busy timeout
+  (what the app used before engine options existed);
+* wal: the defaults (WAL, synchronous=NORMAL, 10 s busy timeout);
+* wal_immediate: wal plus ``DB_SQLITE_BEGIN=immediate``.
+
+    python -m benchmarks.bench_concurrent_writers --candidates 32 --questions 5
+"""
+import argparse
+import io
+import json
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks._common import (
+    load_app, make_sample, print_table, seed_round, seed_user, stub_external_calls, summarize,
+)
+
+PRESETS = {
+    "legacy": {
+        "DB_SQLITE_JOURNAL_MODE": "DELETE",
+        "DB_SQLITE_SYNCHRONOUS": "FULL",
+        "DB_SQLITE_BUSY_TIMEOUT_MS": 5000,
+        "DB_SQLITE_BEGIN": "deferred",
+    },
+    "wal": {},
+    "wal_immediate": {"DB_SQLITE_BEGIN": "immediate"},
+}
+
+
+def run_preset(name: str, candidates: int, questions: int) -> dict:
+    app = load_app(
+        TTS_PRESYNTHESIZE="False",
+        QUESTION_POOL_DEPTH=0,
+        LLM_CACHE_ENABLED="False",
+        DB_METRICS_ENABLED="False",
+        **PRESETS[name],
+    )
+    stub_external_calls(questions)
+    with open(make_sample(1.0), "rb") as f:
+        audio = f.read()
+
+    seeded = []
+    for i in range(candidates):
+        user_id, headers = seed_user(app, email=f"writer{i}@example.com")
+        seeded.append((headers, seed_round(app, user_id, questions)))
+
+    latencies, errors = [], {}
+    lock = threading.Lock()
+    barrier = threading.Barrier(candidates)
+
+    def candidate(job):
+        headers, question_ids = job
+        client = app.test_client()
+        barrier.wait()
+        for qid in question_ids:
+            start = time.perf_counter()
+            resp = client.post(
+                f"/api/round1/submit-answer/{qid}",
+                headers=headers,
+                data={"audio": (io.BytesIO(audio), "answer.wav")},
+                content_type="multipart/form-data",
+            )
+            elapsed = time.perf_counter() - start
+            with lock:
+                if resp.status_code == 200:
+                    latencies.append(elapsed)
+                else:
+                    body = resp.get_data(as_text=True)
+                    key = "locked" if "locked" in body else str(resp.status_code)
+                    errors[key] = errors.get(key, 0) + 1
+
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=candidates) as pool:
+        list(pool.map(candidate, seeded))
+    wall = time.perf_counter() - wall_start
+
+    return {
+        "preset": name,
+        "answers_per_s": len(latencies) / wall,
+        **summarize(latencies),
+        "errors": sum(errors.values()),
+        "error_kinds": errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--candidates", type=int, default=32)
+    parser.add_argument("--questions", type=int, default=5, help="answers submitted per candidate")
+    parser.add_argument("--preset", choices=PRESETS, help="run one preset in this process and print JSON")
+    args = parser.parse_args()
+
+    if args.preset:
+        print(json.dumps(run_preset(args.preset, args.candidates, args.questions)))
+        return
+
+    rows = []
+    for name in PRESETS:
+        out = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_concurrent_writers", "--preset", name,
+             "--candidates", str(args.candidates), "--questions", str(args.questions)],
+            capture_output=True, text=True, check=True,
+        )
+        rows.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    print_table(
+        f"{args.candidates} candidates x {args.questions} answers, one SQLite file",
+        rows,
+        ["preset", "answers_per_s", "p50_ms", "p99_ms", "errors"],
+    )
+    for row in rows:
+        if row["error_kinds"]:
+            print(f"  {row['preset']}: {row['error_kinds']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Overhead of the per-request DB instrumentation (``utils.db_metrics``).
+
+The app is loaded with ``DB_METRICS_ENABLED`` on. The benchmark first measures
+with the hooks installed, then calls ``uninstall`` and measures again. With
+nothing registered, the "off" numbers are the same as a run with the setting
+disabled. Two layers are timed:
+
+* statement: ``SELECT 1`` through the engine inside an app context, so the
+  cursor events plus fingerprinting and the histogram update, with no request;
+* request: an authenticated GET through the test client, with the request
+  hooks, Server-Timing header and log line included.
+
+    python -m benchmarks.bench_db_instrumentation --statements 20000 --requests 2000
+"""
+import argparse
+import logging
+import time
+
+from benchmarks._common import load_app, print_table, seed_user, summarize
+
+
+def time_statements(app, n: int):
+    from sqlalchemy import text
+    from config.db import db
+
+    latencies = []
+    with app.app_context():
+        with db.engine.connect() as conn:
+            select = text("SELECT 1")
+            for _ in range(n):
+                start = time.perf_counter()
+                conn.execute(select).scalar()
+                latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def time_requests(app, path: str, headers, n: int):
+    client = app.test_client()
+    latencies = []
+    for _ in range(n):
+        start = time.perf_counter()
+        resp = client.get(path, headers=headers)
+        latencies.append(time.perf_counter() - start)
+        assert resp.status_code == 200, resp.status_code
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--statements", type=int, default=20000)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--path", default="/api/auth/me")
+    parser.add_argument("--db-url", help="database URL (default: temp SQLite file)")
+    args = parser.parse_args()
+
+    # "db" verification so every request runs at least one statement
+    app = load_app(args.db_url, DB_METRICS_ENABLED="True", AUTH_VERIFY_MODE="db")
+    _, headers = seed_user(app)
+    # The per-request log line is part of the cost, but it should not flood the terminal
+    logging.getLogger("utils.db_metrics").addHandler(logging.NullHandler())
+    logging.getLogger("utils.db_metrics").propagate = False
+
+    from config.db import db
+    from utils import db_metrics
+
+    with app.app_context():
+        engine = db.engine
+
+    # Warm up connection pool, fingerprint cache and routing
+    time_statements(app, 200)
+    time_requests(app, args.path, headers, 50)
+
+    rows = []
+    results = {}
+    for mode in ("on", "off"):
+        if mode == "off":
+            db_metrics.uninstall(app, engine)
+        results[mode] = {
+            "statement": summarize(time_statements(app, args.statements)),
+            "request": summarize(time_requests(app, args.path, headers, args.requests)),
+        }
+        for layer, stats in results[mode].items():
+            rows.append({"layer": layer, "mode": mode, **stats})
+
+    print_table("DB instrumentation overhead", rows, ["layer", "mode", "n", "mean_ms", "p50_ms", "p99_ms"])
+    for layer in ("statement", "request"):
+        delta_us = (results["on"][layer]["mean_ms"] - results["off"][layer]["mean_ms"]) * 1000
+        print(f"  {layer}: +{delta_us:.1f} us mean per {layer} with hooks on")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Hot-path lookups on a large interview table, with and without the new indexes.
+
+Seeds ``--questions`` interview questions (1M by default; ``--per-round`` per
+round, one round per interview) into a throwaway SQLite database created from
+the models. Then it times the three lookups behind
+``ensure_or_create_interview``, ``start_round`` and ``get_next_unanswered``.
+
+"before" runs the same statements with SQLite's ``NOT INDEXED``. Before the
+migration these tables had only their rowid primary keys, so that is the plan
+they got. "after" lets the planner use the new indexes.
+
+    python -m benchmarks.bench_hot_path_indexes --questions 1000000 --lookups 200
+"""
+import argparse
+import random
+import sqlite3
+import time
+
+from benchmarks._common import load_app, print_table, summarize
+
+QUERIES = {
+    "interview_by_user": "SELECT * FROM interviews {hint} WHERE interviews.user_id = ? LIMIT 1",
+    "round_by_number": (
+        "SELECT * FROM interview_rounds {hint} "
+        "WHERE interview_rounds.interview_id = ? AND interview_rounds.round_number = 1 LIMIT 1"
+    ),
+    "next_unanswered": (
+        "SELECT * FROM interview_questions {hint} "
+        "WHERE interview_questions.round_id = ? AND interview_questions.answer_text IS NULL "
+        "ORDER BY interview_questions.id ASC LIMIT 1"
+    ),
+}
+
+
+def seed(path: str, questions: int, per_round: int) -> int:
+    """Insert interviews, rounds and questions; about half of each round is answered."""
+    rounds = max(1, questions // per_round)
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.executemany(
+            "INSERT INTO interviews (id, user_id, status) VALUES (?, ?, 'in_progress')",
+            ((i, i) for i in range(1, rounds + 1)),
+        )
+        conn.executemany(
+            "INSERT INTO interview_rounds (id, interview_id, round_number, status) VALUES (?, ?, 1, 'in_progress')",
+            ((i, i) for i in range(1, rounds + 1)),
+        )
+        rng = random.Random(7)
+
+        def rows():
+            for r in range(1, rounds + 1):
+                answered = rng.randint(0, per_round)
+                for k in range(per_round):
+                    yield r, f"Question {k} of round {r}", "answer" if k < answered else None
+
+        conn.executemany(
+            "INSERT INTO interview_questions (round_id, question_text, answer_text) VALUES (?, ?, ?)", rows()
+        )
+    conn.execute("ANALYZE")
+    conn.close()
+    return rounds
+
+
+def time_query(conn, sql: str, keys):
+    latencies = []
+    for key in keys:
+        start = time.perf_counter()
+        conn.execute(sql, (key,)).fetchall()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--questions", type=int, default=1_000_000)
+    parser.add_argument("--per-round", type=int, default=5)
+    parser.add_argument("--lookups", type=int, default=200, help="random keys per query and mode")
+    args = parser.parse_args()
+
+    app = load_app()
+    path = app.config["SQLALCHEMY_DATABASE_URI"].replace("sqlite:///", "", 1)
+    started = time.perf_counter()
+    rounds = seed(path, args.questions, args.per_round)
+    print(f"seeded {rounds * args.per_round} questions in {rounds} rounds ({time.perf_counter() - started:.1f}s)")
+
+    conn = sqlite3.connect(path)
+    keys = [random.randint(1, rounds) for _ in range(args.lookups)]
+    rows = []
+    for name, template in QUERIES.items():
+        for mode, hint in (("before", "NOT INDEXED"), ("after", "")):
+            sql = template.format(hint=hint)
+            plan = conn.execute("EXPLAIN QUERY PLAN " + sql, (1,)).fetchall()
+            rows.append({
+                "query": name,
+                "mode": mode,
+                **summarize(time_query(conn, sql, keys)),
+                "plan": plan[-1][-1],
+            })
+    conn.close()
+
+    print_table(
+        f"{args.questions} questions, {args.lookups} lookups per query",
+        rows,
+        ["query", "mode", "mean_ms", "p50_ms", "p99_ms"],
+    )
+    for row in rows:
+        print(f"  {row['query']:>18} {row['mode']:>6}: {row['plan']}")
+
+
+if __name__ == "__main__":
+    main()
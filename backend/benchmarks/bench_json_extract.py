@@ -0,0 +1,135 @@
+"""Micro-benchmark: the previous regex-based ``_parse_json_safely`` vs ``extract_json_object``.
+
+The corpus mixes well-formed evaluator/summary outputs, outputs wrapped in
+code fences or prose, and malformed ones: truncated, several objects, stray
+braces, and long unbalanced text. ``--cache`` adds the real completions
+stored in the LLM response cache.
+
+    python -m benchmarks.bench_json_extract --repeat 200
+    python -m benchmarks.bench_json_extract --cache instance/llm_cache.db
+"""
+import argparse
+import json
+import re
+import sqlite3
+import time
+
+from benchmarks._common import print_table
+from utils.json_stream import JSONObjectStream, extract_json_object
+
+EVAL = {
+    "score": 7,
+    "feedback": "Clear answer; mentions {context} managers and the \"with\" statement.",
+    "meets_requirement": True,
+    "improvements": ["Give a concrete example", "Mention error handling"],
+    "dimensions": {"technical": 7, "communication": 8, "relevance": 7},
+}
+SUMMARY = {
+    "overall_score": 72,
+    "pass": True,
+    "strengths": ["Python fundamentals", "API design"],
+    "gaps": ["Testing strategy"],
+    "recommendations": ["Practice system design questions"],
+}
+
+
+def build_corpus():
+    ok = json.dumps(EVAL)
+    summary = json.dumps(SUMMARY, indent=2)
+    long_feedback = json.dumps(dict(EVAL, feedback="detail " * 2000))
+    return {
+        "clean": [ok, summary, long_feedback],
+        "fenced": [f"```json\n{ok}\n```", f"```\n{summary}\n```"],
+        "prose": [f"Sure! Here is the evaluation:\n{ok}\nLet me know if you need more.",
+                  f"Note: braces like {{this}} are fine.\n{summary}"],
+        "malformed": [
+            ok[:-20],                                    # truncated (max tokens)
+            ok + "\n" + summary,                         # two objects
+            ok.replace('"score": 7', "'score': 7"),      # single quotes
+            "{" * 5000 + ok,                             # long unbalanced prefix
+            "The model refused to answer. " * 500,       # no JSON at all
+            ("{ not json } " * 2000) + ok,               # many stray blocks before the object
+        ],
+    }
+
+
+def legacy_parse(text):
+    """``InterviewUtils._parse_json_safely`` before the single-pass extractor."""
+    if not text:
+        return None
+    s = text.strip()
+    if s.startswith("```") and s.endswith("```"):
+        s = s[3:-3].strip()
+    s = re.sub(r"^```(?:json|JSON)?\s*\n", "", s)
+    s = re.sub(r"\n```\s*$", "", s).strip()
+    try:
+        return json.loads(s)
+    except Exception:
+        pass
+    try:
+        matches = list(re.finditer(r"\{[\s\S]*\}", s))
+        if matches:
+            return json.loads(s[matches[0].start():matches[-1].end()])
+    except Exception:
+        pass
+    try:
+        m = re.search(r"```(?:json|JSON)?\n([\s\S]*?)\n```", text)
+        if m:
+            return json.loads(m.group(1))
+    except Exception:
+        pass
+    return None
+
+
+def streamed_parse(text, chunk=8):
+    """``JSONObjectStream`` fed token-sized pieces, as on a streaming response."""
+    stream = JSONObjectStream()
+    for i in range(0, len(text), chunk):
+        objects = stream.feed(text[i:i + chunk])
+        if objects:
+            return objects[0]
+    return None
+
+
+def cached_outputs(path):
+    conn = sqlite3.connect(path)
+    try:
+        return [row[0] for row in conn.execute("SELECT content FROM llm_cache")]
+    finally:
+        conn.close()
+
+
+def measure(parser, texts, repeat):
+    parsed = sum(1 for t in texts if isinstance(parser(t), dict))
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for t in texts:
+            parser(t)
+    elapsed = time.perf_counter() - start
+    return parsed, elapsed / (repeat * len(texts)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=100)
+    parser.add_argument("--cache", help="LLM cache sqlite file whose stored completions join the corpus")
+    args = parser.parse_args()
+
+    corpus = build_corpus()
+    if args.cache:
+        corpus["cached"] = cached_outputs(args.cache)
+
+    parsers = {"legacy": legacy_parse, "single_pass": extract_json_object, "streamed": streamed_parse}
+    rows = []
+    for kind, texts in corpus.items():
+        if not texts:
+            continue
+        for name, fn in parsers.items():
+            parsed, mean_us = measure(fn, texts, args.repeat)
+            rows.append({"corpus": kind, "parser": name, "inputs": len(texts), "parsed": parsed, "mean_us": mean_us})
+
+    print_table(f"JSON extraction, {args.repeat} repeats", rows, ["corpus", "parser", "inputs", "parsed", "mean_us"])
+
+
+if __name__ == "__main__":
+    main()
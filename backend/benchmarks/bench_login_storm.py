@@ -0,0 +1,113 @@
+"""Latency of non-auth routes during a login storm, with inline vs process-pool hashing.
+
+``--web-workers`` slots model the gunicorn worker pool shared by both kinds of
+traffic. Login clients hammer /api/auth/login while background clients poll
+an ordinary authenticated route (default: get-interview-status). The report
+gives login throughput and the other route's p99 for each hashing mode.
+
+    python -m benchmarks.bench_login_storm --users 50 --login-clients 32 --seconds 10
+"""
+import argparse
+import threading
+import time
+
+from benchmarks._common import load_app, seed_user, summarize, print_table
+
+PASSWORD = "Bench-pass-1"
+
+
+def storm(app, emails, headers, args):
+    slots = threading.BoundedSemaphore(args.web_workers)
+    stop = threading.Event()
+    logins, other, errors = [], [], {"login": 0, "other": 0}
+    lock = threading.Lock()
+
+    def request(kind, fn):
+        with slots:
+            start = time.perf_counter()
+            resp = fn()
+            elapsed = time.perf_counter() - start
+        with lock:
+            (logins if kind == "login" else other).append(elapsed)
+            if resp.status_code != 200:
+                errors[kind] += 1
+
+    def login_client(i):
+        client = app.test_client()
+        n = 0
+        while not stop.is_set():
+            email = emails[(i + n) % len(emails)]
+            n += 1
+            request("login", lambda: client.post("/api/auth/login", json={"email": email, "password": PASSWORD}))
+
+    def other_client():
+        client = app.test_client()
+        while not stop.is_set():
+            request("other", lambda: client.get(args.path, headers=headers))
+            time.sleep(args.other_interval)
+
+    threads = [threading.Thread(target=login_client, args=(i,)) for i in range(args.login_clients)]
+    threads += [threading.Thread(target=other_client) for _ in range(args.other_clients)]
+    for t in threads:
+        t.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    return logins, other, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--login-clients", type=int, default=32)
+    parser.add_argument("--other-clients", type=int, default=4)
+    parser.add_argument("--other-interval", type=float, default=0.02, help="pause between non-auth requests")
+    parser.add_argument("--web-workers", type=int, default=8)
+    parser.add_argument("--hash-workers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--path", default="/api/round1/get-interview-status")
+    args = parser.parse_args()
+
+    app = load_app()
+
+    from config.settings import Settings
+    from utils import password_hasher
+
+    # Seed with inline hashing so setup cost is not part of the measurement
+    Settings.PASSWORD_HASH_WORKERS = 0
+    emails = [f"storm{i}@example.com" for i in range(args.users)]
+    _, headers = seed_user(app, email=emails[0])
+    for email in emails[1:]:
+        seed_user(app, email=email)
+
+    rows = []
+    for mode, workers in (("inline", 0), ("process_pool", args.hash_workers)):
+        password_hasher.shutdown()
+        Settings.PASSWORD_HASH_WORKERS = workers
+        if workers:
+            password_hasher.hash_password("warm-up")  # start the children before timing
+        logins, other, errors = storm(app, emails, headers, args)
+        login_stats = summarize(logins)
+        other_stats = summarize(other)
+        rows.append({
+            "mode": mode,
+            "logins_per_s": len(logins) / args.seconds,
+            "login_p99_ms": login_stats.get("p99_ms", 0.0),
+            "other_n": other_stats["n"],
+            "other_p50_ms": other_stats.get("p50_ms", 0.0),
+            "other_p99_ms": other_stats.get("p99_ms", 0.0),
+            "errors": errors["login"] + errors["other"],
+        })
+    password_hasher.shutdown()
+
+    print_table(
+        f"Login storm: {args.login_clients} login clients, {args.web_workers} web workers, "
+        f"{Settings.PASSWORD_HASH_METHOD}",
+        rows,
+        ["mode", "logins_per_s", "login_p99_ms", "other_n", "other_p50_ms", "other_p99_ms", "errors"],
+    )
+
+
+if __name__ == "__main__":
+    main()
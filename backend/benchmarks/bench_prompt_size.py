@@ -0,0 +1,88 @@
+"""Prompt-size report per LLM call site: raw resume/JD vs the compact candidate profile.
+
+    python -m benchmarks.bench_prompt_size --resume resume.txt --jd jd.txt --extract
+    python -m benchmarks.bench_prompt_size --resume resume.txt --jd jd.txt --profile profile.json
+
+``--extract`` calls the model once to build the profile (needs OPENAI_API_KEY).
+Token counts themselves are computed offline with tiktoken.
+"""
+import argparse
+import json
+import os
+from types import SimpleNamespace
+
+from benchmarks._common import print_table
+from benchmarks.bench_batch_eval import SAMPLE_QA, count_tokens
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--resume", required=True, help="resume text file (e.g. output of utils.resume_parser)")
+    parser.add_argument("--jd", required=True, help="job description text file")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--profile", help="profile JSON previously produced by ProfileExtractorChain")
+    group.add_argument("--extract", action="store_true", help="extract the profile with the live model")
+    args = parser.parse_args()
+
+    # The module-level ChatOpenAI clients only need a key to be constructed
+    os.environ.setdefault("OPENAI_API_KEY", "sk-offline-benchmark")
+
+    from langchain_core.messages import HumanMessage
+    from chains.generate_questions import QuestionGeneratorChain
+    from chains.profile_extractor import ProfileExtractorChain, render_profile
+    from utils.interview_shared import InterviewUtils
+
+    raw_resume = open(args.resume).read()
+    raw_jd = open(args.jd).read()
+    if args.extract:
+        profile = ProfileExtractorChain().extract_profile(raw_resume, raw_jd)
+        if not profile:
+            raise SystemExit("Profile extraction failed")
+    else:
+        with open(args.profile) as f:
+            profile = json.load(f)
+    compact_resume, compact_jd = render_profile(profile)
+
+    qgen_prompt = QuestionGeneratorChain().question_prompt
+    questions = [
+        SimpleNamespace(id=i + 1, question_text=q, answer_text=a) for i, (q, a) in enumerate(SAMPLE_QA)
+    ]
+    placeholder_eval = {"score": 7, "feedback": "Solid.", "criteria_met": True, "improvements": [], "dimensions": {}}
+
+    def call_sites(resume, jd):
+        qgen = qgen_prompt.format(
+            resume=resume, jd=jd, difficulty_level="easy", num_questions=5, randomizer="0"
+        )
+        q = questions[0]
+        return {
+            "generate_questions": count_tokens([HumanMessage(content=qgen)]),
+            "evaluate_answer": count_tokens(InterviewUtils._eval_messages(q.question_text, q.answer_text, resume, jd)),
+            "summarize_round": count_tokens(InterviewUtils._summary_messages([placeholder_eval] * 5, resume, jd)),
+            "evaluate_round_batch": count_tokens(InterviewUtils._batch_messages(questions, [], resume, jd)),
+        }
+
+    raw = call_sites(raw_resume, raw_jd)
+    compact = call_sites(compact_resume, compact_jd)
+    # Calls per 5-question round in the default per-answer flow
+    per_round = {"generate_questions": 1, "evaluate_answer": 5, "summarize_round": 1, "evaluate_round_batch": 0}
+
+    rows = []
+    for site in raw:
+        rows.append({
+            "call_site": site,
+            "raw_tokens": raw[site],
+            "profile_tokens": compact[site],
+            "saved_pct": 100.0 * (raw[site] - compact[site]) / max(1, raw[site]),
+        })
+    rows.append({
+        "call_site": "round_total",
+        "raw_tokens": sum(raw[s] * n for s, n in per_round.items()),
+        "profile_tokens": sum(compact[s] * n for s, n in per_round.items()),
+        "saved_pct": 100.0 * (1 - sum(compact[s] * n for s, n in per_round.items())
+                              / max(1, sum(raw[s] * n for s, n in per_round.items()))),
+    })
+    print_table("Prompt tokens per call", rows, ["call_site", "raw_tokens", "profile_tokens", "saved_pct"])
+
+
+if __name__ == "__main__":
+    main()
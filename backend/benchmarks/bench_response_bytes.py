@@ -0,0 +1,123 @@
+"""Response bytes per endpoint: full payloads vs ``?fields=`` defaults and compression.
+
+Seeds a user with a ``--resume-kb`` resume/JD and a finished round 1 summary,
+then fetches each endpoint four ways:
+
+* legacy: every field, uncompressed; the auth ``user`` object also gets the
+  resume and JD added back, as ``User.to_dict`` returned them before;
+* default: the slim default selection, uncompressed;
+* gzip / br: the default selection with that Accept-Encoding (br only when
+  the ``brotli`` package is installed).
+
+    python -m benchmarks.bench_response_bytes --resume-kb 20
+"""
+import argparse
+import gzip
+import json
+
+from benchmarks._common import load_app, print_table, seed_round, seed_user
+
+PASSWORD = "Bench-pass-1"
+
+
+def decoded_body(resp) -> bytes:
+    """Decoded body of a test-client response, whatever its Content-Encoding."""
+    encoding = resp.headers.get("Content-Encoding")
+    if encoding == "gzip":
+        return gzip.decompress(resp.data)
+    if encoding == "br":
+        from utils.compression import brotli
+
+        return brotli.decompress(resp.data)
+    return resp.data
+
+
+def seed_summary(app, user_id: int, topics: int) -> None:
+    from config.db import db
+    from models import InterviewRound
+
+    seed_round(app, user_id, 5)
+    with app.app_context():
+        round1 = InterviewRound.query.order_by(InterviewRound.id.desc()).first()
+        round1.status = "pass"
+        round1.result_json = {
+            "overall_score": 74,
+            "pass": True,
+            "strengths": [f"Explained topic {i} clearly with a concrete production example" for i in range(6)],
+            "gaps": [f"Missed edge cases around topic {i} and did not discuss trade-offs" for i in range(6)],
+            "recommendations": [f"Practice designing topic {i} end to end, then review failure modes" for i in range(6)],
+            "topic_breakdown": [{"topic": f"Topic {i}", "avg_score": 5 + i % 5} for i in range(topics)],
+        }
+        db.session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--resume-kb", type=int, default=20)
+    parser.add_argument("--topics", type=int, default=12, help="topic_breakdown entries in the summary")
+    args = parser.parse_args()
+
+    app = load_app(RESPONSE_COMPRESSION="True", COMPRESS_MIN_BYTES=1024, DB_METRICS_ENABLED="False")
+    blob = "Python backend engineer, Flask, SQL, distributed systems. " * (args.resume_kb * 1024 // 58)
+    user_id, headers = seed_user(app, resume=blob, jd=blob)
+    seed_summary(app, user_id, args.topics)
+
+    from utils.compression import brotli
+
+    client = app.test_client()
+    with app.app_context():
+        from models.user import User
+
+        email = User.query.get(user_id).email
+    state = {}
+
+    def login(query, extra):
+        resp = client.post("/api/auth/login" + query, json={"email": email, "password": PASSWORD}, headers=extra)
+        # Every login rotates the refresh token; keep the current one for /refresh
+        state["refresh"] = json.loads(decoded_body(resp))["refresh_token"]
+        return resp
+
+    def refresh(query, extra):
+        return client.post("/api/auth/refresh" + query, json={"refresh_token": state["refresh"]}, headers=extra)
+
+    def get(path):
+        return lambda query, extra: client.get(path + query, headers={**headers, **extra})
+
+    def legacy_user(payload):
+        payload = dict(payload)
+        payload["user"] = dict(payload["user"], resume_text=blob, job_description=blob)
+        return payload
+
+    login("", {"Accept-Encoding": "identity"})
+    endpoints = {
+        "POST /api/auth/login": (login, legacy_user),
+        "POST /api/auth/refresh": (refresh, legacy_user),
+        "GET /api/auth/me": (get("/api/auth/me"), legacy_user),
+        "GET /api/round1/summary": (get("/api/round1/summary"), None),
+        "GET /api/round1/get-interview-status": (get("/api/round1/get-interview-status"), None),
+    }
+    encodings = ["gzip"] + (["br"] if brotli is not None else [])
+
+    rows = []
+    for name, (call, to_legacy) in endpoints.items():
+        full = call("?fields=*", {"Accept-Encoding": "identity"})
+        sizes = {"legacy": len(full.data)}
+        if to_legacy is not None:
+            legacy = to_legacy(full.get_json())
+            sizes["legacy"] = len(json.dumps(legacy, separators=(",", ":")).encode("utf-8"))
+        sizes["default"] = len(call("", {"Accept-Encoding": "identity"}).data)
+        for encoding in encodings:
+            resp = call("", {"Accept-Encoding": encoding})
+            sizes[encoding] = len(resp.data)
+            assert resp.headers.get("Content-Encoding") in (encoding, None), resp.headers
+        rows.append({"endpoint": name, **sizes})
+
+    print_table(
+        f"Response bytes ({args.resume_kb} KB resume/JD, {args.topics} summary topics)",
+        rows,
+        ["endpoint", "legacy", "default"] + encodings,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Resume parsing: the previous parser vs streaming read, parallel pages and the hash cache.
+
+Builds a corpus of text-heavy PDFs (1 to 50 pages) and DOCX files, or uses
+``--corpus DIR`` with real files. Each file is parsed by:
+
+* legacy: ``stream.read()`` plus ``text += page.get_text()`` (PDF) or
+  docx2txt, as before;
+* sequential: ``parse_resume`` with ``RESUME_PARSE_WORKERS=0`` and no cache;
+* parallel: ``parse_resume`` with ``--workers`` page processes and no cache
+  (pages only go to the pool at ``RESUME_PARALLEL_MIN_PAGES`` and above);
+* cached: ``parse_resume`` with the cache warm, i.e. a re-upload or the same
+  CV from another account.
+
+The parallel numbers depend on free cores.
+
+    python -m benchmarks.bench_resume_parse --repeat 5 --workers 4
+"""
+import argparse
+import io
+import os
+import tempfile
+import time
+
+from benchmarks._common import print_table, summarize
+
+PAGES = (1, 2, 5, 10, 20, 35, 50)
+PARAGRAPH = (
+    "Senior backend engineer with eight years of experience building Python services, "
+    "REST APIs and data pipelines. Led the migration of a monolith to Flask microservices, "
+    "introduced PostgreSQL query tuning and CI checks, and mentored four engineers. "
+)
+
+
+class Upload:
+    """The parts of werkzeug's FileStorage that ``parse_resume`` uses."""
+
+    def __init__(self, filename: str, data: bytes):
+        self.filename = filename
+        self.stream = io.BytesIO(data)
+
+
+def make_pdf(pages: int) -> bytes:
+    import fitz
+
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_textbox(fitz.Rect(40, 40, 560, 800), f"Page {i + 1}\n" + PARAGRAPH * 14, fontsize=9)
+    return doc.tobytes()
+
+
+def make_docx(pages: int) -> bytes:
+    import docx
+
+    document = docx.Document()
+    for i in range(pages):
+        document.add_heading(f"Section {i + 1}", level=2)
+        for _ in range(6):
+            document.add_paragraph(PARAGRAPH * 2)
+    out = io.BytesIO()
+    document.save(out)
+    return out.getvalue()
+
+
+def build_corpus(directory=None):
+    if directory:
+        corpus = []
+        for name in sorted(os.listdir(directory)):
+            if name.lower().endswith((".pdf", ".docx")):
+                with open(os.path.join(directory, name), "rb") as f:
+                    corpus.append((name, f.read()))
+        return corpus
+    return [(f"cv_{n}p.pdf", make_pdf(n)) for n in PAGES] + [(f"cv_{n}p.docx", make_docx(n)) for n in (1, 5, 20)]
+
+
+def legacy_parse(upload):
+    import docx2txt
+    import fitz
+
+    if upload.filename.endswith(".pdf"):
+        doc = fitz.open(stream=upload.stream.read(), filetype="pdf")
+        text = ""
+        for page in doc:
+            text += page.get_text()
+        return text
+    return docx2txt.process(io.BytesIO(upload.stream.read()))
+
+
+def time_parser(fn, name, data, repeat):
+    latencies = []
+    for _ in range(repeat):
+        upload = Upload(name, data)
+        start = time.perf_counter()
+        fn(upload)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--min-pages", type=int, default=16)
+    parser.add_argument("--corpus", help="directory of real .pdf/.docx resumes")
+    args = parser.parse_args()
+
+    fd, cache_path = tempfile.mkstemp(suffix=".db", prefix="bench_resume_")
+    os.close(fd)
+    os.environ["RESUME_CACHE_PATH"] = cache_path
+
+    from config.settings import Settings
+    from utils.resume_parser import _get_pool, parse_resume
+
+    Settings.RESUME_PARALLEL_MIN_PAGES = args.min_pages
+    corpus = build_corpus(args.corpus)
+
+    def configured(workers, cache):
+        def run(upload):
+            Settings.RESUME_PARSE_WORKERS = workers
+            Settings.RESUME_CACHE_ENABLED = str(cache)
+            return parse_resume(upload)["text"]
+        return run
+
+    if args.workers > 1:
+        Settings.RESUME_PARSE_WORKERS = args.workers
+        _get_pool().submit(len, b"").result()  # start the worker processes outside the timings
+
+    parsers = {
+        "legacy": legacy_parse,
+        "sequential": configured(0, False),
+        "parallel": configured(args.workers, False),
+        "cached": configured(0, True),
+    }
+    rows = []
+    for name, data in corpus:
+        reference = legacy_parse(Upload(name, data))
+        parse_resume(Upload(name, data))  # fill the cache for "cached"
+        for mode, fn in parsers.items():
+            assert fn(Upload(name, data)) == reference, (name, mode)
+            stats = summarize(time_parser(fn, name, data, args.repeat))
+            rows.append({"file": name, "kb": len(data) // 1024, "mode": mode, **stats})
+
+    print_table(
+        f"Resume parsing, {args.repeat} repeats, {args.workers} page workers from {args.min_pages} pages",
+        rows,
+        ["file", "kb", "mode", "mean_ms", "p50_ms", "p99_ms"],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Transcriptions/sec and resident memory: in-process Whisper vs the STT sidecar.
+
+In-process mode models N web workers with N processes, each with its own
+model (that is what gunicorn does today). Sidecar mode runs N submitter
+threads against one ``tools.stt_sidecar`` process that holds a single model.
+
+    python -m benchmarks.bench_stt_backends --audio sample.webm --concurrency 1 4 16
+"""
+import argparse
+import multiprocessing as mp
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks._common import make_sample, print_table
+
+
+def rss_of(pid: int) -> int:
+    with open(f"/proc/{pid}/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def _inprocess_worker(args):
+    audio, count = args
+    from tools.whisper_stt import model_manager
+
+    model_manager.warmup()
+    for _ in range(count):
+        model_manager.transcribe(audio)
+    return rss_of(os.getpid())
+
+
+def bench_inprocess(audio: str, concurrency: int, per_submitter: int):
+    ctx = mp.get_context("spawn")
+    start = time.perf_counter()
+    with ctx.Pool(concurrency) as pool:
+        rss = pool.map(_inprocess_worker, [(audio, per_submitter)] * concurrency)
+    elapsed = time.perf_counter() - start
+    # Includes model load time in every worker, as a cold gunicorn fleet would pay it
+    return {
+        "mode": "inprocess",
+        "concurrency": concurrency,
+        "tx_per_s": concurrency * per_submitter / elapsed,
+        "rss_mb": sum(rss) / 1e6,
+    }
+
+
+def bench_sidecar(audio: str, concurrency: int, per_submitter: int, url: str):
+    from tools.stt_sidecar import SidecarSTTClient
+
+    client = SidecarSTTClient(url, timeout=600)
+    with open(audio, "rb") as f:
+        data = f.read()
+
+    def submitter(_):
+        for _ in range(per_submitter):
+            client.transcribe_bytes(data)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(submitter, range(concurrency)))
+    elapsed = time.perf_counter() - start
+    code, health = client.health()
+    return {
+        "mode": "sidecar",
+        "concurrency": concurrency,
+        "tx_per_s": concurrency * per_submitter / elapsed,
+        "rss_mb": (health.get("rss_bytes") or 0) / 1e6,
+    }
+
+
+def start_sidecar(url: str) -> subprocess.Popen:
+    from tools.stt_sidecar import SidecarSTTClient, SidecarError
+
+    env = dict(os.environ, STT_SIDECAR_URL=url)
+    proc = subprocess.Popen([sys.executable, "-m", "tools.stt_sidecar"], env=env)
+    client = SidecarSTTClient(url, timeout=5)
+    for _ in range(600):
+        try:
+            if client.health()[0] == 200:
+                return proc
+        except SidecarError:
+            pass
+        time.sleep(0.5)
+    proc.terminate()
+    raise RuntimeError("STT sidecar did not become ready")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--audio", help="audio file to transcribe (default: generated 8 s tone)")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--per-submitter", type=int, default=4)
+    parser.add_argument("--url", default="http://127.0.0.1:8799")
+    args = parser.parse_args()
+
+    audio = args.audio or make_sample()
+    rows = []
+    for c in args.concurrency:
+        rows.append(bench_inprocess(audio, c, args.per_submitter))
+
+    proc = start_sidecar(args.url)
+    try:
+        for c in args.concurrency:
+            rows.append(bench_sidecar(audio, c, args.per_submitter, args.url))
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    print_table("STT backends", rows, ["mode", "concurrency", "tx_per_s", "rss_mb"])
+
+
+if __name__ == "__main__":
+    main()
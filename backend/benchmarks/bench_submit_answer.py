@@ -0,0 +1,120 @@
+"""Request throughput of submit-answer in sync vs async (job) mode.
+
+STT and LLM calls are replaced with sleeps of a configurable length so the
+numbers reflect how long a web worker is held, not OpenAI/Whisper speed.
+A semaphore of ``--web-workers`` slots models a gunicorn worker pool.
+
+    python -m benchmarks.bench_submit_answer --requests 200 --web-workers 8
+"""
+import argparse
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks._common import load_app, make_sample, seed_user, seed_round, summarize, print_table
+
+
+def patch_latency(stt_s: float, eval_s: float, summary_s: float) -> None:
+    from utils.interview_shared import InterviewUtils
+
+    def fake_stt(audio_path):
+        time.sleep(stt_s)
+        return "simulated transcript"
+
+    def fake_eval(question, answer, resume, jd):
+        time.sleep(eval_s)
+        return {"score": 7, "feedback": "ok", "criteria_met": True, "improvements": [], "dimensions": {}}
+
+    def fake_summary(round_obj, user, use_cache=True, content=None):
+        time.sleep(summary_s)
+        return {"overall_score": 70, "pass": True}
+
+    InterviewUtils.speech_to_text = staticmethod(fake_stt)
+    InterviewUtils.evaluate_answer = staticmethod(fake_eval)
+    InterviewUtils.summarize_round = staticmethod(fake_summary)
+
+
+def run(app, headers, question_ids, mode: str, web_workers: int, clients: int, audio: bytes):
+    slots = threading.BoundedSemaphore(web_workers)
+    latencies = []
+    job_ids = []
+    lock = threading.Lock()
+
+    def one(qid):
+        with slots:
+            client = app.test_client()
+            start = time.perf_counter()
+            resp = client.post(
+                f"/api/round1/submit-answer/{qid}?mode={mode}",
+                data={"audio": (io.BytesIO(audio), "answer.wav")},
+                headers=headers,
+                content_type="multipart/form-data",
+            )
+            elapsed = time.perf_counter() - start
+        with lock:
+            latencies.append(elapsed)
+            if resp.status_code == 202:
+                job_ids.append(resp.get_json()["job_id"])
+
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        list(pool.map(one, question_ids))
+    http_wall = time.perf_counter() - wall_start
+
+    # In async mode also measure when the last evaluation actually finished
+    if job_ids:
+        from utils.job_queue import get_job_queue
+
+        queue = get_job_queue()
+        for jid in job_ids:
+            queue.get(jid, wait=600)
+    done_wall = time.perf_counter() - wall_start
+
+    stats = summarize(latencies)
+    return {
+        "mode": mode,
+        "req_per_s": len(question_ids) / http_wall,
+        "p50_ms": stats["p50_ms"],
+        "p99_ms": stats["p99_ms"],
+        "all_done_s": done_wall,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--web-workers", type=int, default=8)
+    parser.add_argument("--job-workers", type=int, default=8)
+    parser.add_argument("--stt-ms", type=float, default=300)
+    parser.add_argument("--eval-ms", type=float, default=1200)
+    parser.add_argument("--summary-ms", type=float, default=1500)
+    args = parser.parse_args()
+
+    app = load_app(
+        ROUND1_JOB_WORKERS=args.job_workers,
+        ROUND1_JOB_MAX_PENDING=args.requests * 2,
+        QUESTION_POOL_DEPTH=0,
+    )
+    patch_latency(args.stt_ms / 1000, args.eval_ms / 1000, args.summary_ms / 1000)
+
+    with open(make_sample(seconds=2.0), "rb") as f:
+        audio = f.read()
+
+    rows = []
+    for i, mode in enumerate(("sync", "async")):
+        user_id, headers = seed_user(app, email=f"bench{i}@example.com")
+        qids = seed_round(app, user_id, args.requests)
+        rows.append(run(app, headers, qids, mode, args.web_workers, args.clients, audio))
+
+    print_table(
+        f"submit-answer, {args.requests} requests, {args.web_workers} web workers, "
+        f"{args.job_workers} job workers",
+        rows,
+        ["mode", "req_per_s", "p50_ms", "p99_ms", "all_done_s"],
+    )
+
+
+if __name__ == "__main__":
+    main()
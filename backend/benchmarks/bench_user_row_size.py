@@ -0,0 +1,124 @@
+"""users row width and the auth lookup, with resume/JD inline vs in candidate_documents.
+
+Builds two SQLite files with ``--users`` users, each with a ``--resume-kb``
+resume and JD and a small profile:
+
+* inline: the previous layout, with the blobs as columns on ``users``;
+* split: ``users`` without them, plus ``candidate_documents``.
+
+It reports the average stored row size and file size, then times the
+statement ``User.find_by_id`` runs on every authenticated request in
+``AUTH_VERIFY_MODE=db`` (all mapped columns of one user by primary key).
+The row size is estimated as the sum of the stored column lengths, which is
+also about what each lookup copies into Python.
+
+    python -m benchmarks.bench_user_row_size --users 20000 --resume-kb 20
+"""
+import argparse
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from benchmarks._common import print_table, summarize
+
+BASE_COLUMNS = "id, name, email, password, refresh_token, token_version, created_at, updated_at"
+LAYOUTS = {
+    "inline": {
+        "schema": [
+            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, email TEXT UNIQUE, password TEXT, "
+            "refresh_token TEXT, token_version INTEGER, resume_text TEXT, job_description TEXT, "
+            "candidate_profile JSON, created_at TEXT, updated_at TEXT)",
+        ],
+        "lookup": f"SELECT {BASE_COLUMNS}, resume_text, job_description, candidate_profile FROM users WHERE id = ?",
+        "row": "SELECT AVG(8 + LENGTH(name) + LENGTH(email) + LENGTH(password) + LENGTH(created_at) "
+               "+ LENGTH(updated_at) + LENGTH(resume_text) + LENGTH(job_description) "
+               "+ LENGTH(candidate_profile)) FROM users",
+    },
+    "split": {
+        "schema": [
+            "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, email TEXT UNIQUE, password TEXT, "
+            "refresh_token TEXT, token_version INTEGER, created_at TEXT, updated_at TEXT)",
+            "CREATE TABLE candidate_documents (user_id INTEGER PRIMARY KEY REFERENCES users (id), "
+            "resume_text TEXT, job_description TEXT, candidate_profile JSON, created_at TEXT, updated_at TEXT)",
+        ],
+        "lookup": f"SELECT {BASE_COLUMNS} FROM users WHERE id = ?",
+        "row": "SELECT AVG(8 + LENGTH(name) + LENGTH(email) + LENGTH(password) + LENGTH(created_at) "
+               "+ LENGTH(updated_at)) FROM users",
+    },
+}
+
+
+def build(layout: str, users: int, blob_kb: int) -> str:
+    fd, path = tempfile.mkstemp(suffix=".db", prefix=f"bench_users_{layout}_")
+    os.close(fd)
+    conn = sqlite3.connect(path)
+    for ddl in LAYOUTS[layout]["schema"]:
+        conn.execute(ddl)
+    rng = random.Random(3)
+    now = "2026-10-18 12:00:00.000000"
+    password = "scrypt:32768:8:1$" + "x" * 100
+    profile = json.dumps({"skills": ["python", "flask", "sql"], "years": 6, "roles": ["backend engineer"]})
+
+    def blob():
+        return "".join(rng.choice("abcdefghij ") for _ in range(64)) * (blob_kb * 16)
+
+    with conn:
+        for i in range(1, users + 1):
+            resume, jd = blob(), blob()
+            if layout == "inline":
+                conn.execute(
+                    "INSERT INTO users VALUES (?, ?, ?, ?, NULL, 0, ?, ?, ?, ?, ?)",
+                    (i, f"User {i}", f"user{i}@example.com", password, resume, jd, profile, now, now),
+                )
+            else:
+                conn.execute(
+                    "INSERT INTO users VALUES (?, ?, ?, ?, NULL, 0, ?, ?)",
+                    (i, f"User {i}", f"user{i}@example.com", password, now, now),
+                )
+                conn.execute(
+                    "INSERT INTO candidate_documents VALUES (?, ?, ?, ?, ?, ?)", (i, resume, jd, profile, now, now)
+                )
+    conn.close()
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=20000)
+    parser.add_argument("--resume-kb", type=int, default=20, help="size of each resume and JD")
+    parser.add_argument("--lookups", type=int, default=5000)
+    args = parser.parse_args()
+
+    keys = [random.randint(1, args.users) for _ in range(args.lookups)]
+    rows = []
+    for layout, spec in LAYOUTS.items():
+        path = build(layout, args.users, args.resume_kb)
+        conn = sqlite3.connect(path)
+        # Cold-ish pages: a small cache makes the lookup read what the row spans
+        conn.execute("PRAGMA cache_size=-2000")
+        latencies = []
+        for key in keys:
+            start = time.perf_counter()
+            conn.execute(spec["lookup"], (key,)).fetchone()
+            latencies.append(time.perf_counter() - start)
+        rows.append({
+            "layout": layout,
+            "users_row_b": float(conn.execute(spec["row"]).fetchone()[0]),
+            "file_mb": os.path.getsize(path) / (1024 * 1024),
+            **summarize(latencies),
+        })
+        conn.close()
+        os.remove(path)
+
+    print_table(
+        f"{args.users} users, {args.resume_kb} KB resume + JD, {args.lookups} lookups by id",
+        rows,
+        ["layout", "users_row_b", "file_mb", "mean_ms", "p50_ms", "p99_ms"],
+    )
+
+
+if __name__ == "__main__":
+    main()
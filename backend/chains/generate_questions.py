@@ -1,7 +1,9 @@
 from langchain_openai import ChatOpenAI
 from langchain.prompts import PromptTemplate
 from dotenv import load_dotenv
-import json
+from config.settings import Settings, get_bool
+from utils.json_stream import JSONArrayItemStream, extract_json_object
+from utils.llm_metrics import ainvoke_instrumented, invoke_instrumented, stream_instrumented
 import os
 
 load_dotenv()
@@ -60,26 +62,60 @@ Return the questions in valid JSON format ONLY:
 """
         )
         
-        # Create the chain
-        self.chain = self.question_prompt | self.llm
+        # Create the chain; JSON mode makes the provider guarantee a parseable object
+        llm = self.llm
+        if get_bool(Settings.LLM_JSON_MODE):
+            llm = llm.bind(response_format={"type": "json_object"})
+        self.chain = self.question_prompt | llm
 
-    def generate_questions(self, resume, jd, difficulty_level, num_questions, randomizer):
-        response = self.chain.invoke({
+    def _inputs(self, resume, jd, difficulty_level, num_questions, randomizer):
+        return {
             "resume": resume,
             "jd": jd,
             "difficulty_level": difficulty_level,
             "num_questions": num_questions,
             "randomizer": randomizer
-        })
+        }
 
+    @staticmethod
+    def _parse_response(response):
         content = response.content if hasattr(response, 'content') else str(response)
-        
-        try:
-            # Try to parse it as JSON if LLM returns a stringified JSON
-            return json.loads(content.strip())
-        except json.JSONDecodeError as e:
-            # Fallback: return plain text as-is
-            return {"questions": content.strip(), "error": f"JSON parsing failed: {str(e)}"}
-        except Exception as e:
-            # General fallback
-            return {"questions": content.strip(), "error": f"Unexpected error: {str(e)}"}
+
+        # First JSON object in the output, even if fenced or wrapped in prose
+        parsed = extract_json_object(content, ("questions",))
+        if parsed is not None:
+            return parsed
+        # Fallback: return plain text as-is
+        return {"questions": content.strip(), "error": "JSON parsing failed: no JSON object in output"}
+
+    def generate_questions(self, resume, jd, difficulty_level, num_questions, randomizer):
+        response = invoke_instrumented(
+            self.chain, self._inputs(resume, jd, difficulty_level, num_questions, randomizer), "generate_questions"
+        )
+        return self._parse_response(response)
+
+    async def agenerate_questions(self, resume, jd, difficulty_level, num_questions, randomizer):
+        response = await ainvoke_instrumented(
+            self.chain, self._inputs(resume, jd, difficulty_level, num_questions, randomizer), "generate_questions"
+        )
+        return self._parse_response(response)
+
+    def stream_questions(self, resume, jd, difficulty_level, num_questions, randomizer):
+        """Yield question objects one by one as each element of ``"questions"`` completes.
+
+        If nothing could be parsed from the stream, the full response goes
+        through ``_parse_response`` and its questions (or error dict) are yielded.
+        """
+        items = JSONArrayItemStream("questions")
+        parts = []
+        emitted = 0
+        for chunk in stream_instrumented(
+            self.chain, self._inputs(resume, jd, difficulty_level, num_questions, randomizer), "generate_questions"
+        ):
+            text = chunk.content or ""
+            parts.append(text)
+            for item in items.feed(text):
+                emitted += 1
+                yield item
+        if not emitted:
+            yield self._parse_response("".join(parts))
@@ -0,0 +1,119 @@
+from langchain_openai import ChatOpenAI
+from langchain.prompts import PromptTemplate
+from dotenv import load_dotenv
+from utils.llm_metrics import invoke_instrumented
+import json
+import os
+
+load_dotenv()
+
+# Bump when the extraction prompt or rendered layout changes
+PROFILE_VERSION = "1"
+
+
+class ProfileExtractorChain:
+    """Condenses a resume + job description into a compact structured profile.
+
+    Runs once at upload time. The profile is rendered in place of the raw
+    resume/JD in every later prompt (question generation, evaluation, summary).
+    """
+
+    def __init__(self):
+        self.llm = ChatOpenAI(
+            model="gpt-3.5-turbo",
+            temperature=0,
+            openai_api_key=os.getenv('OPENAI_API_KEY')
+        )
+
+        self.profile_prompt = PromptTemplate(
+            input_variables=["resume", "jd"],
+            template="""
+You extract facts for an interviewer. Be terse: short noun phrases, no sentences,
+no information that is not in the text.
+
+**Resume:**
+{resume}
+
+**Job Description:**
+{jd}
+
+Return valid JSON ONLY:
+{{
+    "candidate": {{
+        "headline": "current title / focus",
+        "years_experience": number,
+        "skills": ["skill", "..."],
+        "roles": [{{"title": "", "company": "", "years": number}}],
+        "education": ["degree, institution"],
+        "key_projects": [{{"name": "", "summary": "one line", "tech": ["..."]}}]
+    }},
+    "job": {{
+        "title": "",
+        "requirements": ["..."],
+        "nice_to_have": ["..."],
+        "responsibilities": ["..."]
+    }}
+}}
+"""
+        )
+
+        self.chain = self.profile_prompt | self.llm
+
+    def extract_profile(self, resume, jd):
+        response = invoke_instrumented(self.chain, {"resume": resume, "jd": jd}, "extract_profile")
+        content = response.content if hasattr(response, 'content') else str(response)
+        content = content.strip()
+        if content.startswith("```"):
+            content = content.strip("`")
+            if content.lower().startswith("json"):
+                content = content[4:]
+        try:
+            profile = json.loads(content)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(profile, dict) or "candidate" not in profile:
+            return None
+        profile["version"] = PROFILE_VERSION
+        return profile
+
+
+def _join(items):
+    return ", ".join(str(i) for i in items if i) if isinstance(items, list) else str(items or "")
+
+
+def render_profile(profile):
+    """Render a stored profile as compact ``(resume, jd)`` prompt text."""
+    cand = profile.get("candidate") or {}
+    job = profile.get("job") or {}
+
+    lines = []
+    if cand.get("headline"):
+        lines.append(f"Headline: {cand['headline']}")
+    if cand.get("years_experience") is not None:
+        lines.append(f"Years of experience: {cand['years_experience']}")
+    if cand.get("skills"):
+        lines.append(f"Skills: {_join(cand['skills'])}")
+    roles = [
+        f"{r.get('title', '')} @ {r.get('company', '')} ({r.get('years', '?')}y)"
+        for r in cand.get("roles") or [] if isinstance(r, dict)
+    ]
+    if roles:
+        lines.append(f"Roles: {'; '.join(roles)}")
+    if cand.get("education"):
+        lines.append(f"Education: {_join(cand['education'])}")
+    projects = [
+        f"{p.get('name', '')}: {p.get('summary', '')} [{_join(p.get('tech') or [])}]"
+        for p in cand.get("key_projects") or [] if isinstance(p, dict)
+    ]
+    if projects:
+        lines.append("Key projects: " + "; ".join(projects))
+
+    jd_lines = []
+    if job.get("title"):
+        jd_lines.append(f"Title: {job['title']}")
+    for label, key in (("Requirements", "requirements"), ("Nice to have", "nice_to_have"),
+                       ("Responsibilities", "responsibilities")):
+        if job.get(key):
+            jd_lines.append(f"{label}: {_join(job[key])}")
+
+    return "\n".join(lines), "\n".join(jd_lines)
@@ -1,9 +1,73 @@
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+from config.settings import Settings, get_bool
 
 db = SQLAlchemy()
 migrate = Migrate()
 
+
+def engine_options(url: str) -> dict:
+    """SQLALCHEMY_ENGINE_OPTIONS for ``url``: busy timeout on SQLite, pool sizing elsewhere."""
+    if not url:
+        return {}
+    if make_url(url).get_backend_name() == "sqlite":
+        # pysqlite's timeout is SQLite's busy handler: wait for the write lock instead of
+        # failing at once with "database is locked"
+        return {"connect_args": {"timeout": Settings.DB_SQLITE_BUSY_TIMEOUT_MS / 1000.0}}
+    return {
+        "pool_size": Settings.DB_POOL_SIZE,
+        "max_overflow": Settings.DB_MAX_OVERFLOW,
+        "pool_timeout": Settings.DB_POOL_TIMEOUT,
+        "pool_recycle": Settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": get_bool(Settings.DB_POOL_PRE_PING),
+    }
+
+
+def _set_sqlite_pragmas(dbapi_conn, connection_record):
+    cursor = dbapi_conn.cursor()
+    try:
+        if Settings.DB_SQLITE_JOURNAL_MODE:
+            cursor.execute(f"PRAGMA journal_mode={Settings.DB_SQLITE_JOURNAL_MODE}")
+        if Settings.DB_SQLITE_SYNCHRONOUS:
+            cursor.execute(f"PRAGMA synchronous={Settings.DB_SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA busy_timeout={int(Settings.DB_SQLITE_BUSY_TIMEOUT_MS)}")
+    finally:
+        cursor.close()
+    if Settings.DB_SQLITE_BEGIN.lower() == "immediate":
+        # Let SQLAlchemy emit BEGIN itself (see _begin_immediate)
+        dbapi_conn.isolation_level = None
+
+
+def _begin_immediate(conn):
+    # Take the write lock when the transaction starts. A deferred transaction that reads
+    # and then writes can fail at once with SQLITE_BUSY when another writer committed in
+    # between; the busy timeout does not help there
+    conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+def _configure_sqlite(engine) -> None:
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    if Settings.DB_SQLITE_BEGIN.lower() == "immediate":
+        event.listen(engine, "begin", _begin_immediate)
+
+
 def init_app(app):
+    app.config.setdefault(
+        "SQLALCHEMY_ENGINE_OPTIONS", engine_options(app.config.get("SQLALCHEMY_DATABASE_URI"))
+    )
     db.init_app(app)
     migrate.init_app(app, db)
+
+    with app.app_context():
+        if db.engine.dialect.name == "sqlite":
+            _configure_sqlite(db.engine)
+
+    # Engine hooks are only registered when enabled, so the disabled path costs nothing
+    if get_bool(Settings.DB_METRICS_ENABLED):
+        from utils import db_metrics
+
+        with app.app_context():
+            db_metrics.install(app, db.engine)
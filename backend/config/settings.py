@@ -2,11 +2,154 @@ import os
 from dotenv import load_dotenv
 load_dotenv()
 
+
+def get_bool(value) -> bool:
+    """Read a flag setting or request value: "1", "true", "yes" or "on", any case."""
+    return str(value).lower() in {"1", "true", "yes", "on"}
+
+
 class Settings:
     SECRET_KEY = os.getenv("JWT_SECRET")
     SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL")
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Engine options (applied in config/db.init_app unless SQLALCHEMY_ENGINE_OPTIONS is set).
+    # SQLite: pragmas run on every new connection
+    DB_SQLITE_JOURNAL_MODE = os.getenv("DB_SQLITE_JOURNAL_MODE", "WAL")     # "" keeps the file's mode
+    DB_SQLITE_SYNCHRONOUS = os.getenv("DB_SQLITE_SYNCHRONOUS", "NORMAL")   # safe with WAL; "FULL" for power-loss durability
+    DB_SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("DB_SQLITE_BUSY_TIMEOUT_MS", 10000))
+    DB_SQLITE_BEGIN = os.getenv("DB_SQLITE_BEGIN", "deferred")  # "immediate" takes the write lock at BEGIN
+    # Server databases (Postgres, MySQL)
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 20))
+    DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))  # seconds to wait for a free connection
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))   # seconds; below server/proxy idle timeouts
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "True")
     JWT_ACCESS_TOKEN_EXPIRES = int(os.getenv("JWT_ACCESS_EXPIRES", 900))         # 15 min
     JWT_REFRESH_TOKEN_EXPIRES = int(os.getenv("JWT_REFRESH_EXPIRES", 604800))   # 7 days
     COOKIE_SECURE = os.getenv("COOKIE_SECURE", "False")  # Must be False for local dev
     COOKIE_SAMESITE = os.getenv("COOKIE_SAMESITE", "Lax")  # Lax works well locally
+
+    # Round 1 answer processing: "sync" transcribes + evaluates inside the request,
+    # "async" queues the work and returns a job id (clients can override with ?mode=)
+    ROUND1_SUBMIT_MODE = os.getenv("ROUND1_SUBMIT_MODE", "sync")
+    ROUND1_JOB_WORKERS = int(os.getenv("ROUND1_JOB_WORKERS", 4))
+    ROUND1_JOB_MAX_PENDING = int(os.getenv("ROUND1_JOB_MAX_PENDING", 100))
+    ROUND1_JOB_TTL = int(os.getenv("ROUND1_JOB_TTL", 3600))           # keep finished jobs 1 hour
+    ROUND1_JOB_MAX_WAIT = float(os.getenv("ROUND1_JOB_MAX_WAIT", 25))  # long-poll cap in seconds
+    # Job state is shared through this SQLite file so any web worker can answer GET /jobs/<id>
+    ROUND1_JOB_STORE_PATH = os.getenv("ROUND1_JOB_STORE_PATH", os.path.join("instance", "round1_jobs.db"))
+    ROUND1_JOB_MAX_ENTRIES = int(os.getenv("ROUND1_JOB_MAX_ENTRIES", 10000))
+
+    # Text-to-speech audio cache (content-addressed, LRU-evicted past the byte budget)
+    TTS_CACHE_DIR = os.getenv("TTS_CACHE_DIR", os.path.join("static", "audio"))
+    TTS_CACHE_URL_PREFIX = os.getenv("TTS_CACHE_URL_PREFIX", "/static/audio")
+    TTS_CACHE_MAX_BYTES = int(os.getenv("TTS_CACHE_MAX_BYTES", 200 * 1024 * 1024))  # 200 MB
+    TTS_LANG = os.getenv("TTS_LANG", "en")
+    TTS_TLD = os.getenv("TTS_TLD", "com")  # gTTS accent, e.g. "co.uk"
+    TTS_PRESYNTHESIZE = os.getenv("TTS_PRESYNTHESIZE", "True")  # synthesize all questions at round start
+    TTS_PRESYNTH_WORKERS = int(os.getenv("TTS_PRESYNTH_WORKERS", 5))
+
+    # Whisper speech-to-text (loaded lazily on first transcription or warmup)
+    WHISPER_MODEL = os.getenv("WHISPER_MODEL", "base")
+    WHISPER_DEVICE = os.getenv("WHISPER_DEVICE", "")       # "" = auto, "cpu", "cuda"
+    WHISPER_THREADS = int(os.getenv("WHISPER_THREADS", 0))  # 0 = torch default
+    WHISPER_FP16 = os.getenv("WHISPER_FP16", "False")     # only useful on GPU
+    WHISPER_DOWNLOAD_ROOT = os.getenv("WHISPER_DOWNLOAD_ROOT", "")
+    WHISPER_WARMUP_ON_START = os.getenv("WHISPER_WARMUP_ON_START", "False")
+
+    # "inprocess" loads Whisper in every web worker; "sidecar" sends audio to `python -m tools.stt_sidecar`
+    STT_BACKEND = os.getenv("STT_BACKEND", "inprocess")
+    STT_SIDECAR_URL = os.getenv("STT_SIDECAR_URL", "http://127.0.0.1:8765")  # or unix:///path/to.sock
+    STT_SIDECAR_WORKERS = int(os.getenv("STT_SIDECAR_WORKERS", 1))          # batch threads; inference itself is serialized
+    STT_SIDECAR_MAX_BATCH = int(os.getenv("STT_SIDECAR_MAX_BATCH", 8))
+    STT_SIDECAR_BATCH_WAIT_MS = float(os.getenv("STT_SIDECAR_BATCH_WAIT_MS", 20))
+    STT_SIDECAR_QUEUE_SIZE = int(os.getenv("STT_SIDECAR_QUEUE_SIZE", 64))
+    STT_SIDECAR_TIMEOUT = float(os.getenv("STT_SIDECAR_TIMEOUT", 120))
+
+    # Chunked answer upload (POST /api/round1/answer-chunk/<id>)
+    ANSWER_STREAM_DIR = os.getenv("ANSWER_STREAM_DIR", os.path.join("static", "uploads", "streams"))
+    ANSWER_STREAM_SEGMENT_SECONDS = float(os.getenv("ANSWER_STREAM_SEGMENT_SECONDS", 8))
+    ANSWER_STREAM_MAX_BYTES = int(os.getenv("ANSWER_STREAM_MAX_BYTES", 25 * 1024 * 1024))
+    ANSWER_STREAM_TTL = int(os.getenv("ANSWER_STREAM_TTL", 3600))  # drop abandoned streams after 1 hour
+
+    # Answer uploads are piped straight into ffmpeg and decoded to 16 kHz float32 in memory
+    ROUND1_MAX_UPLOAD_BYTES = int(os.getenv("ROUND1_MAX_UPLOAD_BYTES", 25 * 1024 * 1024))  # 25 MB
+
+    # Persistent cache of evaluate_answer / summarize_round completions
+    LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "True")
+    LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", os.path.join("instance", "llm_cache.db"))
+    LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", 7 * 24 * 3600))   # 7 days
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", 50000))
+
+    # Ask the provider for a guaranteed JSON object (response_format=json_object) on the
+    # evaluation, summary and question generation calls
+    LLM_JSON_MODE = os.getenv("LLM_JSON_MODE", "True")
+
+    # Resume uploads: size cap (enforced while reading), PDF pages split over worker
+    # processes for long documents (0/1 = in-process), extracted text cached by file hash
+    RESUME_MAX_BYTES = int(os.getenv("RESUME_MAX_BYTES", 10 * 1024 * 1024))  # 10 MB
+    RESUME_PARSE_WORKERS = int(os.getenv("RESUME_PARSE_WORKERS", 2))
+    RESUME_PARALLEL_MIN_PAGES = int(os.getenv("RESUME_PARALLEL_MIN_PAGES", 16))
+    RESUME_CACHE_ENABLED = os.getenv("RESUME_CACHE_ENABLED", "True")
+    RESUME_CACHE_PATH = os.getenv("RESUME_CACHE_PATH", os.path.join("instance", "resume_cache.db"))
+    RESUME_CACHE_TTL = int(os.getenv("RESUME_CACHE_TTL", 30 * 24 * 3600))  # 30 days
+    RESUME_CACHE_MAX_ENTRIES = int(os.getenv("RESUME_CACHE_MAX_ENTRIES", 5000))
+
+    # Werkzeug stops reading a request body past MAX_CONTENT_LENGTH (413), before multipart
+    # parsing spools the upload to disk. Upload routes lower it to their own cap plus
+    # MULTIPART_OVERHEAD_BYTES for the boundaries and part headers
+    MULTIPART_OVERHEAD_BYTES = int(os.getenv("MULTIPART_OVERHEAD_BYTES", 64 * 1024))
+    MAX_CONTENT_LENGTH = int(os.getenv(
+        "MAX_CONTENT_LENGTH",
+        max(ROUND1_MAX_UPLOAD_BYTES, ANSWER_STREAM_MAX_BYTES, RESUME_MAX_BYTES) + MULTIPART_OVERHEAD_BYTES,
+    ))
+
+    # JSON responses of at least COMPRESS_MIN_BYTES are sent gzip- or brotli-encoded
+    # when the client accepts it. brotli comes from the "brotli" package in requirements.txt;
+    # without it only gzip is offered
+    RESPONSE_COMPRESSION = os.getenv("RESPONSE_COMPRESSION", "True")
+    COMPRESS_MIN_BYTES = int(os.getenv("COMPRESS_MIN_BYTES", 1024))
+    COMPRESS_GZIP_LEVEL = int(os.getenv("COMPRESS_GZIP_LEVEL", 6))
+    COMPRESS_BROTLI_QUALITY = int(os.getenv("COMPRESS_BROTLI_QUALITY", 5))  # 0-11; 4-6 suits dynamic bodies
+
+    # Background pool of pre-generated question sets for retries (0 disables)
+    QUESTION_POOL_DEPTH = int(os.getenv("QUESTION_POOL_DEPTH", 1))
+    QUESTION_POOL_MAX_AGE = int(os.getenv("QUESTION_POOL_MAX_AGE", 7 * 24 * 3600))  # 7 days
+    QUESTION_POOL_WORKERS = int(os.getenv("QUESTION_POOL_WORKERS", 2))
+    # Seconds a client should wait before retrying get-question-audio while a streaming start is running
+    QUESTION_STREAM_RETRY_AFTER = float(os.getenv("QUESTION_STREAM_RETRY_AFTER", 1))
+    # A "streaming" mark older than this (seconds) is left over from a worker that died mid-start
+    QUESTION_STREAM_TIMEOUT = float(os.getenv("QUESTION_STREAM_TIMEOUT", 300))
+
+    # Per-request SQL statement count / DB time (log line, Server-Timing header, /metrics
+    # histograms per endpoint and statement fingerprint) and a slow-statement log. Off by
+    # default: ~5-14 us per statement and up to ~0.1 ms per request on SQLite
+    # (benchmarks/bench_db_instrumentation.py); turn on while profiling
+    DB_METRICS_ENABLED = os.getenv("DB_METRICS_ENABLED", "False")
+    DB_SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", 200))
+
+    # "per_answer" evaluates each answer as it arrives; "deferred" stores transcripts and
+    # evaluates the whole round plus its summary in one LLM call at the end
+    ROUND1_EVAL_MODE = os.getenv("ROUND1_EVAL_MODE", "per_answer")
+
+    # Use the compact profile extracted at upload time instead of raw resume/JD in prompts
+    CANDIDATE_PROFILE_ENABLED = os.getenv("CANDIDATE_PROFILE_ENABLED", "True")
+
+    # "db" loads the user row on every authenticated request; "cached" trusts a valid access
+    # token plus an in-process identity cache (id, name, email, token version)
+    AUTH_VERIFY_MODE = os.getenv("AUTH_VERIFY_MODE", "cached")
+    AUTH_IDENTITY_CACHE_TTL = int(os.getenv("AUTH_IDENTITY_CACHE_TTL", 30))  # seconds
+    AUTH_IDENTITY_CACHE_SIZE = int(os.getenv("AUTH_IDENTITY_CACHE_SIZE", 10000))
+
+    # Password hashing (werkzeug method string). Stored hashes made with other parameters
+    # are upgraded on the next successful login.
+    PASSWORD_HASH_METHOD = os.getenv("PASSWORD_HASH_METHOD", "scrypt:32768:8:1")  # or "pbkdf2:sha256:600000"
+    PASSWORD_SALT_LENGTH = int(os.getenv("PASSWORD_SALT_LENGTH", 16))
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", 2))  # 0 = hash in the request thread
+    PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", 64))
+    PASSWORD_HASH_TIMEOUT = float(os.getenv("PASSWORD_HASH_TIMEOUT", 10))  # seconds to wait for a slot / result
+
+    # ASGI entrypoint (uvicorn asgi:app): threads for DB/TTS steps and for Whisper
+    ASYNC_BLOCKING_WORKERS = int(os.getenv("ASYNC_BLOCKING_WORKERS", 32))
+    ASYNC_STT_WORKERS = int(os.getenv("ASYNC_STT_WORKERS", 1))            # Whisper inference is serialized per process
@@ -3,7 +3,9 @@ from typing import Callable
 
 from flask import g, request, jsonify, make_response
 
+from config.settings import Settings
 from models.user import User
+from utils.identity_cache import get_identity_cache, load_identity
 from utils.JWT_token import (
 	get_token_from_request,
 	decode_token,
@@ -12,6 +14,54 @@ from utils.JWT_token import (
 )
 
 
+def _verify_access_cached(payload: dict):
+	"""Authorize from the token and the identity cache; the DB is read only on a miss."""
+	user_id = int(payload.get("sub"))
+	version = int(payload.get("ver") or 0)
+	identity = get_identity_cache().get(user_id)
+	if identity is not None and identity.token_version == version:
+		return identity
+	# Miss, or this worker's entry predates a version bump made elsewhere: reload once
+	identity = load_identity(user_id)
+	if identity is not None and identity.token_version == version:
+		return identity
+	return None
+
+
+def authenticate_access_token(token: str):
+	"""Return the user (or cached Identity) for a valid access token, else None.
+
+	Needs an app context only on a cache miss or in ``db`` mode.
+	"""
+	try:
+		payload = decode_token(token)
+	except Exception:
+		return None
+	if payload.get("type") != "access":
+		return None
+	if Settings.AUTH_VERIFY_MODE == "cached":
+		return _verify_access_cached(payload)
+	user = User.find_by_id(int(payload.get("sub")))
+	if user and (user.token_version or 0) == int(payload.get("ver") or 0):
+		return user
+	return None
+
+
+def authenticate_refresh_token(refresh: str):
+	"""Return ``(user, new_access_token)`` for a current refresh token, else ``(None, None)``."""
+	try:
+		payload = decode_token(refresh)
+		if payload.get("type") == "refresh":
+			user_id = int(payload.get("sub"))
+			maybe_user = User.find_by_id(user_id)
+			# validate token is the current one in DB (revocation-aware)
+			if maybe_user and maybe_user.refresh_token == refresh:
+				return maybe_user, create_access_token(maybe_user.id, maybe_user.token_version)
+	except Exception:
+		pass
+	return None, None
+
+
 def auth_required(f: Callable):
 	@wraps(f)
 	def wrapper(*args, **kwargs):
@@ -22,10 +72,7 @@ def auth_required(f: Callable):
 		token = get_token_from_request(request, token_name="access_token")
 		if token:
 			try:
-				payload = decode_token(token)
-				if payload.get("type") == "access":
-					user_id = int(payload.get("sub"))
-					user = User.find_by_id(user_id)
+				user = authenticate_access_token(token)
 			except Exception:
 				# fall through to try refresh token
 				user = None
@@ -36,17 +83,7 @@ def auth_required(f: Callable):
 				request, "refresh_token"
 			)
 			if refresh:
-				try:
-					payload = decode_token(refresh)
-					if payload.get("type") == "refresh":
-						user_id = int(payload.get("sub"))
-						maybe_user = User.find_by_id(user_id)
-						# validate token is the current one in DB (revocation-aware)
-						if maybe_user and maybe_user.refresh_token == refresh:
-							user = maybe_user
-							new_access_token = create_access_token(user.id)
-				except Exception:
-					user = None
+				user, new_access_token = authenticate_refresh_token(refresh)
 
 		if not user:
 			return jsonify({"error": "Unauthorized"}), 401
@@ -0,0 +1,89 @@
+"""Baseline schema: users, interviews, interview_rounds, interview_questions
+
+The tables as they were before migrations were added, so that `flask db
+upgrade` builds the whole schema on an empty database. Later revisions add
+the indexes and columns on top.
+
+Databases that were created with db.create_all() before this revision
+existed already have some or all of these tables. Existing tables are left
+alone, so the upgrade works on those databases too.
+
+Revision ID: 1a7e5c3b9f20
+Revises:
+Create Date: 2026-10-18 10:04:55.318402
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1a7e5c3b9f20'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+
+    if not inspector.has_table("users"):
+        op.create_table(
+            "users",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("name", sa.String(length=100), nullable=False),
+            sa.Column("email", sa.String(length=120), nullable=False, unique=True),
+            sa.Column("password", sa.String(length=128), nullable=False),
+            sa.Column("refresh_token", sa.String(length=255), nullable=True),
+            sa.Column("resume_text", sa.Text(), nullable=True),
+            sa.Column("job_description", sa.Text(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+        )
+
+    if not inspector.has_table("interviews"):
+        op.create_table(
+            "interviews",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+            sa.Column("status", sa.String(length=50), nullable=True),
+            sa.Column("final_result_json", sa.JSON(), nullable=True),
+            sa.Column("round_2_confirmation_sent", sa.Boolean(), nullable=True),
+            sa.Column("round_2_reminder_sent", sa.Boolean(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+        )
+
+    if not inspector.has_table("interview_rounds"):
+        op.create_table(
+            "interview_rounds",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("interview_id", sa.Integer(), sa.ForeignKey("interviews.id"), nullable=False),
+            sa.Column("round_number", sa.Integer(), nullable=False),
+            sa.Column("status", sa.String(length=50), nullable=True),
+            sa.Column("scheduled_at", sa.DateTime(), nullable=True),
+            sa.Column("started_at", sa.DateTime(), nullable=True),
+            sa.Column("completed_at", sa.DateTime(), nullable=True),
+            sa.Column("result_json", sa.JSON(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+        )
+
+    if not inspector.has_table("interview_questions"):
+        op.create_table(
+            "interview_questions",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("round_id", sa.Integer(), sa.ForeignKey("interview_rounds.id"), nullable=False),
+            sa.Column("question_text", sa.Text(), nullable=False),
+            sa.Column("answer_text", sa.Text(), nullable=True),
+            sa.Column("evaluation_json", sa.JSON(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+        )
+
+
+def downgrade():
+    op.drop_table("interview_questions")
+    op.drop_table("interview_rounds")
+    op.drop_table("interviews")
+    op.drop_table("users")
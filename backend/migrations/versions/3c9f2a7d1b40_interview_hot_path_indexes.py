@@ -0,0 +1,120 @@
+"""Indexes and uniqueness for the interview hot-path queries
+
+Adds:
+- ix_interviews_user_id for ensure_or_create_interview
+- uq_interview_rounds_interview_round, a unique (interview_id, round_number)
+  constraint that also serves the start_round lookup
+- ix_interview_questions_round_id_id for per-round question loads and deletes
+- ix_interview_questions_round_unanswered, a partial (round_id, id) index over
+  unanswered questions for get_next_unanswered
+
+Databases created with db.create_all() may already have these. Each step
+checks first, so the upgrade is safe on either kind of database.
+
+Before the unique constraint is added, duplicate rounds are merged down to
+one per (interview_id, round_number): the round with the most answered
+questions is kept (the oldest on a tie), and every dropped round is logged
+with its question counts.
+
+Revision ID: 3c9f2a7d1b40
+Revises: b2d6f4a8c031
+Create Date: 2026-10-18 10:12:41.503118
+
+"""
+import logging
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c9f2a7d1b40'
+down_revision = 'b2d6f4a8c031'
+branch_labels = None
+depends_on = None
+
+UNANSWERED = sa.text("answer_text IS NULL")
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+def _index_names(table):
+    return {ix["name"] for ix in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def _unique_names(table):
+    return {uq["name"] for uq in sa.inspect(op.get_bind()).get_unique_constraints(table)}
+
+
+def _drop_duplicate_rounds():
+    """Keep one round per (interview_id, round_number) and log the ones dropped.
+
+    Lookups took whichever duplicate the database returned first, so any of
+    them may hold the candidate's answers. The one with the most answered
+    questions is kept, the oldest on a tie.
+    """
+    bind = op.get_bind()
+    rows = bind.execute(sa.text(
+        "SELECT r.id, r.interview_id, r.round_number, r.status,"
+        " COUNT(q.id), COUNT(q.answer_text)"
+        " FROM interview_rounds r LEFT JOIN interview_questions q ON q.round_id = r.id"
+        " WHERE EXISTS ("
+        "  SELECT 1 FROM interview_rounds k"
+        "  WHERE k.interview_id = r.interview_id AND k.round_number = r.round_number AND k.id <> r.id)"
+        " GROUP BY r.id, r.interview_id, r.round_number, r.status"
+        " ORDER BY r.interview_id, r.round_number, r.id"
+    )).fetchall()
+    groups = {}
+    for row in rows:
+        groups.setdefault((row[1], row[2]), []).append(row)
+
+    duplicates = []
+    for (interview_id, round_number), group in groups.items():
+        keep = max(group, key=lambda row: (row[5], -row[0]))
+        for row in group:
+            if row is keep:
+                continue
+            duplicates.append(row[0])
+            logger.warning(
+                "Dropping duplicate round id=%s interview_id=%s round_number=%s status=%s "
+                "questions=%s answered=%s (kept round id=%s)",
+                row[0], interview_id, round_number, row[3], row[4], row[5], keep[0],
+            )
+    if not duplicates:
+        return
+    questions = sa.table("interview_questions", sa.column("round_id"))
+    rounds = sa.table("interview_rounds", sa.column("id"))
+    bind.execute(questions.delete().where(questions.c.round_id.in_(duplicates)))
+    bind.execute(rounds.delete().where(rounds.c.id.in_(duplicates)))
+
+
+def upgrade():
+    if "ix_interviews_user_id" not in _index_names("interviews"):
+        op.create_index("ix_interviews_user_id", "interviews", ["user_id"])
+
+    if "uq_interview_rounds_interview_round" not in _unique_names("interview_rounds"):
+        _drop_duplicate_rounds()
+        with op.batch_alter_table("interview_rounds") as batch_op:
+            batch_op.create_unique_constraint(
+                "uq_interview_rounds_interview_round", ["interview_id", "round_number"]
+            )
+
+    existing = _index_names("interview_questions")
+    if "ix_interview_questions_round_id_id" not in existing:
+        op.create_index("ix_interview_questions_round_id_id", "interview_questions", ["round_id", "id"])
+    if "ix_interview_questions_round_unanswered" not in existing:
+        op.create_index(
+            "ix_interview_questions_round_unanswered",
+            "interview_questions",
+            ["round_id", "id"],
+            sqlite_where=UNANSWERED,
+            postgresql_where=UNANSWERED,
+        )
+
+
+def downgrade():
+    op.drop_index("ix_interview_questions_round_unanswered", table_name="interview_questions")
+    op.drop_index("ix_interview_questions_round_id_id", table_name="interview_questions")
+    with op.batch_alter_table("interview_rounds") as batch_op:
+        batch_op.drop_constraint("uq_interview_rounds_interview_round", type_="unique")
+    op.drop_index("ix_interviews_user_id", table_name="interviews")
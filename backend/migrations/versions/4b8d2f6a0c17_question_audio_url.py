@@ -0,0 +1,32 @@
+"""Add interview_questions.audio_url for pre-synthesized question audio
+
+Revision ID: 4b8d2f6a0c17
+Revises: 1a7e5c3b9f20
+Create Date: 2026-10-18 17:02:31.640275
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4b8d2f6a0c17'
+down_revision = '1a7e5c3b9f20'
+branch_labels = None
+depends_on = None
+
+
+def _columns(table):
+    return {col["name"] for col in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    # db.create_all() on a newer model may have added it already
+    if "audio_url" not in _columns("interview_questions"):
+        with op.batch_alter_table("interview_questions") as batch_op:
+            batch_op.add_column(sa.Column("audio_url", sa.String(length=255), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table("interview_questions") as batch_op:
+        batch_op.drop_column("audio_url")
@@ -0,0 +1,31 @@
+"""Add users.candidate_profile for the compact resume/JD profile used in prompts
+
+Revision ID: 5e7c2a9d4f18
+Revises: 6e1c9a4d2b58
+Create Date: 2026-10-18 17:31:52.907316
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e7c2a9d4f18'
+down_revision = '6e1c9a4d2b58'
+branch_labels = None
+depends_on = None
+
+
+def _columns(table):
+    return {col["name"] for col in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    if "candidate_profile" not in _columns("users"):
+        with op.batch_alter_table("users") as batch_op:
+            batch_op.add_column(sa.Column("candidate_profile", sa.JSON(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.drop_column("candidate_profile")
@@ -0,0 +1,37 @@
+"""Add pregenerated_question_sets for the background question pool
+
+Revision ID: 6e1c9a4d2b58
+Revises: 4b8d2f6a0c17
+Create Date: 2026-10-18 17:05:12.907341
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6e1c9a4d2b58'
+down_revision = '4b8d2f6a0c17'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # db.create_all() on a newer model may have created it already
+    if sa.inspect(op.get_bind()).has_table("pregenerated_question_sets"):
+        return
+    op.create_table(
+        "pregenerated_question_sets",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("round_number", sa.Integer(), nullable=False),
+        sa.Column("questions_json", sa.JSON(), nullable=False),
+        sa.Column("source_hash", sa.String(length=64), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_pregenerated_question_sets_user_id", "pregenerated_question_sets", ["user_id"])
+
+
+def downgrade():
+    op.drop_index("ix_pregenerated_question_sets_user_id", table_name="pregenerated_question_sets")
+    op.drop_table("pregenerated_question_sets")
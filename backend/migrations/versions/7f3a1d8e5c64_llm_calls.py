@@ -0,0 +1,45 @@
+"""Add llm_calls for per-user / per-round model usage
+
+Revision ID: 7f3a1d8e5c64
+Revises: 5e7c2a9d4f18
+Create Date: 2026-10-18 17:07:48.215596
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7f3a1d8e5c64'
+down_revision = '5e7c2a9d4f18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # db.create_all() on a newer model may have created it already
+    if sa.inspect(op.get_bind()).has_table("llm_calls"):
+        return
+    op.create_table(
+        "llm_calls",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("call_site", sa.String(length=64), nullable=False),
+        sa.Column("model", sa.String(length=64), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("round_id", sa.Integer(), nullable=True),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("prompt_tokens", sa.Integer(), nullable=True),
+        sa.Column("completion_tokens", sa.Integer(), nullable=True),
+        sa.Column("latency_ms", sa.Float(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_llm_calls_user_id", "llm_calls", ["user_id"])
+    op.create_index("ix_llm_calls_round_id", "llm_calls", ["round_id"])
+    op.create_index("ix_llm_calls_created_at", "llm_calls", ["created_at"])
+
+
+def downgrade():
+    op.drop_index("ix_llm_calls_created_at", table_name="llm_calls")
+    op.drop_index("ix_llm_calls_round_id", table_name="llm_calls")
+    op.drop_index("ix_llm_calls_user_id", table_name="llm_calls")
+    op.drop_table("llm_calls")
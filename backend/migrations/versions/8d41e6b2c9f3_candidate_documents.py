@@ -0,0 +1,74 @@
+"""Move resume, JD and candidate profile off users into candidate_documents
+
+users is read on every authenticated request, and its resume_text,
+job_description and candidate_profile columns made each row several KB wide.
+This creates candidate_documents (one row per user that has any of the
+three), copies the values over and drops the columns from users.
+
+db.create_all() on an old database creates an empty candidate_documents and
+leaves the users columns in place. The backfill only inserts users that have
+no documents row yet, so the upgrade works on that kind of database as well.
+
+Revision ID: 8d41e6b2c9f3
+Revises: 3c9f2a7d1b40
+Create Date: 2026-10-18 16:40:07.219864
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d41e6b2c9f3'
+down_revision = '3c9f2a7d1b40'
+branch_labels = None
+depends_on = None
+
+MOVED = ("resume_text", "job_description", "candidate_profile")
+
+
+def _columns(table):
+    return {col["name"] for col in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("candidate_documents"):
+        op.create_table(
+            "candidate_documents",
+            sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+            sa.Column("resume_text", sa.Text(), nullable=True),
+            sa.Column("job_description", sa.Text(), nullable=True),
+            sa.Column("candidate_profile", sa.JSON(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=True),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+        )
+
+    present = [name for name in MOVED if name in _columns("users")]
+    if not present:
+        return
+
+    cols = ", ".join(present)
+    op.execute(
+        f"INSERT INTO candidate_documents (user_id, {cols}, created_at, updated_at) "
+        f"SELECT u.id, {', '.join('u.' + c for c in present)}, u.created_at, u.updated_at FROM users u "
+        f"WHERE ({' OR '.join('u.' + c + ' IS NOT NULL' for c in present)}) "
+        "AND NOT EXISTS (SELECT 1 FROM candidate_documents d WHERE d.user_id = u.id)"
+    )
+    with op.batch_alter_table("users") as batch_op:
+        for name in present:
+            batch_op.drop_column(name)
+
+
+def downgrade():
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.add_column(sa.Column("resume_text", sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column("job_description", sa.Text(), nullable=True))
+        batch_op.add_column(sa.Column("candidate_profile", sa.JSON(), nullable=True))
+
+    for name in MOVED:
+        op.execute(
+            f"UPDATE users SET {name} = "
+            f"(SELECT d.{name} FROM candidate_documents d WHERE d.user_id = users.id)"
+        )
+    op.drop_table("candidate_documents")
@@ -0,0 +1,34 @@
+"""Add users.token_version for access token revocation
+
+Existing users start at 0, which matches the "ver" claim of tokens issued
+before the column existed, so nobody is logged out by the upgrade.
+
+Revision ID: 9a5e3c7b1d42
+Revises: 7f3a1d8e5c64
+Create Date: 2026-10-18 17:10:26.471830
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9a5e3c7b1d42'
+down_revision = '7f3a1d8e5c64'
+branch_labels = None
+depends_on = None
+
+
+def _columns(table):
+    return {col["name"] for col in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    if "token_version" not in _columns("users"):
+        with op.batch_alter_table("users") as batch_op:
+            batch_op.add_column(sa.Column("token_version", sa.Integer(), nullable=False, server_default="0"))
+
+
+def downgrade():
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.drop_column("token_version")
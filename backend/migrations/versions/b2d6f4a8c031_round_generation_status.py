@@ -0,0 +1,31 @@
+"""Add interview_rounds.generation_status for streamed question generation
+
+Revision ID: b2d6f4a8c031
+Revises: 9a5e3c7b1d42
+Create Date: 2026-10-18 17:13:05.082194
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b2d6f4a8c031'
+down_revision = '9a5e3c7b1d42'
+branch_labels = None
+depends_on = None
+
+
+def _columns(table):
+    return {col["name"] for col in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    if "generation_status" not in _columns("interview_rounds"):
+        with op.batch_alter_table("interview_rounds") as batch_op:
+            batch_op.add_column(sa.Column("generation_status", sa.String(length=16), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table("interview_rounds") as batch_op:
+        batch_op.drop_column("generation_status")
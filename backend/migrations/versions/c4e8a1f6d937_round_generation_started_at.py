@@ -0,0 +1,31 @@
+"""Add interview_rounds.generation_started_at so a stale "streaming" mark expires
+
+Revision ID: c4e8a1f6d937
+Revises: 8d41e6b2c9f3
+Create Date: 2026-10-18 19:42:17.604913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4e8a1f6d937'
+down_revision = '8d41e6b2c9f3'
+branch_labels = None
+depends_on = None
+
+
+def _columns(table):
+    return {col["name"] for col in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade():
+    if "generation_started_at" not in _columns("interview_rounds"):
+        with op.batch_alter_table("interview_rounds") as batch_op:
+            batch_op.add_column(sa.Column("generation_started_at", sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table("interview_rounds") as batch_op:
+        batch_op.drop_column("generation_started_at")
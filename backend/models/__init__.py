@@ -5,4 +5,7 @@ from .user import User
 from .interviews import Interview
 from .interview_round import InterviewRound
 from .interview_questions import InterviewQuestion
-__all__ = ["User", "Interview", "InterviewRound","InterviewQuestion"]
+from .pregenerated_question_set import PregeneratedQuestionSet
+from .llm_call import LLMCall
+from .candidate_document import CandidateDocument
+__all__ = ["User", "Interview", "InterviewRound","InterviewQuestion", "PregeneratedQuestionSet", "LLMCall", "CandidateDocument"]
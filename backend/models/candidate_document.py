@@ -0,0 +1,24 @@
+from datetime import datetime
+from models import db
+
+class CandidateDocument(db.Model):
+    """Resume, JD and extracted profile of a user, kept off the ``users`` row.
+
+    ``users`` is read on every authenticated request; these columns are only
+    needed by resume upload, round 1 and the question/evaluation prompts,
+    which load them with ``User.find_with_documents`` or ``joinedload(User.documents)``.
+    """
+    __tablename__ = "candidate_documents"
+
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    resume_text = db.Column(db.Text, nullable=True)
+    job_description = db.Column(db.Text, nullable=True)
+    candidate_profile = db.Column(db.JSON, nullable=True)  # compact resume/JD facts used in prompts
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    user = db.relationship("User", back_populates="documents")
+
+    def __repr__(self):
+        return f"<CandidateDocument user={self.user_id}>"
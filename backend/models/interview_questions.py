@@ -3,6 +3,17 @@ from models import db
 
 class InterviewQuestion(db.Model):
     __tablename__ = 'interview_questions'
+    __table_args__ = (
+        db.Index("ix_interview_questions_round_id_id", "round_id", "id"),
+        # Only unanswered questions: "next unanswered in this round" is a single seek
+        db.Index(
+            "ix_interview_questions_round_unanswered",
+            "round_id",
+            "id",
+            sqlite_where=db.text("answer_text IS NULL"),
+            postgresql_where=db.text("answer_text IS NULL"),
+        ),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     round_id = db.Column(db.Integer, db.ForeignKey('interview_rounds.id'), nullable=False)
@@ -10,6 +21,7 @@ class InterviewQuestion(db.Model):
     question_text = db.Column(db.Text, nullable=False)
     answer_text = db.Column(db.Text, nullable=True)
     evaluation_json = db.Column(db.JSON, default=dict)  # Score, feedback, etc.
+    audio_url = db.Column(db.String(255), nullable=True)  # Pre-synthesized question audio
 
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -3,12 +3,18 @@ from models import db
 
 class InterviewRound(db.Model):
     __tablename__ = "interview_rounds"
+    __table_args__ = (
+        # One row per round of an interview; also the index behind the (interview_id, round_number) lookup
+        db.UniqueConstraint("interview_id", "round_number", name="uq_interview_rounds_interview_round"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     interview_id = db.Column(db.Integer, db.ForeignKey("interviews.id"), nullable=False)
 
     round_number = db.Column(db.Integer, nullable=False)  # 1 or 2
     status = db.Column(db.String(50), default="pending")  # pending, pass, fail
+    generation_status = db.Column(db.String(16), nullable=True)  # "streaming" while questions are still being generated
+    generation_started_at = db.Column(db.DateTime, nullable=True)  # when generation_status was set
 
     scheduled_at = db.Column(db.DateTime, nullable=True)
     started_at = db.Column(db.DateTime, nullable=True)
@@ -23,5 +29,11 @@ class InterviewRound(db.Model):
     interview = db.relationship("Interview", back_populates="rounds")
     questions = db.relationship("InterviewQuestion", backref="round", cascade="all, delete-orphan")
 
+    def is_streaming(self, timeout: float) -> bool:
+        """True while a streamed start is writing questions; marks older than ``timeout`` seconds are stale."""
+        if self.generation_status != "streaming" or self.generation_started_at is None:
+            return False
+        return (datetime.utcnow() - self.generation_started_at).total_seconds() < timeout
+
     def __repr__(self):
         return f"<InterviewRound {self.round_number} for Interview {self.interview_id}>"
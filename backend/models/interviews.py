@@ -5,7 +5,7 @@ class Interview(db.Model):
     __tablename__ = "interviews"
 
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False, index=True)
 
     status = db.Column(db.String(50), default="in_progress")  # in_progress, completed, failed
     final_result_json = db.Column(db.JSON, nullable=True)
@@ -0,0 +1,22 @@
+from datetime import datetime
+from models import db
+
+class LLMCall(db.Model):
+    """One model invocation, for per-user / per-round cost and latency reporting."""
+    __tablename__ = "llm_calls"
+
+    id = db.Column(db.Integer, primary_key=True)
+    call_site = db.Column(db.String(64), nullable=False)
+    model = db.Column(db.String(64), nullable=False)
+    user_id = db.Column(db.Integer, nullable=True, index=True)
+    round_id = db.Column(db.Integer, nullable=True, index=True)
+
+    status = db.Column(db.String(16), nullable=False, default="ok")  # ok, error, cached
+    prompt_tokens = db.Column(db.Integer, default=0)
+    completion_tokens = db.Column(db.Integer, default=0)
+    latency_ms = db.Column(db.Float, default=0.0)
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+
+    def __repr__(self):
+        return f"<LLMCall {self.call_site} user={self.user_id} round={self.round_id}>"
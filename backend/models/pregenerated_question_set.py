@@ -0,0 +1,18 @@
+from datetime import datetime
+from models import db
+
+class PregeneratedQuestionSet(db.Model):
+    """A ready-to-use question set generated in the background for a future attempt."""
+    __tablename__ = "pregenerated_question_sets"
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey("users.id"), nullable=False, index=True)
+    round_number = db.Column(db.Integer, nullable=False)
+
+    questions_json = db.Column(db.JSON, nullable=False)  # list of question strings
+    source_hash = db.Column(db.String(64), nullable=False)  # hash of resume + JD it was built from
+
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<PregeneratedQuestionSet {self.id} user={self.user_id} round={self.round_number}>"
@@ -1,6 +1,13 @@
-from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime
+from typing import Iterable, Optional
+from sqlalchemy.ext.associationproxy import association_proxy
+from sqlalchemy.orm import joinedload
 from config.db import db
+from utils.password_hasher import hash_password, verify_password, needs_rehash
+
+# Keys of to_dict(); auth responses send USER_DEFAULT_FIELDS unless ?fields= asks for more
+USER_FIELDS = ("id", "name", "email", "refresh_token", "created_at", "updated_at")
+USER_DEFAULT_FIELDS = ("id", "name", "email")
 
 class User(db.Model):
     __tablename__ = 'users'
@@ -9,33 +16,58 @@ class User(db.Model):
     email = db.Column(db.String(120), unique=True, nullable=False)
     password = db.Column(db.String(128), nullable=False)
     refresh_token = db.Column(db.String(255), nullable=True)
-    resume_text = db.Column(db.Text, nullable=True)
-    job_description = db.Column(db.Text, nullable=True)
+    token_version = db.Column(db.Integer, nullable=False, default=0, server_default="0")  # bump to revoke access tokens
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     interviews = db.relationship("Interview", back_populates="user", cascade="all, delete-orphan")
+    documents = db.relationship(
+        "CandidateDocument", back_populates="user", uselist=False, cascade="all, delete-orphan"
+    )
+
+    # Resume/JD live in candidate_documents; reading these without the documents
+    # eager-loaded costs one extra query. Assigning creates the row when missing
+    resume_text = association_proxy(
+        "documents", "resume_text", creator=lambda value: _new_documents(resume_text=value)
+    )
+    job_description = association_proxy(
+        "documents", "job_description", creator=lambda value: _new_documents(job_description=value)
+    )
+    candidate_profile = association_proxy(
+        "documents", "candidate_profile", creator=lambda value: _new_documents(candidate_profile=value)
+    )
 
     def __repr__(self):
         return f'<User {self.email}>'
     
     def set_password(self, password: str) -> None:
-        self.password = generate_password_hash(password)
+        self.password = hash_password(password)
+        if self.id is not None:
+            # Password change: access tokens issued before it stop verifying
+            self.token_version = (self.token_version or 0) + 1
     
     def check_password(self, password: str) -> bool:
-        return check_password_hash(self.password, password)
+        return verify_password(self.password, password)
 
-    def to_dict(self) -> dict:
-        return {
+    def rehash_password_if_needed(self, password: str) -> bool:
+        """After a successful check, upgrade a hash made with old parameters (no token revocation)."""
+        if not needs_rehash(self.password):
+            return False
+        self.password = hash_password(password)
+        return True
+
+    def to_dict(self, fields: Optional[Iterable[str]] = None) -> dict:
+        data = {
             'id': self.id,
             'name': self.name,
             'email': self.email,
             'refresh_token': self.refresh_token,
-            'resume_text': self.resume_text,
-            'job_description':self.job_description,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
+        if fields is None:
+            return data
+        return {key: value for key, value in data.items() if key in fields}
     
     @staticmethod
     def find_by_email(email: str) -> 'User':
@@ -44,3 +76,14 @@ class User(db.Model):
     @staticmethod
     def find_by_id(user_id: int) -> 'User':
         return User.query.get(user_id)
+
+    @staticmethod
+    def find_with_documents(user_id: int) -> 'User':
+        """Load the user together with resume, JD and profile in one statement."""
+        return User.query.options(joinedload(User.documents)).filter_by(id=user_id).first()
+
+
+def _new_documents(**values):
+    from models.candidate_document import CandidateDocument
+
+    return CandidateDocument(**values)
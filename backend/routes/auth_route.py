@@ -6,6 +6,7 @@ from services.auth_service import (
 	refresh_service,
 	me_service,
 	logout_service,
+	change_password_service,
 )
 from middleware.auth_middleware import auth_required
 
@@ -38,3 +39,9 @@ def me():
 @auth_required
 def logout():
 	return logout_service(getattr(g, "current_user", None))
+
+
+@auth_bp.post("/change-password")
+@auth_required
+def change_password():
+	return change_password_service(getattr(g, "current_user", None), request.get_json(silent=True) or {})
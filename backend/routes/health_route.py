@@ -0,0 +1,85 @@
+import threading
+
+from flask import Blueprint, g, request, jsonify
+
+from config.settings import get_bool
+from middleware.auth_middleware import auth_required
+from tools.stt_sidecar import SidecarError
+from tools.whisper_stt import model_manager, get_sidecar_client
+from utils.interview_shared import get_audio_cache
+from utils.llm_cache import get_llm_cache
+from utils.llm_metrics import llm_usage_totals
+from utils.question_pool import get_question_pool
+
+health_bp = Blueprint("health_bp", __name__)
+
+
+@health_bp.route("/stt", methods=["GET"])
+def stt_ready():
+    """Readiness probe: 200 once the Whisper model is loaded in this worker, else 503.
+
+    With ``STT_BACKEND=sidecar`` this reports the sidecar's model instead.
+    """
+    client = get_sidecar_client()
+    if client is not None:
+        try:
+            code, status = client.health()
+        except SidecarError as e:
+            return jsonify({"loaded": False, "backend": "sidecar", "error": str(e)}), 503
+        status["backend"] = "sidecar"
+        return jsonify(status), code
+    status = model_manager.status()
+    return jsonify(status), 200 if status["loaded"] else 503
+
+
+@health_bp.route("/stt/warmup", methods=["POST"])
+@auth_required
+def stt_warmup():
+    """Load the Whisper model. ?wait=1 blocks until loaded, otherwise loads in the background.
+
+    Needs a logged-in user: loading the model is expensive, so anonymous
+    clients must not be able to trigger it.
+    """
+    if get_sidecar_client() is not None:
+        # The sidecar warms itself on startup; never load a second copy here
+        return stt_ready()
+    if get_bool(request.args.get("wait")):
+        try:
+            return jsonify(model_manager.warmup()), 200
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+    if not model_manager.loaded:
+        threading.Thread(target=model_manager.warmup, name="stt-warmup", daemon=True).start()
+    return jsonify(model_manager.status()), 202
+
+
+@health_bp.route("/llm-cache", methods=["GET"])
+def llm_cache_stats():
+    """LLM response cache hit rate and tokens saved in this worker."""
+    cache = get_llm_cache()
+    if cache is None:
+        return jsonify({"enabled": False}), 200
+    return jsonify({"enabled": True, **cache.stats()}), 200
+
+
+@health_bp.route("/audio-cache", methods=["GET"])
+def audio_cache_stats():
+    """TTS audio cache hits, misses and evictions in this worker, for sizing TTS_CACHE_MAX_BYTES."""
+    return jsonify(get_audio_cache().stats()), 200
+
+
+@health_bp.route("/question-pool", methods=["GET"])
+def question_pool_stats():
+    """Pre-generated question set pool hits, misses and staleness in this worker."""
+    pool = get_question_pool()
+    if pool is None:
+        return jsonify({"enabled": False}), 200
+    return jsonify({"enabled": True, **pool.stats()}), 200
+
+
+@health_bp.route("/llm-usage", methods=["GET"])
+@auth_required
+def llm_usage():
+    """The current user's LLM calls, tokens and latency per call site; filter with ?round_id=."""
+    round_id = request.args.get("round_id", type=int)
+    return jsonify(llm_usage_totals(g.current_user.id, round_id)), 200
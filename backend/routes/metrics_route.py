@@ -0,0 +1,14 @@
+from flask import Blueprint, Response
+
+# Importing registers the LLM and DB metrics even before the first call
+import utils.db_metrics  # noqa: F401
+import utils.llm_metrics  # noqa: F401
+from utils.metrics import registry
+
+metrics_bp = Blueprint("metrics_bp", __name__)
+
+
+@metrics_bp.route("/metrics", methods=["GET"])
+def metrics():
+    """Prometheus text exposition of this worker's metrics."""
+    return Response(registry.render(), mimetype="text/plain; version=0.0.4")
@@ -1,6 +1,9 @@
 # routes/resume_route.py
 from flask import Blueprint, request, jsonify
+from werkzeug.exceptions import RequestEntityTooLarge
+from config.settings import Settings
 from services.resume_service import ResumeService
+from utils.resume_parser import ResumeTooLarge
 from utils.JWT_token import get_token_from_request, decode_token
 
 resume_bp = Blueprint('resume_bp', __name__)
@@ -23,12 +26,20 @@ def upload_resume():
     """Upload Resume + JD (only once for Round 1)"""
     try:
         user_id = get_current_user_id(request)
+        # Werkzeug enforces this while parsing, before the file is spooled; the JD is a form field
+        request.max_content_length = (
+            Settings.RESUME_MAX_BYTES + Settings.MULTIPART_OVERHEAD_BYTES + (request.max_form_memory_size or 0)
+        )
         file = request.files.get('file')
         job_description = request.form.get('job_description')
 
         result = resume_service.upload_and_parse_resume(user_id, file, job_description)
         return jsonify(result), 200
 
+    except ResumeTooLarge as e:
+        return jsonify({"error": str(e)}), 413
+    except RequestEntityTooLarge:
+        return jsonify({"error": f"Resume upload exceeds {Settings.RESUME_MAX_BYTES} bytes"}), 413
     except ValueError as e:
         return jsonify({"error": str(e)}), 400
     except Exception as e:
@@ -1,21 +1,96 @@
-import os
-import tempfile
-from flask import Blueprint, request, jsonify, g
+import json
+import logging
+import time
+from flask import Blueprint, Response, request, jsonify, g, stream_with_context
+from werkzeug.exceptions import RequestEntityTooLarge
+from config.settings import Settings, get_bool
 from services.round1_service import Round1Service
 from middleware.auth_middleware import auth_required
+from tools.audio_decode import AudioDecodeError, UploadTooLarge, decode_audio, iter_stream
+from utils.fieldsets import requested_fields, select
+from utils.job_queue import JobQueueFull
 
 round1_bp = Blueprint("round1_bp", __name__)
 svc = Round1Service()
+logger = logging.getLogger(__name__)
+
+# Default round_1_summary keys on get-interview-status
+STATUS_SUMMARY_FIELDS = ("overall_score", "pass")
+
+
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def _decode_request_audio(user_id: int, question_id: int):
+    """Decode the answer upload of the current request; returns ``(audio, decode_ms, error_response)``.
+
+    The question's ownership is checked first, so a request for someone
+    else's (or a missing) question never reaches ffmpeg.
+    """
+    if not svc.utils.question_belongs_to(question_id, user_id):
+        return None, 0, (jsonify({"error": "Invalid question"}), 400)
+    # Werkzeug enforces this while reading, before a multipart upload is spooled
+    request.max_content_length = Settings.ROUND1_MAX_UPLOAD_BYTES + Settings.MULTIPART_OVERHEAD_BYTES
+    if request.mimetype.startswith("audio/"):
+        if request.content_length and request.content_length > Settings.ROUND1_MAX_UPLOAD_BYTES:
+            return None, 0, (jsonify({"error": "Audio file too large"}), 413)
+        source = request.stream
+    else:
+        try:
+            audio_file = request.files.get("audio")
+        except RequestEntityTooLarge:
+            return None, 0, (jsonify({"error": "Audio file too large"}), 413)
+        if not audio_file:
+            return None, 0, (jsonify({"error": "Audio file required"}), 400)
+        source = audio_file.stream
+
+    started = time.perf_counter()
+    try:
+        audio = decode_audio(iter_stream(source), max_bytes=Settings.ROUND1_MAX_UPLOAD_BYTES)
+    except UploadTooLarge as e:
+        return None, 0, (jsonify({"error": str(e)}), 413)
+    except AudioDecodeError as e:
+        return None, 0, (jsonify({"error": str(e)}), 400)
+    return audio, round((time.perf_counter() - started) * 1000, 1), None
 
 @round1_bp.route("/start", methods=["POST"])
 @auth_required
 def start_round_1():
     user_id = g.current_user.id
-    result = svc.start_round_1(user_id)
+    include_audio = get_bool(request.args.get("include_audio"))
+    result = svc.start_round_1(user_id, include_audio=include_audio)
     status = 200 if "error" not in result else 400
     return jsonify(result), status
 
 
+@round1_bp.route("/start/stream", methods=["POST"])
+@auth_required
+def start_round_1_stream():
+    """Server-Sent Events variant of start.
+
+    Emits ``round``, then one ``question`` (``{"id", "text", "index"}``, plus
+    ``audio_url`` with ``include_audio``) as soon as each question is stored,
+    then ``done`` with the same payload as start, or ``error``.
+    """
+    user_id = g.current_user.id
+    include_audio = get_bool(request.args.get("include_audio"))
+
+    def events():
+        try:
+            for event, data in svc.start_round_1_stream(user_id, include_audio=include_audio):
+                yield _sse(event, data)
+        except Exception:
+            logger.exception("SSE start failed user_id=%s", user_id)
+            yield _sse("error", {"round_status": "error", "error": "Question generation failed"})
+
+    return Response(
+        stream_with_context(events()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @round1_bp.route("/get-question-audio", methods=["GET"])
 @auth_required
 def get_question_audio():
@@ -23,6 +98,8 @@ def get_question_audio():
     q = svc.get_question_audio(user_id)
     if not q:
         return jsonify({"round_status": "no_more_questions", "message": "No more questions"}), 200
+    if q.get("round_status") == "generating":
+        return jsonify(q), 202
     status = 200 if "error" not in q else 400
     return jsonify(q), status
 
@@ -30,29 +107,110 @@ def get_question_audio():
 @round1_bp.route("/submit-answer/<int:question_id>", methods=["POST"])
 @auth_required
 def submit_answer(question_id):
+    """Decode the answer in memory and transcribe + evaluate it.
+
+    Accepts multipart ``audio`` (what the frontend sends) or a raw ``audio/*``
+    body. The raw form streams from the socket into ffmpeg without Werkzeug
+    spooling the upload to a temp file first.
+    """
     user_id = g.current_user.id
-    audio_file = request.files.get("audio")
-    if not audio_file:
-        return jsonify({"error": "Audio file required"}), 400
+    audio, decode_ms, error = _decode_request_audio(user_id, question_id)
+    if error:
+        return error
 
-    # Persist upload temporarily so Whisper can read a file path
-    os.makedirs(os.path.join("static", "uploads"), exist_ok=True)
-    tmp_dir = os.path.join("static", "uploads")
-    # Use NamedTemporaryFile for uniqueness (delete=False so Whisper can read)
-    with tempfile.NamedTemporaryFile(dir=tmp_dir, suffix=".wav", delete=False) as tmp:
-        audio_path = tmp.name
-        audio_file.save(audio_path)
+    mode = (request.args.get("mode") or Settings.ROUND1_SUBMIT_MODE).lower()
+    if mode == "async":
+        try:
+            result = svc.submit_answer_async(user_id, question_id, audio)
+        except JobQueueFull as e:
+            return jsonify({"error": str(e)}), 503
+        result["timings"] = {"decode_ms": decode_ms}
+        return jsonify(result), 202 if "error" not in result else 400
 
-    try:
-        result = svc.submit_answer(user_id, question_id, audio_path)
-        status = 200 if "error" not in result else 400
-        return jsonify(result), status
-    finally:
-        # Best-effort cleanup
+    result = svc.submit_answer(user_id, question_id, audio)
+    result.setdefault("timings", {})["decode_ms"] = decode_ms
+    status = 200 if "error" not in result else 400
+    return jsonify(result), status
+
+
+@round1_bp.route("/submit-answer/<int:question_id>/stream", methods=["POST"])
+@auth_required
+def submit_answer_stream(question_id):
+    """Server-Sent Events variant of submit-answer.
+
+    Emits ``transcript``, ``feedback`` (``{"delta": ...}`` as the model writes
+    it), ``evaluation``, ``result`` (same payload as submit-answer) and finally
+    ``done``. Errors after the stream has started arrive as an ``error`` event.
+    """
+    user_id = g.current_user.id
+    audio, decode_ms, error = _decode_request_audio(user_id, question_id)
+    if error:
+        return error
+
+    def events():
         try:
-            os.remove(audio_path)
+            for event, data in svc.submit_answer_stream(user_id, question_id, audio):
+                if event == "result":
+                    data.setdefault("timings", {})["decode_ms"] = decode_ms
+                yield _sse(event, data)
         except Exception:
-            pass
+            logger.exception("SSE submit-answer failed question_id=%s", question_id)
+            yield _sse("error", {"error": "Evaluation failed"})
+        yield _sse("done", {})
+
+    return Response(
+        stream_with_context(events()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@round1_bp.route("/answer-chunk/<int:question_id>", methods=["POST"])
+@auth_required
+def answer_chunk(question_id):
+    """Streamed answer upload: form fields ``seq`` (0-based) and ``final``, file ``audio``.
+
+    Chunks are transcribed as they arrive. The final chunk (which may carry no
+    audio) returns the same payload as submit-answer, or a job id in async mode.
+    """
+    user_id = g.current_user.id
+    seq = request.form.get("seq", type=int)
+    final = get_bool(request.form.get("final"))
+    audio_file = request.files.get("audio")
+    chunk = audio_file.read() if audio_file else b""
+    if seq is None:
+        return jsonify({"error": "Chunk sequence number required"}), 400
+
+    if chunk or not final:
+        # No point transcribing a segment on the final chunk; finish() takes the whole tail
+        result = svc.append_answer_chunk(user_id, question_id, chunk, seq, transcribe=not final)
+        if "error" in result:
+            return jsonify(result), 400
+        if not final:
+            return jsonify(result), 200
+
+    mode = (request.args.get("mode") or Settings.ROUND1_SUBMIT_MODE).lower()
+    if mode == "async":
+        try:
+            result = svc.finish_answer_stream_async(user_id, question_id)
+        except JobQueueFull as e:
+            return jsonify({"error": str(e)}), 503
+        return jsonify(result), 202
+    result = svc.finish_answer_stream(user_id, question_id)
+    status = 200 if "error" not in result else 400
+    return jsonify(result), status
+
+
+@round1_bp.route("/jobs/<job_id>", methods=["GET"])
+@auth_required
+def get_job(job_id):
+    """Poll an async submit-answer job; ?wait=<seconds> long-polls until it finishes."""
+    user_id = g.current_user.id
+    wait = min(max(request.args.get("wait", default=0.0, type=float), 0.0), Settings.ROUND1_JOB_MAX_WAIT)
+    job = svc.get_job(user_id, job_id, wait=wait)
+    if not job:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(job), 200
 
 
 @round1_bp.route("/end-interview", methods=["POST"])
@@ -69,17 +227,23 @@ def end_interview():
 def get_summary():
     user_id = g.current_user.id
     summary = svc.get_summary(user_id)
-    return jsonify(summary or {"message": "Summary not available"}), 200
+    if not summary:
+        return jsonify({"message": "Summary not available"}), 200
+    return jsonify(select(summary, requested_fields(None))), 200
 
 
 @round1_bp.route("/get-interview-status", methods=["GET"])
 @auth_required
 def get_status():
-    """Return overall interview + round 1 progress."""
+    """Return overall interview + round 1 progress.
+
+    Polled, so ``round_1_summary`` carries only STATUS_SUMMARY_FIELDS unless
+    ``?fields=`` asks for more keys (``*`` for the full summary).
+    """
     user_id = g.current_user.id
     summary = svc.get_summary(user_id)
     return jsonify({
         "user_id": user_id,
     "status": "in_progress" if summary else "not_started",
-        "round_1_summary": summary
+        "round_1_summary": select(summary, requested_fields(STATUS_SUMMARY_FIELDS))
     })
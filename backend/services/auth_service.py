@@ -3,7 +3,10 @@ from typing import Tuple, Optional
 from flask import jsonify, make_response, Request
 
 from config.db import db
-from models.user import User
+from models.user import USER_DEFAULT_FIELDS, USER_FIELDS, User
+from utils.fieldsets import requested_fields
+from utils.identity_cache import IDENTITY_FIELDS, Identity, invalidate_identity
+from utils.password_hasher import PasswordHasherBusy
 from utils.JWT_token import (
 	create_access_token,
 	create_refresh_token,
@@ -31,6 +34,12 @@ def _validate_password(password: str) -> Optional[str]:
 	return None
 
 
+def _busy():
+	resp = make_response(jsonify({"error": "Server busy, please retry"}), 503)
+	resp.headers["Retry-After"] = "1"
+	return resp
+
+
 def register_service(req_json: dict):
 	name = (req_json.get("name") or "").strip()
 	email = (req_json.get("email") or "").strip().lower()
@@ -49,7 +58,10 @@ def register_service(req_json: dict):
 		return jsonify({"error": "Email already registered"}), 409
 
 	user = User(name=name, email=email)
-	user.set_password(password)
+	try:
+		user.set_password(password)
+	except PasswordHasherBusy:
+		return _busy()
 
 	db.session.add(user)
 	db.session.commit()
@@ -58,6 +70,11 @@ def register_service(req_json: dict):
 	return jsonify({"message": "User registered successfully"}), 201
 
 
+def _user_payload(user: User) -> dict:
+	"""``user.to_dict()`` narrowed to the request's ``?fields=`` (id, name, email by default)."""
+	return user.to_dict(requested_fields(USER_DEFAULT_FIELDS, USER_FIELDS))
+
+
 def login_service(req_json: dict):
 	email = (req_json.get("email") or "").strip().lower()
 	password = req_json.get("password") or ""
@@ -66,10 +83,15 @@ def login_service(req_json: dict):
 		return jsonify({"error": "Email and password are required"}), 400
 
 	user: Optional[User] = User.find_by_email(email)
-	if not user or not user.check_password(password):
-		return jsonify({"error": "Invalid credentials"}), 401
-
-	access = create_access_token(user.id)
+	try:
+		if not user or not user.check_password(password):
+			return jsonify({"error": "Invalid credentials"}), 401
+		# Committed together with the refresh token below
+		user.rehash_password_if_needed(password)
+	except PasswordHasherBusy:
+		return _busy()
+
+	access = create_access_token(user.id, user.token_version)
 	refresh = create_refresh_token(user.id)
 
 	# Persist refresh token
@@ -79,7 +101,7 @@ def login_service(req_json: dict):
 	resp = make_response(
 		jsonify(
 			{
-				"user": user.to_dict(),
+				"user": _user_payload(user),
 				"access_token": access,
 				"refresh_token": refresh,
 			}
@@ -106,30 +128,66 @@ def refresh_service(req: Request):
 	if not user or user.refresh_token != token:
 		return jsonify({"error": "Token revoked"}), 401
 
-	new_access = create_access_token(user.id)
+	new_access = create_access_token(user.id, user.token_version)
 	resp = make_response(
-		jsonify({"access_token": new_access, "user": user.to_dict()})
+		jsonify({"access_token": new_access, "user": _user_payload(user)})
 	)
 	set_token_cookies(resp, access_token=new_access)
 	return resp, 200
 
 
-def me_service(user: User):
+def me_service(user):
 	if not user:
 		return jsonify({"error": "Unauthorized"}), 401
-	# Always fetch freshest data
+	fields = requested_fields(USER_DEFAULT_FIELDS, USER_FIELDS)
+	if isinstance(user, Identity) and fields <= IDENTITY_FIELDS:
+		# Cached mode: the identity already holds every requested column
+		return jsonify({"user": {key: getattr(user, key) for key in USER_FIELDS if key in fields}}), 200
 	fresh = User.find_by_id(user.id)
 	if not fresh:
 		return jsonify({"error": "User not found"}), 404
-	return jsonify({"user": fresh.to_dict()}), 200
+	return jsonify({"user": _user_payload(fresh)}), 200
+
+
+def change_password_service(user, req_json: dict):
+	if not user:
+		return jsonify({"error": "Unauthorized"}), 401
+	current = req_json.get("current_password") or ""
+	new_password = req_json.get("new_password") or ""
+
+	pw_err = _validate_password(new_password)
+	if pw_err:
+		return jsonify({"error": pw_err}), 400
+	db_user = User.find_by_id(user.id)
+	try:
+		if not db_user or not db_user.check_password(current):
+			return jsonify({"error": "Invalid credentials"}), 401
+		# Bumps token_version: every other session's access token stops verifying
+		db_user.set_password(new_password)
+	except PasswordHasherBusy:
+		return _busy()
+	access = create_access_token(db_user.id, db_user.token_version)
+	refresh = create_refresh_token(db_user.id)
+	db_user.refresh_token = refresh
+	db.session.commit()
+	invalidate_identity(db_user.id)
+
+	resp = make_response(jsonify({"message": "Password changed", "access_token": access, "refresh_token": refresh}))
+	set_token_cookies(resp, access_token=access, refresh_token=refresh)
+	return resp, 200
 
 
-def logout_service(user: Optional[User]):
+def logout_service(user):
 	# Logout should be idempotent
 	if user:
-		# Clear stored refresh token
-		user.refresh_token = None
-		db.session.commit()
+		# g.current_user may be a cached Identity; update the real row
+		db_user = User.find_by_id(user.id)
+		if db_user:
+			# Clear stored refresh token and revoke outstanding access tokens
+			db_user.refresh_token = None
+			db_user.token_version = (db_user.token_version or 0) + 1
+			db.session.commit()
+		invalidate_identity(user.id)
 
 	resp = make_response(jsonify({"message": "Logged out"}))
 	clear_token_cookies(resp)
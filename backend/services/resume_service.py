@@ -1,7 +1,14 @@
-from utils.resume_parser import parse_resume
+import logging
+
+from chains.profile_extractor import ProfileExtractorChain
+from config.settings import Settings, get_bool
+from utils.llm_metrics import llm_call_context
+from utils.resume_parser import ResumeTooLarge, parse_resume
 from models.user import User
 from config.db import db
 
+logger = logging.getLogger(__name__)
+
 class ResumeService:
     def __init__(self):
         pass
@@ -12,7 +19,7 @@ class ResumeService:
         if file.filename == '':
             raise ValueError("No file selected")
         
-        user = User.find_by_id(user_id)
+        user = User.find_with_documents(user_id)
         if not user:
             raise ValueError("User not found")
 
@@ -30,6 +37,8 @@ class ResumeService:
 
             user.resume_text = parsed_resume["text"]
             user.job_description = job_description
+            with llm_call_context(user.id):
+                user.candidate_profile = self.build_profile(user.resume_text, job_description)
             db.session.commit()
 
             return {
@@ -38,12 +47,24 @@ class ResumeService:
                 "job_description": user.job_description
             }
 
+        except ResumeTooLarge:
+            raise
         except Exception as e:
             raise ValueError("Error processing resume")
         
 
+    def build_profile(self, resume_text, job_description):
+        """Extract the compact candidate profile once; prompts fall back to raw text on failure."""
+        if not get_bool(Settings.CANDIDATE_PROFILE_ENABLED):
+            return None
+        try:
+            return ProfileExtractorChain().extract_profile(resume_text or "", job_description or "")
+        except Exception:
+            logger.exception("Candidate profile extraction failed")
+            return None
+
     def get_resume_and_jd(self, user_id):
-        user = User.find_by_id(user_id)
+        user = User.find_with_documents(user_id)
         if not user:
             raise ValueError("User not found")
         
@@ -0,0 +1,141 @@
+import asyncio
+import contextvars
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Optional, Union
+
+from config.settings import Settings
+from services.round1_service import Round1Service
+from utils.llm_metrics import llm_call_context
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class Round1AsyncService:
+    """Async variants of the LLM-bound round 1 steps, served by ``asgi.py``.
+
+    Model calls are awaited with ``ainvoke``, so a waiting interview step costs a
+    coroutine instead of a thread. DB work and gTTS run on a bounded thread pool
+    and Whisper on a smaller one. Each blocking step gets its own app context
+    and reuses the stages of ``Round1Service``, so both paths store the same data.
+    """
+
+    def __init__(self, app, blocking_workers: int, stt_workers: int):
+        self.app = app
+        self.sync = Round1Service()
+        self.utils = self.sync.utils
+        self._blocking = ThreadPoolExecutor(max_workers=max(1, blocking_workers), thread_name_prefix="round1-io")
+        self._stt = ThreadPoolExecutor(max_workers=max(1, stt_workers), thread_name_prefix="round1-stt")
+
+    def _in_app(self, fn, *args):
+        with self.app.app_context():
+            return fn(*args)
+
+    async def _run(self, fn, *args, executor: Optional[ThreadPoolExecutor] = None):
+        """Run ``fn(*args)`` in a fresh app context on a worker thread, keeping contextvars."""
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        return await loop.run_in_executor(executor or self._blocking, ctx.run, self._in_app, fn, *args)
+
+    async def run_blocking(self, fn, *args):
+        return await self._run(fn, *args)
+
+    async def start_round_1(self, user_id: int, include_audio: bool = False) -> Dict:
+        ctx = await self._run(self.sync._prepare_start, user_id)
+        if "error" in ctx:
+            return ctx
+        texts = ctx["pooled"]
+        if texts is None:
+            texts = await self.utils.agenerate_question_texts(
+                ctx["resume"], ctx["jd"], 5, user_id, ctx["round_id"]
+            )
+        return await self._run(self.sync._finish_start, user_id, ctx, texts, include_audio)
+
+    def _load_answer_context(self, user_id: int, question_id: int) -> Dict:
+        q = self.utils.load_question_context(question_id, user_id, with_questions=False)
+        if not q:
+            return {"error": "Invalid question"}
+        resume, jd = self.utils.prompt_context(q.round.interview.user)
+        return {"question_text": q.question_text, "round_id": q.round_id, "resume": resume, "jd": jd}
+
+    def _store_step(self, user_id: int, question_id: int, transcript: str, eval_json: Dict,
+                    eval_ms: float, deferred: bool) -> Dict:
+        q = self.utils.load_question_context(question_id, user_id, with_questions=False)
+        if not self.sync._store_answer(q, transcript, eval_json):
+            return {"result": self.sync._pending_result(question_id, transcript, eval_json, eval_ms, deferred)}
+        q = self.utils.load_question_context(question_id, user_id)
+        messages, call_site, version = self.utils.completion_request(q.round, q.round.interview.user, deferred)
+        return {"request": (messages, call_site, version)}
+
+    def _complete_step(self, user_id: int, question_id: int, transcript: str, eval_ms: float,
+                       deferred: bool, content: Optional[str]) -> Dict:
+        return self.sync._complete_round(user_id, question_id, transcript, eval_ms, deferred, content)
+
+    async def submit_answer(self, user_id: int, question_id: int, audio: Union[str, "np.ndarray"]) -> Dict:
+        """Transcribe (thread), evaluate (awaited) and store an answer; same payload as the sync path."""
+        ctx = await self._run(self._load_answer_context, user_id, question_id)
+        if "error" in ctx:
+            return ctx
+
+        started = time.perf_counter()
+        transcript = await self._run(self.utils.speech_to_text, audio, executor=self._stt)
+        stt_ms = (time.perf_counter() - started) * 1000
+
+        deferred = self.sync._deferred_eval()
+        started = time.perf_counter()
+        eval_json: Dict = {}
+        if not deferred:
+            with llm_call_context(user_id, ctx["round_id"]):
+                eval_json = await self.utils.aevaluate_answer(ctx["question_text"], transcript, ctx["resume"], ctx["jd"])
+        eval_ms = (time.perf_counter() - started) * 1000
+
+        step = await self._run(self._store_step, user_id, question_id, transcript, eval_json, eval_ms, deferred)
+        if "result" in step:
+            result = step["result"]
+        else:
+            messages, call_site, version = step["request"]
+            with llm_call_context(user_id, ctx["round_id"]):
+                content = await self.utils._ainvoke_llm(messages, call_site, version)
+            result = await self._run(
+                self._complete_step, user_id, question_id, transcript, eval_ms, deferred, content
+            )
+        result.setdefault("timings", {})["stt_ms"] = round(stt_ms, 1)
+        return result
+
+    def _end_prepare(self, user_id: int) -> Dict:
+        user, round1 = self.sync._round_context(user_id)
+        if not user:
+            return {"error": "User not found"}
+        messages, call_site, version = self.utils.completion_request(round1, user, self.sync._deferred_eval())
+        return {"round_id": round1.id, "request": (messages, call_site, version)}
+
+    def _end_finish(self, user_id: int, content: Optional[str]) -> Dict:
+        user, round1 = self.sync._round_context(user_id)
+        if self.sync._deferred_eval():
+            return self.utils.evaluate_round_batch(round1, user, content=content)
+        return self.utils.summarize_round(round1, user, content=content)
+
+    async def end_round_1(self, user_id: int) -> Dict:
+        """Force-complete round 1; the summary (or batch evaluation) call is awaited."""
+        step = await self._run(self._end_prepare, user_id)
+        if "error" in step:
+            return step
+        messages, call_site, version = step["request"]
+        with llm_call_context(user_id, step["round_id"]):
+            content = await self.utils._ainvoke_llm(messages, call_site, version)
+        return await self._run(self._end_finish, user_id, content)
+
+    async def get_question_audio(self, user_id: int) -> Optional[Dict]:
+        # gTTS is a blocking HTTP call; keep it off the event loop
+        return await self._run(self.sync.get_question_audio, user_id)
+
+
+_service: Optional[Round1AsyncService] = None
+
+
+def get_async_service(app) -> Round1AsyncService:
+    global _service
+    if _service is None:
+        _service = Round1AsyncService(app, Settings.ASYNC_BLOCKING_WORKERS, Settings.ASYNC_STT_WORKERS)
+    return _service
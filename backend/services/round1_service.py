@@ -1,19 +1,45 @@
-from typing import Dict, Optional, List
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, List, Tuple, Union
 import logging
+import time
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
+from flask import current_app
+
+from config.settings import Settings, get_bool
 from models import db, User, Interview, InterviewRound, InterviewQuestion
+from utils.answer_stream import AnswerStream, AnswerStreamError
 from utils.interview_shared import InterviewUtils
+from utils.job_queue import get_job_queue
+from utils.llm_metrics import llm_call_context
+from utils.question_pool import get_question_pool
+
+if TYPE_CHECKING:
+    import numpy as np
 
 class Round1Service:
 
     def __init__(self):
         self.utils = InterviewUtils()
 
-    def start_round_1(self, user_id: int) -> Dict:
+    def start_round_1(self, user_id: int, include_audio: bool = False) -> Dict:
+        ctx = self._prepare_start(user_id)
+        if "error" in ctx:
+            return ctx
+        texts = ctx["pooled"]
+        if texts is None:
+            texts = self.utils.generate_question_texts(User.find_with_documents(user_id), 5, ctx["round_id"])
+        return self._finish_start(user_id, ctx, texts, include_audio)
+
+    def _prepare_start(self, user_id: int) -> Dict:
+        """Validate, reset round 1 and take a pooled question set.
 
+        Returns plain data (ids, prompt context, pooled texts or None) so the
+        async service can run question generation outside this DB step.
+        """
         logger = logging.getLogger(__name__)
         logger.info("ROUND1 start called user_id=%s", user_id)
-        user = User.find_by_id(user_id)
+        user = User.find_with_documents(user_id)
         if not user:
             logger.error("ROUND1 start: user not found user_id=%s", user_id)
             return {"round_status": "error", "error": "User not found"}
@@ -26,118 +52,468 @@ class Round1Service:
             )
             return {"round_status": "error", "error": "Resume and job description are required"}
 
+        # Read everything needed from the user before the commits below expire it
+        resume, jd = self.utils.prompt_context(user)
+        pool = get_question_pool()
+        pooled = pool.take(user, 1) if pool else None
+        logger.info("ROUND1 start: question pool %s user_id=%s", "hit" if pooled else "miss", user_id)
+
         interview = self.utils.ensure_or_create_interview(user_id)
+        interview_id = interview.id
 
         # Reset round 1 questions to ensure unique retry set
         round1: Optional[InterviewRound] = InterviewRound.query.filter_by(
-            interview_id=interview.id, round_number=1
+            interview_id=interview_id, round_number=1
         ).first()
         if round1:
-            InterviewQuestion.query.filter_by(round_id=round1.id).delete()
+            round_id = round1.id
+            InterviewQuestion.query.filter_by(round_id=round_id).delete()
             round1.status = "in_progress"
             round1.started_at = round1.started_at or db.func.now()
             round1.completed_at = None
             round1.result_json = None
+            round1.generation_status = None
+            round1.generation_started_at = None
             db.session.commit()
         else:
-            round1 = self.utils.start_round(interview, round_number=1)
+            round_id = self.utils.start_round(interview, round_number=1).id
+
+        return {
+            "interview_id": interview_id,
+            "round_id": round_id,
+            "pooled": pooled,
+            "resume": resume,
+            "jd": jd,
+        }
 
-        created: List[InterviewQuestion] = self.utils.generate_and_store_questions(user, round1, num_q=5)
+    def _finish_start(self, user_id: int, ctx: Dict, texts: List[str], include_audio: bool) -> Dict:
+        """Store the generated questions, presynthesize audio and build the response."""
+        logger = logging.getLogger(__name__)
+        created: List[InterviewQuestion] = self.utils.generate_and_store_questions(
+            None, ctx["round_id"], num_q=5, texts=texts
+        )
+        pool = get_question_pool()
+        if pool:
+            # Have the next retry's questions ready before the candidate asks for them
+            pool.refill_async(current_app._get_current_object(), user_id, 1)
+        if created and get_bool(Settings.TTS_PRESYNTHESIZE):
+            ready = self.utils.presynthesize_audio(created)
+            logger.info("ROUND1 start: presynthesized audio %s/%s", ready, len(created))
+            created = self.utils.refresh_questions(created)
 
-        questions_payload = [
-            {"id": q.id, "text": q.question_text} for q in created
-        ]
+        questions_payload = []
+        for q in created:
+            item = {"id": q.id, "text": q.question_text}
+            if include_audio:
+                item["audio_url"] = q.audio_url
+            questions_payload.append(item)
 
         if not questions_payload:
             logger.warning(
-                "ROUND1 start: empty question set user_id=%s round_id=%s", user_id, round1.id
+                "ROUND1 start: empty question set user_id=%s round_id=%s", user_id, ctx["round_id"]
             )
             return {
-                "interview_id": interview.id,
-                "round_id": round1.id,
+                "interview_id": ctx["interview_id"],
+                "round_id": ctx["round_id"],
                 "round_status": "error",
                 "message": "Question generation failed",
                 "questions": [],
             }
 
         result = {
-            "interview_id": interview.id,
-            "round_id": round1.id,
+            "interview_id": ctx["interview_id"],
+            "round_id": ctx["round_id"],
             "round_status": "in_progress",
             "questions": questions_payload,
         }
         logger.info(
             "ROUND1 start: success user_id=%s round_id=%s qcount=%s",
             user_id,
-            round1.id,
+            ctx["round_id"],
             len(questions_payload),
         )
         return result
 
 
+    def start_round_1_stream(self, user_id: int, include_audio: bool = False) -> Iterator[Tuple[str, Dict]]:
+        """Streaming ``start_round_1``: yields ``(event, data)`` pairs for the SSE route.
+
+        Events: ``round`` once the round is reset, then one ``question`` per
+        question as soon as the model has finished writing it (already stored,
+        so the candidate can fetch and answer it), then ``done`` with the same
+        payload ``start_round_1`` returns. Failures are reported as ``error``.
+
+        Audio for the first question is synthesized before it is sent; the
+        rest go to a small TTS pool and their URLs are stored before ``done``.
+        """
+        logger = logging.getLogger(__name__)
+        ctx = self._prepare_start(user_id)
+        if "error" in ctx:
+            yield "error", ctx
+            return
+        yield "round", {"interview_id": ctx["interview_id"], "round_id": ctx["round_id"], "round_status": "in_progress"}
+
+        if ctx["pooled"] is not None:
+            result = self._finish_start(user_id, ctx, ctx["pooled"], include_audio)
+            for index, item in enumerate(result["questions"]):
+                yield "question", dict(item, index=index)
+            yield ("done" if result["questions"] else "error"), result
+            return
+
+        user = User.find_with_documents(user_id)
+        round1 = db.session.get(InterviewRound, ctx["round_id"])
+        # Keeps the round from completing while later questions are still on their way
+        round1.generation_status = "streaming"
+        round1.generation_started_at = datetime.utcnow()
+        db.session.commit()
+
+        presynth = get_bool(Settings.TTS_PRESYNTHESIZE)
+        tts_pool = (
+            ThreadPoolExecutor(max_workers=max(1, Settings.TTS_PRESYNTH_WORKERS), thread_name_prefix="tts-presynth")
+            if presynth else None
+        )
+        created: List[InterviewQuestion] = []
+        pending = []
+        try:
+            for text in self.utils.stream_question_texts(user, 5, round1.id):
+                q = InterviewQuestion(round_id=round1.id, question_text=text)
+                if presynth and not created:
+                    q.audio_url = self.utils.presynthesize_one(text)
+                db.session.add(q)
+                db.session.commit()
+                if presynth and created:
+                    pending.append((q, tts_pool.submit(self.utils.presynthesize_one, text)))
+                created.append(q)
+                item = {"id": q.id, "text": q.question_text, "index": len(created) - 1}
+                if include_audio:
+                    item["audio_url"] = q.audio_url
+                yield "question", item
+        except Exception:
+            logger.exception("ROUND1 start (stream): generation failed user_id=%s round_id=%s", user_id, round1.id)
+        finally:
+            for q, future in pending:
+                q.audio_url = future.result()
+            if tts_pool:
+                tts_pool.shutdown()
+            round1.generation_status = None
+            round1.generation_started_at = None
+            db.session.commit()
+
+        # Answers stored while streaming could not complete the round. If every
+        # question is answered by now (generation failed part way, or the
+        # candidate caught up with it), complete it here.
+        completed = None
+        if created and not self.utils.has_unanswered(ctx["round_id"]):
+            last = created[-1]
+            completed = self._complete_round(user_id, last.id, last.answer_text or "", 0.0, self._deferred_eval())
+
+        if not created:
+            logger.warning("ROUND1 start: empty question set user_id=%s round_id=%s", user_id, round1.id)
+            yield "error", {
+                "interview_id": ctx["interview_id"],
+                "round_id": round1.id,
+                "round_status": "error",
+                "message": "Question generation failed",
+                "questions": [],
+            }
+            return
+
+        pool = get_question_pool()
+        if pool:
+            pool.refill_async(current_app._get_current_object(), user_id, 1)
+        questions_payload = []
+        for q in created:
+            item = {"id": q.id, "text": q.question_text}
+            if include_audio:
+                item["audio_url"] = q.audio_url
+            questions_payload.append(item)
+        logger.info(
+            "ROUND1 start (stream): success user_id=%s round_id=%s qcount=%s", user_id, round1.id, len(created)
+        )
+        done = {
+            "interview_id": ctx["interview_id"],
+            "round_id": round1.id,
+            "round_status": "in_progress",
+            "questions": questions_payload,
+        }
+        if completed:
+            done.update(completed=True, summary=completed["summary"])
+        yield "done", done
+
+    def _round_context(self, user_id: int) -> Tuple[Optional[User], Optional[InterviewRound]]:
+        """Round 1 with its interview, user and questions eager-loaded; creates it on first use."""
+        round1 = self.utils.load_round_context(user_id, 1)
+        if round1 is not None:
+            if round1.status == "pending":
+                self.utils.start_round(round1.interview, 1)
+            return round1.interview.user, round1
+        user = User.find_with_documents(user_id)
+        if not user:
+            return None, None
+        interview = self.utils.ensure_or_create_interview(user_id)
+        return user, self.utils.start_round(interview, 1)
+
     def get_question_audio(self, user_id: int) -> Optional[Dict]:
-        user = User.find_by_id(user_id)
+        user, round1 = self._round_context(user_id)
         if not user:
             return {"error": "User not found"}
-        interview = self.utils.ensure_or_create_interview(user_id)
-        round1 = self.utils.start_round(interview, 1)
 
         q = self.utils.get_next_unanswered(round1)
         if not q:
+            if round1.is_streaming(Settings.QUESTION_STREAM_TIMEOUT):
+                # A streaming start is still writing the next question; the client retries
+                return {
+                    "round_status": "generating",
+                    "message": "Next question is still being generated",
+                    "retry_after": Settings.QUESTION_STREAM_RETRY_AFTER,
+                }
             return None
-        audio_url = self.utils.text_to_speech(q.question_text, filename=f"q_{q.id}")
-        return {"question_id": q.id, "text": q.question_text, "audio_url": audio_url}
+        # Pre-synthesized audio is a lookup; synthesize lazily if it failed or was evicted
+        audio_url = q.audio_url and self.utils.cached_audio_url(q.question_text)
+        result = {"question_id": q.id, "text": q.question_text, "audio_url": audio_url}
+        if not audio_url:
+            result["audio_url"] = audio_url = self.utils.text_to_speech(q.question_text)
+            if q.audio_url != audio_url:
+                q.audio_url = audio_url
+                db.session.commit()
+        return result
 
-    def submit_answer(self, user_id: int, question_id: int, audio_file_path: str) -> Dict:
-        user = User.find_by_id(user_id)
-        if not user:
-            return {"error": "User not found"}
+    def submit_answer(self, user_id: int, question_id: int, audio: Union[str, "np.ndarray"]) -> Dict:
+        """Transcribe and evaluate an answer.
 
-        q: Optional[InterviewQuestion] = InterviewQuestion.query.get(question_id)
-        if not q or q.round.interview.user_id != user_id:
+        ``audio`` is either a file path or a 16 kHz mono float32 array that was
+        already decoded in memory by the route.
+        """
+        q = self.utils.load_question_context(question_id, user_id)
+        if not q:
             return {"error": "Invalid question"}
 
-        transcript = self.utils.speech_to_text(audio_file_path)
-        eval_json = self.utils.evaluate_answer(
-            q.question_text, transcript, user.resume_text or "", user.job_description or ""
-        )
+        started = time.perf_counter()
+        transcript = self.utils.speech_to_text(audio)
+        stt_ms = (time.perf_counter() - started) * 1000
+        result = self._record_answer(q.round.interview.user, q, transcript)
+        result.setdefault("timings", {})["stt_ms"] = round(stt_ms, 1)
+        return result
+
+    def submit_answer_stream(
+        self, user_id: int, question_id: int, audio: Union[str, "np.ndarray"]
+    ) -> Iterator[Tuple[str, Dict]]:
+        """Streaming ``submit_answer``: yields ``(event, data)`` pairs for the SSE route.
 
+        Events: ``transcript``, then ``feedback`` deltas while the evaluation is
+        generated, then ``evaluation`` (the normalized object that is stored),
+        then ``result`` (the same payload ``submit_answer`` returns). Failures
+        are reported as an ``error`` event.
+        """
+        q = self.utils.load_question_context(question_id, user_id)
+        if not q:
+            yield "error", {"error": "Invalid question"}
+            return
+        user = q.round.interview.user
+
+        started = time.perf_counter()
+        transcript = self.utils.speech_to_text(audio)
+        stt_ms = (time.perf_counter() - started) * 1000
+        yield "transcript", {"question_id": q.id, "transcript": transcript, "stt_ms": round(stt_ms, 1)}
+
+        deferred = self._deferred_eval()
+        started = time.perf_counter()
+        eval_json: Dict = {}
+        if not deferred:
+            resume, jd = self.utils.prompt_context(user)
+            with llm_call_context(user.id, q.round_id):
+                for kind, value in self.utils.stream_evaluation(q.question_text, transcript, resume, jd):
+                    if kind == "feedback":
+                        yield "feedback", {"delta": value}
+                    else:
+                        eval_json = value
+            yield "evaluation", eval_json
+        eval_ms = (time.perf_counter() - started) * 1000
+
+        if self._store_answer(q, transcript, eval_json):
+            result = self._complete_round(user_id, question_id, transcript, eval_ms, deferred)
+        else:
+            result = self._pending_result(question_id, transcript, eval_json, eval_ms, deferred)
+        result.setdefault("timings", {})["stt_ms"] = round(stt_ms, 1)
+        yield "result", result
+
+    def _deferred_eval(self) -> bool:
+        return Settings.ROUND1_EVAL_MODE == "deferred"
+
+    def _record_answer(self, user: User, q: InterviewQuestion, transcript: str) -> Dict:
+        """Evaluate and store a transcribed answer, summarizing the round after the last one.
+
+        In deferred mode (``ROUND1_EVAL_MODE=deferred``) only the transcript is
+        stored here. All answers are evaluated together with the summary once
+        the round is complete.
+        """
+        deferred = self._deferred_eval()
+        started = time.perf_counter()
+        if deferred:
+            eval_json = {}
+        else:
+            resume, jd = self.utils.prompt_context(user)
+            with llm_call_context(user.id, q.round_id):
+                eval_json = self.utils.evaluate_answer(q.question_text, transcript, resume, jd)
+
+        eval_ms = (time.perf_counter() - started) * 1000
+
+        # Read before _store_answer commits, which expires the loaded objects
+        user_id, question_id = user.id, q.id
+        if self._store_answer(q, transcript, eval_json):  # all answered
+            return self._complete_round(user_id, question_id, transcript, eval_ms, deferred)
+        return self._pending_result(question_id, transcript, eval_json, eval_ms, deferred)
+
+    def _store_answer(self, q: InterviewQuestion, transcript: str, eval_json: Dict) -> bool:
+        """Persist the answer; True when it was the round's last unanswered question.
+
+        A round whose questions are still streaming in is never complete; the
+        streamed start completes it if all were answered when it finishes. Both
+        checks run against the database after the commit, so of two answers
+        stored concurrently (or an answer and the end of the stream) at least
+        one sees the round as complete.
+        """
+        round_id = q.round_id
+        round_obj = q.round
+        streaming = round_obj.is_streaming(Settings.QUESTION_STREAM_TIMEOUT)
         q.answer_text = transcript
         q.evaluation_json = eval_json
         db.session.commit()
+        if streaming:
+            # The stream may have ended while this answer was stored; the commit expired round_obj
+            streaming = round_obj.is_streaming(Settings.QUESTION_STREAM_TIMEOUT)
+        return not streaming and not self.utils.has_unanswered(round_id)
 
+    def _complete_round(
+        self, user_id: int, question_id: int, transcript: str, eval_ms: float, deferred: bool,
+        content: Optional[str] = None,
+    ) -> Dict:
+        """Summarize (or batch-evaluate) the finished round; ``content`` is a pre-fetched LLM response."""
+        q = self.utils.load_question_context(question_id, user_id)
         round_obj = q.round
-        remaining = self.utils.get_next_unanswered(round_obj)
-        if not remaining:  # all answered
-            summary = self.utils.summarize_round(round_obj, user)
-            # If passed, mark interview eligible for round 2
-            interview = round_obj.interview
-            if summary.get("pass"):
-                interview.status = "in_progress"  # still overall in progress, but eligible for R2
-            else:
-                interview.status = "failed"
-            db.session.commit()
-            return {
-                "question_id": q.id,
-                "transcript": transcript,
-                "evaluation": eval_json,
-                "completed": True,
-                "summary": summary,
+        interview = round_obj.interview
+        round_number = round_obj.round_number
+        started = time.perf_counter()
+        if deferred:
+            summary = self.utils.evaluate_round_batch(round_obj, interview.user, content=content)
+        else:
+            summary = self.utils.summarize_round(round_obj, interview.user, content=content)
+        summary_ms = (time.perf_counter() - started) * 1000
+        # If passed, mark interview eligible for round 2
+        if summary.get("pass"):
+            interview.status = "in_progress"  # still overall in progress, but eligible for R2
+        else:
+            interview.status = "failed"
+        db.session.commit()
+        pool = get_question_pool()
+        if pool:
+            pool.refill_async(current_app._get_current_object(), user_id, round_number)
+        if deferred:
+            # One reload instead of a refresh per expired question
+            q = self.utils.load_question_context(question_id, user_id)
+        result = {
+            "question_id": question_id,
+            "transcript": transcript,
+            "evaluation": q.evaluation_json,
+            "completed": True,
+            "summary": summary,
+            "timings": {"eval_ms": round(eval_ms, 1), "summary_ms": round(summary_ms, 1)},
+        }
+        if deferred:
+            result["evaluations"] = {
+                str(item.id): item.evaluation_json for item in q.round.questions if item.evaluation_json
             }
+        return result
+
+    @staticmethod
+    def _pending_result(question_id: int, transcript: str, eval_json: Dict, eval_ms: float, deferred: bool) -> Dict:
         return {
-            "question_id": q.id,
+            "question_id": question_id,
             "transcript": transcript,
-            "evaluation": eval_json,
+            "evaluation": eval_json or None,
+            "evaluation_pending": deferred,
             "completed": False,
+            "timings": {"eval_ms": round(eval_ms, 1)},
         }
 
+    def submit_answer_async(self, user_id: int, question_id: int, audio: Union[str, "np.ndarray"]) -> Dict:
+        """Queue transcription + evaluation and return a job id right away.
+
+        Raises ``JobQueueFull`` if the worker pool is saturated.
+        """
+        if not self.utils.load_question_context(question_id, user_id, with_questions=False):
+            return {"error": "Invalid question"}
+
+        job_id = get_job_queue().submit(
+            current_app._get_current_object(),
+            user_id,
+            self.submit_answer,
+            user_id,
+            question_id,
+            audio,
+        )
+        return {"question_id": question_id, "job_id": job_id, "status": "queued"}
+
+    def get_job(self, user_id: int, job_id: str, wait: float = 0) -> Optional[Dict]:
+        """Return job status/result for the owner, long-polling up to ``wait`` seconds."""
+        queue = get_job_queue()
+        job = queue.get(job_id)
+        if not job or job["owner_id"] != user_id:
+            return None
+        if wait > 0:
+            job = queue.get(job_id, wait=wait) or job
+        job.pop("owner_id", None)
+        return job
+
+    def append_answer_chunk(
+        self, user_id: int, question_id: int, chunk: bytes, seq: int, transcribe: bool = True
+    ) -> Dict:
+        """Store one chunk of a streamed answer and return the running partial transcript."""
+        if not self.utils.load_question_context(question_id, user_id, with_questions=False):
+            return {"error": "Invalid question"}
+
+        stream = AnswerStream(user_id, question_id)
+        with stream.lock:
+            try:
+                stream.append(chunk, seq)
+            except AnswerStreamError as e:
+                return {"error": str(e)}
+            partial = stream.advance() if transcribe else stream.partial_text()
+        return {"question_id": question_id, "seq": seq, "partial_transcript": partial, "final": False}
+
+    def finish_answer_stream(self, user_id: int, question_id: int) -> Dict:
+        """Transcribe the uncommitted tail of a streamed answer, then evaluate it."""
+        q = self.utils.load_question_context(question_id, user_id)
+        if not q:
+            return {"error": "Invalid question"}
+
+        stream = AnswerStream(user_id, question_id)
+        with stream.lock:
+            try:
+                transcript = stream.finish()
+            except AnswerStreamError as e:
+                return {"error": str(e)}
+            stream.discard()
+        return self._record_answer(q.round.interview.user, q, transcript)
+
+    def finish_answer_stream_async(self, user_id: int, question_id: int) -> Dict:
+        """Queue ``finish_answer_stream`` on the job pool and return a job id."""
+        job_id = get_job_queue().submit(
+            current_app._get_current_object(),
+            user_id,
+            self.finish_answer_stream,
+            user_id,
+            question_id,
+        )
+        return {"question_id": question_id, "job_id": job_id, "status": "queued"}
+
     def end_round_1(self, user_id: int) -> Dict:
         """Force-complete round 1 by summarizing current answers."""
-        user = User.find_by_id(user_id)
+        user, round1 = self._round_context(user_id)
         if not user:
             return {"error": "User not found"}
-        interview = self.utils.ensure_or_create_interview(user_id)
-        round1 = self.utils.start_round(interview, 1)
+        if self._deferred_eval():
+            return self.utils.evaluate_round_batch(round1, user)
         return self.utils.summarize_round(round1, user)
 
     def get_summary(self, user_id: int) -> Optional[Dict]:
@@ -0,0 +1,55 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Tests import the backend packages (config, models, utils, ...) the way app.py does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Settings reads the environment once, when config.settings is first imported, so
+# the test configuration is fixed here, before any test module imports the app
+_workdir = tempfile.mkdtemp(prefix="interview_tests_")
+os.environ.update({
+    "DATABASE_URL": f"sqlite:///{os.path.join(_workdir, 'app.db')}",
+    "JWT_SECRET": "test-secret",
+    "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY") or "sk-test",
+    "TTS_PRESYNTHESIZE": "False",
+    "QUESTION_POOL_DEPTH": "0",
+    "LLM_CACHE_ENABLED": "False",
+    "RESUME_CACHE_ENABLED": "False",
+    "AUTH_VERIFY_MODE": "cached",
+    "ANSWER_STREAM_DIR": os.path.join(_workdir, "streams"),
+    "LLM_CACHE_PATH": os.path.join(_workdir, "llm_cache.db"),
+    "RESUME_CACHE_PATH": os.path.join(_workdir, "resume_cache.db"),
+    "ROUND1_JOB_STORE_PATH": os.path.join(_workdir, "round1_jobs.db"),
+})
+
+
+@pytest.fixture(scope="session")
+def app():
+    """The Flask app on a throwaway SQLite database, with the model, Whisper and gTTS stubbed."""
+    pytest.importorskip("flask")
+    from benchmarks._common import load_app, stub_external_calls
+
+    app = load_app(os.environ["DATABASE_URL"])
+    stub_external_calls(5)
+    return app
+
+
+@pytest.fixture(scope="module")
+def statement_counter(app):
+    """``{"n": ...}`` counting the SQL statements sent to the database; reset it before a request."""
+    from sqlalchemy import event
+    from config.db import db
+
+    counter = {"n": 0}
+    with app.app_context():
+        engine = db.engine
+
+    def count(*_):
+        counter["n"] += 1
+
+    event.listen(engine, "before_cursor_execute", count)
+    yield counter
+    event.remove(engine, "before_cursor_execute", count)
@@ -0,0 +1,68 @@
+import io
+import json
+
+import pytest
+
+from benchmarks._common import make_sample, seed_round, seed_user
+
+
+def parse_sse(body: str):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+@pytest.fixture(scope="module")
+def audio():
+    with open(make_sample(1.0), "rb") as f:
+        return f.read()
+
+
+def post_stream(app, headers, question_id, audio):
+    resp = app.test_client(use_cookies=False).post(
+        f"/api/round1/submit-answer/{question_id}/stream",
+        headers=headers,
+        data={"audio": (io.BytesIO(audio), "answer.wav")},
+        content_type="multipart/form-data",
+    )
+    return resp, parse_sse(resp.get_data(as_text=True))
+
+
+def test_answer_events_arrive_in_order(app, audio, monkeypatch):
+    from utils.interview_shared import InterviewUtils
+
+    def fake_stream(question, answer, resume, jd):
+        yield "feedback", "Clear "
+        yield "feedback", "answer."
+        yield "evaluation", {"score": 8, "feedback": "Clear answer."}
+
+    monkeypatch.setattr(InterviewUtils, "stream_evaluation", staticmethod(fake_stream))
+    user_id, headers = seed_user(app, email="sse@example.com")
+    question_ids = seed_round(app, user_id, 2)
+
+    resp, events = post_stream(app, headers, question_ids[0], audio)
+
+    assert resp.mimetype == "text/event-stream"
+    assert [name for name, _ in events] == ["transcript", "feedback", "feedback", "evaluation", "result", "done"]
+    assert "".join(data["delta"] for name, data in events if name == "feedback") == "Clear answer."
+    result = dict(events)["result"]
+    assert result["question_id"] == question_ids[0]
+    assert result["completed"] is False
+    assert "decode_ms" in result["timings"]
+
+
+def test_someone_elses_question_is_rejected_before_streaming(app, audio):
+    owner_id, _ = seed_user(app, email="sse-owner@example.com")
+    _, headers = seed_user(app, email="sse-other@example.com")
+    question_ids = seed_round(app, owner_id, 1)
+
+    resp = app.test_client(use_cookies=False).post(
+        f"/api/round1/submit-answer/{question_ids[0]}/stream",
+        headers=headers,
+        data={"audio": (io.BytesIO(audio), "answer.wav")},
+        content_type="multipart/form-data",
+    )
+    assert resp.status_code == 400
+    assert resp.get_json() == {"error": "Invalid question"}
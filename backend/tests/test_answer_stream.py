@@ -0,0 +1,72 @@
+import threading
+
+import pytest
+
+pytest.importorskip("dotenv")  # config.settings needs it
+
+from config.settings import Settings  # noqa: E402
+from utils.answer_stream import AnswerStream, AnswerStreamError  # noqa: E402
+
+
+def test_chunks_are_stored_in_sequence():
+    stream = AnswerStream(1, 101)
+    stream.append(b"aa", 0)
+    stream.append(b"bb", 1)
+    state = stream.append(b"bb", 1)  # client retry of a stored chunk
+
+    assert state["next_seq"] == 2
+    with open(stream.audio_path, "rb") as f:
+        assert f.read() == b"aabb"
+    with pytest.raises(AnswerStreamError, match="Expected chunk 2, got 4"):
+        stream.append(b"dd", 4)
+
+
+def test_chunk_zero_restarts_the_answer():
+    stream = AnswerStream(1, 102)
+    stream.append(b"old", 0)
+    stream.append(b"old", 1)
+    stream.append(b"new", 0)
+
+    assert stream.partial_text() == ""
+    with open(stream.audio_path, "rb") as f:
+        assert f.read() == b"new"
+
+
+def test_answer_size_is_capped(monkeypatch):
+    monkeypatch.setattr(Settings, "ANSWER_STREAM_MAX_BYTES", 4)
+    stream = AnswerStream(1, 103)
+    stream.append(b"abc", 0)
+    with pytest.raises(AnswerStreamError, match="maximum upload size"):
+        stream.append(b"de", 1)
+
+
+def test_finish_without_audio_fails():
+    with pytest.raises(AnswerStreamError, match="No audio received"):
+        AnswerStream(1, 104).finish()
+
+
+def test_lock_serializes_concurrent_appends():
+    AnswerStream(1, 105).append(b"", 0)
+    errors = []
+
+    def writer():
+        # Separate AnswerStream objects, as separate requests would have
+        stream = AnswerStream(1, 105)
+        for _ in range(20):
+            with stream.lock:
+                try:
+                    stream.append(b"x", stream._load_state()["next_seq"])
+                except AnswerStreamError as e:
+                    errors.append(e)
+
+    threads = [threading.Thread(target=writer) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    stream = AnswerStream(1, 105)
+    assert not errors
+    assert stream._load_state()["next_seq"] == 81
+    with open(stream.audio_path, "rb") as f:
+        assert f.read() == b"x" * 80
@@ -0,0 +1,76 @@
+import asyncio
+import json
+
+import pytest
+
+from benchmarks._common import seed_round, seed_user
+
+pytest.importorskip("asgiref")
+
+
+def call(asgi_app, method, path, headers=None, query=b""):
+    """Run one HTTP request through an ASGI app; returns ``(status, json body)``."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query,
+        "root_path": "",
+        "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()],
+        "client": ("127.0.0.1", 1234),
+        "server": ("testserver", 80),
+    }
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(asgi_app(scope, receive, send))
+    status = next(m["status"] for m in sent if m["type"] == "http.response.start")
+    body = b"".join(m.get("body", b"") for m in sent if m["type"] == "http.response.body")
+    return status, json.loads(body)
+
+
+@pytest.fixture(scope="module")
+def asgi_app(app):
+    import asgi
+
+    return asgi.app
+
+
+def test_async_handler_matches_the_flask_view(app, asgi_app):
+    user_id, headers = seed_user(app, email="asgi@example.com")
+    question_ids = seed_round(app, user_id, 2)
+
+    status, body = call(asgi_app, "GET", "/api/round1/get-question-audio", headers)
+    flask_body = app.test_client(use_cookies=False).get("/api/round1/get-question-audio", headers=headers).get_json()
+
+    assert status == 200
+    assert body == flask_body
+    assert body["question_id"] == question_ids[0]
+
+
+def test_async_handler_requires_auth(asgi_app):
+    status, body = call(asgi_app, "GET", "/api/round1/get-question-audio")
+    assert (status, body) == (401, {"error": "Unauthorized"})
+
+
+def test_other_routes_fall_through_to_flask(asgi_app):
+    status, body = call(asgi_app, "GET", "/api/health/audio-cache")
+    assert status == 200 and "hits" in body
+
+
+def test_async_submit_mode_stays_on_the_job_queue_view(asgi_app):
+    import asgi
+
+    scope = {"type": "http", "method": "POST", "path": "/api/round1/submit-answer/1", "query_string": b"mode=async"}
+    assert asgi_app._match(scope) == (None, ())
+    scope["query_string"] = b""
+    assert asgi_app._match(scope) == (asgi.submit_answer, ("1",))
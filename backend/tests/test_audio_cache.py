@@ -0,0 +1,57 @@
+import os
+
+from tools.audio_cache import AudioCache
+
+
+def writer(payload: bytes, calls: list):
+    def synthesize(path):
+        calls.append(path)
+        with open(path, "wb") as f:
+            f.write(payload)
+
+    return synthesize
+
+
+def test_identical_text_is_synthesized_once(tmp_path):
+    cache = AudioCache(str(tmp_path), "/static/audio/", max_bytes=1000)
+    calls = []
+
+    first = cache.get_or_create("Tell me about yourself.", "en", "gtts", "mp3", writer(b"x" * 10, calls))
+    second = cache.get_or_create(" Tell me about yourself. ", "en", "gtts", "mp3", writer(b"x" * 10, calls))
+
+    assert first == second
+    assert first.startswith("/static/audio/") and first.endswith(".mp3")
+    assert len(calls) == 1
+    assert cache.lookup("Tell me about yourself.", "en", "gtts", "mp3") == first
+    assert cache.lookup("Tell me about yourself.", "en-gb", "gtts", "mp3") is None
+    assert os.listdir(tmp_path) == [first.rsplit("/", 1)[1]]
+
+
+def test_least_recently_used_file_is_evicted_past_max_bytes(tmp_path):
+    cache = AudioCache(str(tmp_path), "/audio", max_bytes=25)
+    calls = []
+    a = cache.get_or_create("a", "en", "gtts", "mp3", writer(b"a" * 10, calls))
+    b = cache.get_or_create("b", "en", "gtts", "mp3", writer(b"b" * 10, calls))
+    cache.lookup("a", "en", "gtts", "mp3")  # a is now the most recent
+    cache.get_or_create("c", "en", "gtts", "mp3", writer(b"c" * 10, calls))
+
+    assert cache.lookup("b", "en", "gtts", "mp3") is None
+    assert not os.path.exists(os.path.join(tmp_path, b.rsplit("/", 1)[1]))
+    assert cache.lookup("a", "en", "gtts", "mp3") == a
+    stats = cache.stats()
+    assert stats["evictions"] == 1 and stats["evicted_bytes"] == 10
+    assert stats["files"] == 2 and stats["bytes"] == 20
+
+
+def test_index_is_rebuilt_from_the_directory(tmp_path):
+    calls = []
+    url = AudioCache(str(tmp_path), "/audio", max_bytes=100).get_or_create(
+        "q", "en", "gtts", "mp3", writer(b"q" * 5, calls)
+    )
+    (tmp_path / "q_12.mp3").write_bytes(b"legacy")
+
+    reopened = AudioCache(str(tmp_path), "/audio", max_bytes=100)
+
+    assert reopened.lookup("q", "en", "gtts", "mp3") == url
+    assert reopened.stats()["files"] == 1  # legacy q_<id>.mp3 files are not indexed
+    assert len(calls) == 1
@@ -0,0 +1,53 @@
+import io
+import os
+import shutil
+
+import pytest
+
+from benchmarks._common import make_sample
+
+np = pytest.importorskip("numpy")
+
+from tools.audio_decode import (  # noqa: E402
+    AudioDecodeError, UploadTooLarge, decode_audio, decode_file, iter_stream,
+)
+
+pytestmark = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg is not installed")
+
+
+@pytest.fixture(scope="module")
+def wav():
+    path = make_sample(2.0)
+    with open(path, "rb") as f:
+        yield path, f.read()
+    os.remove(path)
+
+
+def test_upload_decodes_in_memory_to_16k_float32(wav):
+    _, data = wav
+    audio = decode_audio(iter_stream(io.BytesIO(data)), max_bytes=len(data))
+
+    assert audio.dtype == np.float32
+    assert abs(len(audio) - 2 * 16000) < 160
+    assert 0 < np.abs(audio).max() <= 1.0
+
+
+def test_upload_past_the_limit_is_rejected(wav):
+    _, data = wav
+    with pytest.raises(UploadTooLarge):
+        decode_audio(iter_stream(io.BytesIO(data)), max_bytes=len(data) - 1)
+
+
+def test_garbage_is_a_decode_error():
+    with pytest.raises(AudioDecodeError):
+        decode_audio([b"not audio at all" * 100], max_bytes=1 << 20)
+
+
+def test_decode_file_seeks_past_the_committed_audio(wav):
+    path, _ = wav
+    full = decode_file(path)
+    tail = decode_file(path, start_seconds=1.5)
+
+    assert abs(len(tail) - 0.5 * 16000) < 160
+    assert len(decode_file(path, start_seconds=5.0)) == 0
+    assert len(full) > len(tail)
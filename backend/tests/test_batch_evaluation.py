@@ -0,0 +1,41 @@
+import json
+
+from benchmarks._common import EVAL_JSON, SUMMARY, seed_round, seed_user
+
+
+def test_one_call_evaluates_the_round_and_skipped_answers_fall_back(app, monkeypatch):
+    from config.db import db
+    from models import InterviewQuestion
+    from utils.interview_shared import InterviewUtils
+
+    user_id, _ = seed_user(app, email="batch@example.com")
+    question_ids = seed_round(app, user_id, 3)
+    calls = []
+
+    def fake_invoke(messages, call_site, template_version, use_cache=True):
+        calls.append(call_site)
+        if call_site == "evaluate_round_batch":
+            # The model skips the last answer
+            return json.dumps({
+                "evaluations": [
+                    {"question_id": qid, "score": 9, "feedback": "batched"} for qid in question_ids[:2]
+                ],
+                "summary": SUMMARY,
+            })
+        return EVAL_JSON
+
+    monkeypatch.setattr(InterviewUtils, "_invoke_llm", staticmethod(fake_invoke))
+    with app.app_context():
+        for qid in question_ids:
+            db.session.get(InterviewQuestion, qid).answer_text = f"Answer {qid}"
+        db.session.commit()
+        round1 = db.session.get(InterviewQuestion, question_ids[0]).round
+
+        result = InterviewUtils.evaluate_round_batch(round1, round1.interview.user)
+
+        evaluations = [db.session.get(InterviewQuestion, qid).evaluation_json for qid in question_ids]
+        assert calls == ["evaluate_round_batch", "evaluate_answer"]
+        assert [e["score"] for e in evaluations] == [9, 9, 7]
+        assert evaluations[0]["feedback"] == "batched"
+        assert result["overall_score"] == SUMMARY["overall_score"]
+        assert round1.result_json
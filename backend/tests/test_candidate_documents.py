@@ -0,0 +1,34 @@
+from benchmarks._common import seed_user
+
+
+def test_user_row_loads_without_the_documents(app, statement_counter):
+    from config.db import db
+    from models.user import User
+
+    user_id, _ = seed_user(app, email="docs-lazy@example.com", resume="R" * 1000, jd="J" * 1000)
+    with app.app_context():
+        statement_counter["n"] = 0
+        user = User.find_by_id(user_id)
+        assert statement_counter["n"] == 1
+        assert "documents" not in db.inspect(user).dict
+        assert user.resume_text == "R" * 1000  # lazy load on first access
+        assert statement_counter["n"] == 2
+
+        db.session.expunge_all()
+        statement_counter["n"] = 0
+        user = User.find_with_documents(user_id)
+        assert (user.resume_text, user.job_description) == ("R" * 1000, "J" * 1000)
+        assert statement_counter["n"] == 1
+
+
+def test_assigning_documents_creates_the_row(app):
+    from config.db import db
+    from models import CandidateDocument
+    from models.user import User
+
+    user_id, _ = seed_user(app, email="docs-new@example.com", resume=None, jd=None)
+    with app.app_context():
+        user = User.find_with_documents(user_id)
+        user.job_description = "Backend role"
+        db.session.commit()
+        assert db.session.get(CandidateDocument, user_id).job_description == "Backend role"
@@ -0,0 +1,30 @@
+from types import SimpleNamespace
+
+PROFILE = {
+    "candidate": {"headline": "Backend engineer", "skills": ["Python", "SQL"]},
+    "job": {"title": "Senior backend engineer", "requirements": ["Python"]},
+}
+
+
+def test_prompts_use_the_compact_profile_when_there_is_one(app, monkeypatch):
+    from config.settings import Settings
+    from utils.interview_shared import InterviewUtils
+
+    user = SimpleNamespace(id=1, candidate_profile=PROFILE, resume_text="x" * 5000, job_description="y" * 5000)
+    monkeypatch.setattr(Settings, "CANDIDATE_PROFILE_ENABLED", "True")
+    resume, jd = InterviewUtils.prompt_context(user)
+    assert "Headline: Backend engineer" in resume and "Python" in resume
+    assert "Senior backend engineer" in jd
+    assert len(resume) + len(jd) < 500
+
+    monkeypatch.setattr(Settings, "CANDIDATE_PROFILE_ENABLED", "False")
+    assert InterviewUtils.prompt_context(user) == ("x" * 5000, "y" * 5000)
+
+
+def test_missing_or_broken_profile_falls_back_to_raw_text(app):
+    from utils.interview_shared import InterviewUtils
+
+    raw = SimpleNamespace(id=1, candidate_profile=None, resume_text="resume", job_description="jd")
+    broken = SimpleNamespace(id=1, candidate_profile={"candidate": "not a dict"}, resume_text="resume", job_description="jd")
+    assert InterviewUtils.prompt_context(raw) == ("resume", "jd")
+    assert InterviewUtils.prompt_context(broken) == ("resume", "jd")
@@ -0,0 +1,51 @@
+import gzip
+import json
+
+import pytest
+
+from benchmarks._common import SUMMARY, seed_round, seed_user
+
+
+@pytest.fixture(scope="module")
+def summary_headers(app):
+    from config.db import db
+    from models import InterviewQuestion
+
+    user_id, headers = seed_user(app, email="compression@example.com")
+    question_ids = seed_round(app, user_id, 1)
+    with app.app_context():
+        round1 = db.session.get(InterviewQuestion, question_ids[0]).round
+        round1.result_json = {**SUMMARY, "recommendations": ["Practise system design answers."] * 100}
+        db.session.commit()
+    return headers
+
+
+def get(app, path, headers, encoding=None):
+    if encoding:
+        headers = {**headers, "Accept-Encoding": encoding}
+    return app.test_client(use_cookies=False).get(path, headers=headers)
+
+
+def test_large_json_is_gzipped_when_accepted(app, summary_headers):
+    plain = get(app, "/api/round1/summary", summary_headers)
+    zipped = get(app, "/api/round1/summary", summary_headers, "gzip")
+
+    assert "Content-Encoding" not in plain.headers
+    assert zipped.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in zipped.headers["Vary"]
+    assert len(zipped.data) < len(plain.data) / 4
+    assert json.loads(gzip.decompress(zipped.data)) == plain.get_json()
+
+
+def test_brotli_is_preferred_when_installed(app, summary_headers):
+    brotli = pytest.importorskip("brotli")
+
+    resp = get(app, "/api/round1/summary", summary_headers, "gzip, br")
+    assert resp.headers["Content-Encoding"] == "br"
+    assert json.loads(brotli.decompress(resp.data))["overall_score"] == SUMMARY["overall_score"]
+
+
+def test_small_json_is_left_alone(app, summary_headers):
+    resp = get(app, "/api/round1/get-interview-status", summary_headers, "gzip")
+    assert "Content-Encoding" not in resp.headers
+    assert "Accept-Encoding" in resp.headers["Vary"]
@@ -0,0 +1,20 @@
+def test_sqlite_connections_get_the_configured_pragmas(app):
+    from config.db import db
+    from config.settings import Settings
+
+    with app.app_context(), db.engine.connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar().lower() == Settings.DB_SQLITE_JOURNAL_MODE.lower()
+        assert conn.exec_driver_sql("PRAGMA busy_timeout").scalar() == Settings.DB_SQLITE_BUSY_TIMEOUT_MS
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+
+
+def test_engine_options_per_backend(app, monkeypatch):
+    from config.db import engine_options
+    from config.settings import Settings
+
+    monkeypatch.setattr(Settings, "DB_POOL_SIZE", 7)
+    assert engine_options("sqlite:///x.db") == {"connect_args": {"timeout": Settings.DB_SQLITE_BUSY_TIMEOUT_MS / 1000.0}}
+    options = engine_options("postgresql://u:p@localhost/db")
+    assert options["pool_size"] == 7
+    assert set(options) == {"pool_size", "max_overflow", "pool_timeout", "pool_recycle", "pool_pre_ping"}
+    assert engine_options("") == {}
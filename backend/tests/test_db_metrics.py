@@ -0,0 +1,47 @@
+import logging
+
+import pytest
+
+flask = pytest.importorskip("flask")
+
+from sqlalchemy import create_engine, text  # noqa: E402
+
+from utils import db_metrics  # noqa: E402
+
+
+def test_fingerprint_collapses_literals_and_in_lists():
+    assert db_metrics.fingerprint(
+        "SELECT * FROM users WHERE id = 42 AND email = 'a@b.c' AND x IN (?, ?, ?)"
+    ) == "SELECT * FROM users WHERE id = ? AND email = ? AND x IN (?...)"
+    assert db_metrics.fingerprint("SELECT  1\n  FROM t WHERE a = :a") == "SELECT ? FROM t WHERE a = ?"
+
+
+@pytest.fixture
+def instrumented():
+    app = flask.Flask(__name__)
+    engine = create_engine("sqlite://")
+
+    @app.get("/two-statements")
+    def two_statements():
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+        return "ok"
+
+    db_metrics.install(app, engine)
+    yield app
+    db_metrics.uninstall(app, engine)
+
+
+def test_request_reports_db_time_and_logs_slow_statements(instrumented, monkeypatch, caplog):
+    from config.settings import Settings
+
+    monkeypatch.setattr(Settings, "DB_SLOW_QUERY_MS", 0)
+    with caplog.at_level(logging.INFO, logger=db_metrics.__name__):
+        resp = instrumented.test_client().get("/two-statements")
+
+    assert 'desc="2 statements"' in resp.headers["Server-Timing"]
+    messages = [r.getMessage() for r in caplog.records]
+    assert sum("DB slow statement endpoint=two_statements" in m for m in messages) == 2
+    assert any("DB request endpoint=two_statements" in m and "statements=2" in m for m in messages)
+
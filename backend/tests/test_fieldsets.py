@@ -0,0 +1,51 @@
+import pytest
+
+from benchmarks._common import SUMMARY, seed_round, seed_user
+
+flask = pytest.importorskip("flask")
+
+from utils.fieldsets import requested_fields, select  # noqa: E402
+
+DATA = {"a": 1, "b": 2, "c": 3}
+
+
+@pytest.mark.parametrize(
+    "query, default, allowed, expected",
+    [
+        ("", ("a",), None, {"a": 1}),
+        ("", None, None, DATA),
+        ("?fields=b,c", ("a",), None, {"b": 2, "c": 3}),
+        ("?fields=b,%20nope", ("a",), None, {"b": 2}),
+        ("?fields=*", ("a",), None, DATA),
+        ("?fields=*", ("a",), ("a", "b"), {"a": 1, "b": 2}),
+        ("?fields=c", ("a",), ("a", "b"), {}),
+        ("?fields=%20", ("a",), None, {"a": 1}),
+    ],
+)
+def test_requested_fields(query, default, allowed, expected):
+    with flask.Flask(__name__).test_request_context(f"/{query}"):
+        assert select(DATA, requested_fields(default, allowed)) == expected
+
+
+def test_select_passes_none_through():
+    assert select(None, frozenset({"a"})) is None
+
+
+def test_interview_status_sends_slim_summary_unless_asked(app):
+    from config.db import db
+    from models import InterviewQuestion
+
+    user_id, headers = seed_user(app, email="fieldsets@example.com")
+    question_ids = seed_round(app, user_id, 1)
+    with app.app_context():
+        round1 = db.session.get(InterviewQuestion, question_ids[0]).round
+        round1.result_json = {**SUMMARY, "strengths": ["clear"]}
+        db.session.commit()
+    client = app.test_client(use_cookies=False)
+
+    slim = client.get("/api/round1/get-interview-status", headers=headers).get_json()["round_1_summary"]
+    assert slim == {"overall_score": 70, "pass": True}
+    full = client.get("/api/round1/get-interview-status?fields=*", headers=headers).get_json()["round_1_summary"]
+    assert full["strengths"] == ["clear"]
+    picked = client.get("/api/round1/summary?fields=gaps", headers=headers).get_json()
+    assert picked == {"gaps": []}
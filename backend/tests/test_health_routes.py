@@ -0,0 +1,7 @@
+def test_audio_cache_stats_live_with_the_operational_endpoints(app):
+    client = app.test_client()
+
+    resp = client.get("/api/health/audio-cache")
+    assert resp.status_code == 200
+    assert {"hits", "misses"} <= set(resp.get_json())
+    assert client.get("/api/round1/audio-cache-stats").status_code == 404
@@ -0,0 +1,47 @@
+"""Cached access-token verification: /me from the identity, and revocation on logout / password change."""
+from benchmarks._common import seed_user
+
+
+def _me(app, headers, counter, query=""):
+    counter["n"] = 0
+    resp = app.test_client(use_cookies=False).get(f"/api/auth/me{query}", headers=headers)
+    return resp, counter["n"]
+
+
+def test_me_default_payload_comes_from_cached_identity(app, statement_counter):
+    user_id, headers = seed_user(app, email="identity-me@example.com")
+    _me(app, headers, statement_counter)  # fill the identity cache
+
+    resp, statements = _me(app, headers, statement_counter)
+    assert resp.status_code == 200
+    assert resp.get_json()["user"] == {"id": user_id, "name": "Bench", "email": "identity-me@example.com"}
+    assert statements == 0
+
+    resp, statements = _me(app, headers, statement_counter, "?fields=id,created_at")
+    assert set(resp.get_json()["user"]) == {"id", "created_at"}
+    assert statements == 1
+
+
+def test_logout_revokes_cached_access_token(app, statement_counter):
+    _, headers = seed_user(app, email="identity-logout@example.com")
+    assert _me(app, headers, statement_counter)[0].status_code == 200
+
+    client = app.test_client(use_cookies=False)
+    assert client.post("/api/auth/logout", headers=headers).status_code == 200
+    assert _me(app, headers, statement_counter)[0].status_code == 401
+
+
+def test_password_change_revokes_old_access_token(app, statement_counter):
+    _, headers = seed_user(app, email="identity-password@example.com")
+    assert _me(app, headers, statement_counter)[0].status_code == 200
+
+    resp = app.test_client(use_cookies=False).post(
+        "/api/auth/change-password",
+        headers=headers,
+        json={"current_password": "Bench-pass-1", "new_password": "Bench-pass-2"},
+    )
+    assert resp.status_code == 200
+    assert _me(app, headers, statement_counter)[0].status_code == 401
+
+    new_headers = {"Authorization": f"Bearer {resp.get_json()['access_token']}"}
+    assert _me(app, new_headers, statement_counter)[0].status_code == 200
@@ -0,0 +1,73 @@
+import contextlib
+import os
+import tempfile
+import threading
+
+import pytest
+
+pytest.importorskip("dotenv")  # config.settings needs it
+
+from utils.job_queue import JobQueue, JobQueueFull  # noqa: E402
+
+
+class FakeApp:
+    def app_context(self):
+        return contextlib.nullcontext()
+
+
+def make_queues(count=2, **kwargs):
+    """Queues sharing one store file, the way separate web workers share it."""
+    path = os.path.join(tempfile.mkdtemp(prefix="jobs_"), "jobs.db")
+    options = {"max_workers": 2, "max_pending": 10, "ttl": 60, "store_path": path, "max_entries": 100}
+    options.update(kwargs)
+    return [JobQueue(**options) for _ in range(count)]
+
+
+def test_job_submitted_on_one_worker_is_visible_on_another():
+    worker_a, worker_b = make_queues()
+    job_id = worker_a.submit(FakeApp(), 7, lambda x: {"answer": x}, 42)
+
+    job = worker_b.get(job_id, wait=5)
+
+    assert job["status"] == "done"
+    assert job["result"] == {"answer": 42}
+    assert job["owner_id"] == 7
+    assert job["finished_at"] is not None
+
+
+def test_failed_jobs_record_the_error():
+    worker_a, worker_b = make_queues()
+    job_id = worker_a.submit(FakeApp(), 1, lambda: {"error": "Invalid question"})
+    boom_id = worker_a.submit(FakeApp(), 1, lambda: 1 / 0)
+
+    assert worker_b.get(job_id, wait=5)["error"] == "Invalid question"
+    boom = worker_b.get(boom_id, wait=5)
+    assert boom["status"] == "failed"
+    assert "division" in boom["error"]
+
+
+def test_get_returns_pending_job_after_wait_expires():
+    (queue,) = make_queues(count=1)
+    release = threading.Event()
+    job_id = queue.submit(FakeApp(), 1, lambda: release.wait(5) and {})
+
+    assert queue.get(job_id, wait=0.1)["status"] in ("queued", "running")
+    release.set()
+    assert queue.get(job_id, wait=5)["status"] == "done"
+
+
+def test_unknown_job_is_none():
+    (queue,) = make_queues(count=1)
+    assert queue.get("missing") is None
+
+
+def test_pending_cap_counts_this_workers_jobs():
+    (queue,) = make_queues(count=1, max_workers=1, max_pending=1)
+    release = threading.Event()
+    job_id = queue.submit(FakeApp(), 1, lambda: release.wait(5) and {})
+
+    with pytest.raises(JobQueueFull):
+        queue.submit(FakeApp(), 1, dict)
+    release.set()
+    queue.get(job_id, wait=5)
+    queue.submit(FakeApp(), 1, dict)
@@ -0,0 +1,31 @@
+import pytest
+
+from utils.json_stream import JSONObjectStream, extract_json_object
+
+
+def test_malformed_top_level_object_does_not_yield_a_nested_one():
+    # Single-quoted keys: the top-level object does not decode, its dimensions dict does
+    text = """{'score': 8, 'feedback': "good", "dimensions": {"relevance": 7, "clarity": 8}}"""
+    assert extract_json_object(text) is None
+    assert extract_json_object(text, ("score",)) is None
+
+
+def test_required_keys():
+    assert extract_json_object('{"dimensions": {"relevance": 7}}', ("score",)) is None
+    text = 'Note {"other": 1} then {"score": 7, "feedback": "ok"}'
+    assert extract_json_object(text, ("score",)) == {"score": 7, "feedback": "ok"}
+
+
+def test_object_in_prose_and_fences():
+    text = 'Braces like {this} are fine.\n```json\n{"score": 7, "x": {"a": "}"}}\n```'
+    assert extract_json_object(text, ("score",)) == {"score": 7, "x": {"a": "}"}}
+
+
+@pytest.mark.parametrize("step", [1, 2, 3, 7, 64])
+def test_stream_matches_whole_text(step):
+    text = 'pre {x} {"a": "b\\"}{", "c": {"d": 1}} mid {x} {"e": 2} {} {"f": [1]}'
+    stream = JSONObjectStream()
+    objects = []
+    for i in range(0, len(text), step):
+        objects.extend(stream.feed(text[i:i + step]))
+    assert objects == [{"a": 'b"}{', "c": {"d": 1}}, {"e": 2}, {}, {"f": [1]}]
@@ -0,0 +1,43 @@
+import os
+import tempfile
+
+import pytest
+
+pytest.importorskip("dotenv")  # config.settings needs it
+
+from utils.llm_cache import LLMCache  # noqa: E402
+
+
+class Message:
+    def __init__(self, type, content):
+        self.type = type
+        self.content = content
+
+
+MESSAGES = [Message("system", "Grade the answer."), Message("human", "Question? Answer.")]
+
+
+def test_key_includes_the_bound_output_mode():
+    plain = LLMCache.make_key("gpt", 0.2, "v1", MESSAGES)
+    json_mode = LLMCache.make_key("gpt", 0.2, "v1", MESSAGES, {"response_format": {"type": "json_object"}})
+
+    assert plain != json_mode
+    assert plain == LLMCache.make_key("gpt", 0.2, "v1", MESSAGES, {})
+    assert json_mode == LLMCache.make_key("gpt", 0.2, "v1", MESSAGES, {"response_format": {"type": "json_object"}})
+
+
+def test_cached_response_is_not_served_across_json_modes(monkeypatch):
+    pytest.importorskip("langchain_openai")
+    from config.settings import Settings
+    from utils import interview_shared
+
+    cache = LLMCache(os.path.join(tempfile.mkdtemp(prefix="llm_cache_"), "cache.db"), ttl=60, max_entries=10)
+    monkeypatch.setattr(interview_shared, "get_llm_cache", lambda: cache)
+
+    monkeypatch.setattr(Settings, "LLM_JSON_MODE", "True")
+    _, key, _ = interview_shared.InterviewUtils._cache_lookup(MESSAGES, "evaluate_answer", "v1", True)
+    cache.put(key, '{"score": 7}', "evaluate_answer", "gpt")
+    assert interview_shared.InterviewUtils._cache_lookup(MESSAGES, "evaluate_answer", "v1", True)[2] == '{"score": 7}'
+
+    monkeypatch.setattr(Settings, "LLM_JSON_MODE", "False")
+    assert interview_shared.InterviewUtils._cache_lookup(MESSAGES, "evaluate_answer", "v1", True)[2] is None
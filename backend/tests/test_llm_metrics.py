@@ -0,0 +1,41 @@
+import pytest
+
+from benchmarks._common import seed_user
+
+
+class Response:
+    content = "{}"
+    usage_metadata = {"input_tokens": 120, "output_tokens": 30}
+
+
+class FakeModel:
+    model_name = "fake-model"
+
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    def invoke(self, payload):
+        if self.fail:
+            raise RuntimeError("provider down")
+        return Response()
+
+
+def test_calls_are_recorded_per_user_and_exported(app):
+    from utils.llm_metrics import invoke_instrumented, llm_call_context
+
+    user_id, headers = seed_user(app, email="llm-metrics@example.com")
+    with app.app_context():
+        with llm_call_context(user_id):
+            invoke_instrumented(FakeModel(), [], "metrics_test")
+            with pytest.raises(RuntimeError):
+                invoke_instrumented(FakeModel(fail=True), [], "metrics_test")
+
+    client = app.test_client(use_cookies=False)
+    usage = client.get("/api/health/llm-usage", headers=headers).get_json()
+    site = usage["by_call_site"]["metrics_test"]
+    assert (site["calls"], site["prompt_tokens"], site["completion_tokens"]) == (2, 120, 30)
+
+    text = client.get("/metrics").get_data(as_text=True)
+    assert 'llm_calls_total{call_site="metrics_test",model="fake-model",status="ok"} 1' in text
+    assert 'llm_calls_total{call_site="metrics_test",model="fake-model",status="error"} 1' in text
+    assert 'llm_prompt_tokens_total{call_site="metrics_test",model="fake-model"} 120' in text
@@ -0,0 +1,64 @@
+"""Migrations: the chain builds the current schema from an empty database, and data migrations keep the right rows."""
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+
+import pytest
+
+pytest.importorskip("flask_migrate")
+
+BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def flask_db(db_path, *args):
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{db_path}")
+    return subprocess.run(
+        [sys.executable, "-m", "flask", "--app", "app", "db", *args],
+        cwd=BACKEND, env=env, capture_output=True, text=True, timeout=120,
+    )
+
+
+def test_upgrade_from_empty_database_matches_models():
+    db_path = os.path.join(tempfile.mkdtemp(prefix="migrations_"), "app.db")
+
+    upgrade = flask_db(db_path, "upgrade")
+    assert upgrade.returncode == 0, upgrade.stderr
+    check = flask_db(db_path, "check")
+    assert check.returncode == 0, check.stderr + check.stdout
+
+    downgrade = flask_db(db_path, "downgrade", "base")
+    assert downgrade.returncode == 0, downgrade.stderr
+    upgrade = flask_db(db_path, "upgrade")
+    assert upgrade.returncode == 0, upgrade.stderr
+
+
+def test_index_revision_keeps_the_most_answered_duplicate_round():
+    db_path = os.path.join(tempfile.mkdtemp(prefix="migrations_"), "app.db")
+    assert flask_db(db_path, "upgrade", "b2d6f4a8c031").returncode == 0
+
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "INSERT INTO users (id, name, email, password, token_version) VALUES (1, 'A', 'a@example.com', 'x', 0)"
+        )
+        conn.execute("INSERT INTO interviews (id, user_id, status) VALUES (1, 1, 'in_progress')")
+        # Round 10 is older; round 11 holds more answers and must survive
+        conn.executemany(
+            "INSERT INTO interview_rounds (id, interview_id, round_number, status) VALUES (?, 1, 1, 'in_progress')",
+            [(10,), (11,)],
+        )
+        conn.executemany(
+            "INSERT INTO interview_questions (round_id, question_text, answer_text) VALUES (?, 'Q?', ?)",
+            [(10, "one"), (10, None), (11, "one"), (11, "two")],
+        )
+
+    upgrade = flask_db(db_path, "upgrade")
+    assert upgrade.returncode == 0, upgrade.stderr
+    assert "Dropping duplicate round id=10" in upgrade.stderr
+
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT id FROM interview_rounds").fetchall() == [(11,)]
+        assert conn.execute("SELECT DISTINCT round_id FROM interview_questions").fetchall() == [(11,)]
+        with pytest.raises(sqlite3.IntegrityError):
+            conn.execute("INSERT INTO interview_rounds (interview_id, round_number) VALUES (1, 1)")
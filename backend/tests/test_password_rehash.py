@@ -0,0 +1,75 @@
+import pytest
+
+from benchmarks._common import seed_user
+
+generate_password_hash = pytest.importorskip("werkzeug.security").generate_password_hash
+
+
+def _stored(app, user_id):
+    from config.db import db
+    from models.user import User
+
+    with app.app_context():
+        user = db.session.get(User, user_id)
+        return user.password, user.token_version
+
+
+def _set_hash(app, user_id, pwhash):
+    from config.db import db
+    from models.user import User
+
+    with app.app_context():
+        db.session.get(User, user_id).password = pwhash
+        db.session.commit()
+
+
+def _login(app, email, password="Bench-pass-1"):
+    client = app.test_client(use_cookies=False)
+    return client.post("/api/auth/login", json={"email": email, "password": password})
+
+
+def test_needs_rehash_follows_configured_parameters(monkeypatch):
+    from config.settings import Settings
+    from utils.password_hasher import needs_rehash
+
+    monkeypatch.setattr(Settings, "PASSWORD_HASH_METHOD", "pbkdf2:sha256:1000")
+    monkeypatch.setattr(Settings, "PASSWORD_SALT_LENGTH", 16)
+    assert not needs_rehash(generate_password_hash("pw", method="pbkdf2:sha256:1000", salt_length=16))
+    assert needs_rehash(generate_password_hash("pw", method="pbkdf2:sha256:999", salt_length=16))
+    assert needs_rehash(generate_password_hash("pw", method="pbkdf2:sha256:1000", salt_length=8))
+    assert needs_rehash("")
+
+
+def test_login_upgrades_an_old_hash_without_revoking_tokens(app):
+    from config.settings import Settings
+
+    email = "rehash@example.com"
+    user_id, _ = seed_user(app, email=email)
+    old_hash = generate_password_hash("Bench-pass-1", method="pbkdf2:sha256:1000", salt_length=8)
+    _set_hash(app, user_id, old_hash)
+    _, version_before = _stored(app, user_id)
+
+    assert _login(app, email).status_code == 200
+    new_hash, version_after = _stored(app, user_id)
+    assert new_hash != old_hash
+    assert new_hash.startswith(Settings.PASSWORD_HASH_METHOD + "$")
+    assert version_after == version_before
+
+    assert _login(app, email).status_code == 200
+    assert _stored(app, user_id)[0] == new_hash  # current hashes are left alone
+    assert _login(app, email, "Wrong-pass-1").status_code == 401
+
+
+def test_login_answers_503_when_the_hasher_is_busy(app, monkeypatch):
+    from models.user import User
+    from utils.password_hasher import PasswordHasherBusy
+
+    seed_user(app, email="busy@example.com")
+
+    def busy(self, password):
+        raise PasswordHasherBusy("Password hashing queue is full")
+
+    monkeypatch.setattr(User, "check_password", busy)
+    resp = _login(app, "busy@example.com")
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == "1"
@@ -0,0 +1,91 @@
+"""Query-count regression test: SQL statements per round 1 endpoint against a budget.
+
+Drives a full round through the Flask test client once per evaluation mode,
+with the model, Whisper and gTTS stubbed out, and counts the statements each
+request sends to the database. An N+1 (a lazy load per question, a refresh
+per expired object) pushes an endpoint over its budget and fails the test.
+
+Budgets are the counts measured on the second round of a user (the first one
+creates the interview and round rows) with a warm identity cache
+(``AUTH_VERIFY_MODE=cached``, set in conftest), so they count the endpoint's
+own statements. When a change legitimately needs more queries, raise the
+budget in the same commit.
+"""
+import io
+
+import pytest
+
+from benchmarks._common import make_sample, seed_user
+
+NUM_QUESTIONS = 5
+
+# start: users, interviews, rounds, DELETE questions, users (generation), 5 INSERTs, questions
+# submit_answer: ownership check (before decoding), question + round/interview/user join,
+# round questions, UPDATE, has_unanswered
+BUDGETS = {
+    "per_answer": {
+        "start": 12,
+        "get_question_audio": 3,
+        "submit_answer": 5,
+        "submit_answer_last": 11,
+        "summary": 2,
+        "end_interview": 3,
+    },
+    "deferred": {
+        "start": 12,
+        "get_question_audio": 3,
+        "submit_answer": 5,
+        "submit_answer_last": 15,
+        "summary": 2,
+        "end_interview": 3,
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def audio():
+    with open(make_sample(1.0), "rb") as f:
+        return f.read()
+
+
+def run_round(client, headers, audio: bytes, counter):
+    """One start -> answer everything -> summary -> end sequence; returns ``{endpoint: statements}``."""
+
+    def call(method, path, **kwargs):
+        counter["n"] = 0
+        resp = getattr(client, method)(path, headers=headers, **kwargs)
+        assert resp.status_code == 200, (path, resp.status_code, resp.get_data(as_text=True)[:200])
+        return resp.get_json(), counter["n"]
+
+    counts = {}
+    started, counts["start"] = call("post", "/api/round1/start")
+    question_ids = [q["id"] for q in started["questions"]]
+    assert len(question_ids) == NUM_QUESTIONS
+    _, counts["get_question_audio"] = call("get", "/api/round1/get-question-audio")
+    for i, qid in enumerate(question_ids):
+        _, n = call(
+            "post",
+            f"/api/round1/submit-answer/{qid}",
+            data={"audio": (io.BytesIO(audio), "answer.wav")},
+            content_type="multipart/form-data",
+        )
+        key = "submit_answer_last" if i == len(question_ids) - 1 else "submit_answer"
+        counts[key] = max(counts.get(key, 0), n)
+    _, counts["summary"] = call("get", "/api/round1/summary")
+    _, counts["end_interview"] = call("post", "/api/round1/end-interview")
+    return counts
+
+
+@pytest.mark.parametrize("mode", sorted(BUDGETS))
+def test_round1_statements_within_budget(app, statement_counter, audio, mode, monkeypatch):
+    from config.settings import Settings
+
+    monkeypatch.setattr(Settings, "ROUND1_EVAL_MODE", mode)
+    _, headers = seed_user(app, email=f"budget-{mode}@example.com")
+    client = app.test_client()
+    client.get("/api/auth/me", headers=headers)  # fill the identity cache
+    run_round(client, headers, audio, statement_counter)  # first round creates the interview and round rows
+    counts = run_round(client, headers, audio, statement_counter)
+
+    over = {endpoint: (n, BUDGETS[mode][endpoint]) for endpoint, n in counts.items() if n > BUDGETS[mode][endpoint]}
+    assert not over, f"{mode}: statements over budget (count, budget): {over}"
@@ -0,0 +1,36 @@
+import time
+
+from benchmarks._common import seed_user
+
+
+def wait_for_refill(pool, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while pool.stats()["refills_in_flight"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_refilled_set_is_taken_once_and_dropped_when_the_resume_changes(app):
+    from config.db import db
+    from models.user import User
+    from utils.question_pool import QuestionPool
+
+    pool = QuestionPool(depth=1, max_age=3600, workers=1)
+    user_id, _ = seed_user(app, email="pool@example.com")
+
+    assert pool.refill_async(app, user_id, 1)
+    wait_for_refill(pool)
+    with app.app_context():
+        user = User.find_with_documents(user_id)
+        assert pool.take(user, 1) == [f"Question {i}?" for i in range(5)]  # stub_external_calls(5)
+        assert pool.take(user, 1) is None
+
+    pool.refill_async(app, user_id, 1)
+    wait_for_refill(pool)
+    with app.app_context():
+        user = User.find_with_documents(user_id)
+        user.resume_text = "Rewritten resume"
+        db.session.commit()
+        assert pool.take(user, 1) is None
+
+    stats = pool.stats()
+    assert (stats["hits"], stats["misses"], stats["stale_discarded"], stats["generated"]) == (1, 2, 1, 2)
@@ -0,0 +1,59 @@
+"""get-question-audio while a streaming start is still writing questions."""
+from datetime import datetime, timedelta
+
+from benchmarks._common import seed_round, seed_user
+
+
+def _mark_streaming(app, user_id, started_at=None):
+    from config.db import db
+    from models import Interview, InterviewRound
+
+    with app.app_context():
+        round1 = (
+            InterviewRound.query.join(Interview)
+            .filter(Interview.user_id == user_id, InterviewRound.round_number == 1)
+            .one()
+        )
+        round1.generation_status = "streaming"
+        round1.generation_started_at = started_at or datetime.utcnow()
+        db.session.commit()
+        return round1.id
+
+
+def _add_question(app, round_id):
+    from config.db import db
+    from models import InterviewQuestion
+
+    with app.app_context():
+        q = InterviewQuestion(round_id=round_id, question_text="Streamed question?")
+        db.session.add(q)
+        db.session.commit()
+        return q.id
+
+
+def test_pending_question_returns_immediately_with_retry_hint(app):
+    user_id, headers = seed_user(app, email="stream-pending@example.com")
+    seed_round(app, user_id, 0)
+    round_id = _mark_streaming(app, user_id=user_id)
+    client = app.test_client()
+
+    resp = client.get("/api/round1/get-question-audio", headers=headers)
+    assert resp.status_code == 202
+    body = resp.get_json()
+    assert body["round_status"] == "generating"
+    assert body["retry_after"] > 0
+
+    question_id = _add_question(app, round_id)
+    resp = client.get("/api/round1/get-question-audio", headers=headers)
+    assert resp.status_code == 200
+    assert resp.get_json()["question_id"] == question_id
+
+
+def test_stale_streaming_mark_is_not_pending(app):
+    user_id, headers = seed_user(app, email="stream-stale@example.com")
+    seed_round(app, user_id, 0)
+    _mark_streaming(app, user_id=user_id, started_at=datetime.utcnow() - timedelta(hours=1))
+
+    resp = app.test_client().get("/api/round1/get-question-audio", headers=headers)
+    assert resp.status_code == 200
+    assert resp.get_json()["round_status"] == "no_more_questions"
@@ -0,0 +1,93 @@
+import io
+import os
+import tempfile
+
+import pytest
+
+from benchmarks._common import seed_user
+
+fitz = pytest.importorskip("fitz")
+pytest.importorskip("docx2txt")
+
+
+def make_pdf(pages: int) -> bytes:
+    doc = fitz.open()
+    for i in range(pages):
+        doc.new_page().insert_text((72, 72), f"Page {i} experience")
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+class Upload:
+    def __init__(self, data: bytes, filename: str = "cv.pdf"):
+        self.stream = io.BytesIO(data)
+        self.filename = filename
+
+
+def test_read_upload_stops_past_the_limit():
+    from utils.resume_parser import ResumeTooLarge, read_upload
+
+    data, digest = read_upload(io.BytesIO(b"x" * 10), max_bytes=10)
+    assert data == b"x" * 10 and len(digest) == 64
+    with pytest.raises(ResumeTooLarge):
+        read_upload(io.BytesIO(b"x" * 11), max_bytes=10)
+
+
+def test_parallel_pdf_extraction_keeps_page_order(monkeypatch):
+    from config.settings import Settings
+    from utils.resume_parser import parse_pdf
+
+    data = make_pdf(6)
+    sequential = parse_pdf(data)
+    monkeypatch.setattr(Settings, "RESUME_PARSE_WORKERS", 3)
+    monkeypatch.setattr(Settings, "RESUME_PARALLEL_MIN_PAGES", 2)
+
+    assert parse_pdf(data) == sequential
+    assert sequential.index("Page 0") < sequential.index("Page 5")
+
+
+def test_same_file_is_parsed_once(monkeypatch):
+    from utils import resume_parser
+    from utils.resume_cache import ResumeTextCache
+
+    cache = ResumeTextCache(os.path.join(tempfile.mkdtemp(prefix="resume_cache_"), "cache.db"), ttl=60, max_entries=10)
+    monkeypatch.setattr(resume_parser, "get_resume_cache", lambda: cache)
+    data = make_pdf(1)
+
+    first = resume_parser.parse_resume(Upload(data))
+    second = resume_parser.parse_resume(Upload(data))
+    assert (first["cached"], second["cached"]) == (False, True)
+    assert first["text"] == second["text"]
+
+
+def test_oversized_upload_is_rejected_before_parsing(app, monkeypatch):
+    from config.settings import Settings
+
+    monkeypatch.setattr(Settings, "RESUME_MAX_BYTES", 1000)
+    monkeypatch.setattr(Settings, "MULTIPART_OVERHEAD_BYTES", 1000)
+    _, headers = seed_user(app, email="resume-big@example.com", resume=None, jd=None)
+
+    resp = app.test_client(use_cookies=False).post(
+        "/api/upload-resume",
+        headers=headers,
+        data={"file": (io.BytesIO(b"x" * (2 << 20)), "cv.pdf"), "job_description": "Backend role"},
+        content_type="multipart/form-data",
+    )
+    assert resp.status_code == 413
+
+
+def test_upload_stores_the_parsed_resume(app, monkeypatch):
+    from config.settings import Settings
+
+    monkeypatch.setattr(Settings, "CANDIDATE_PROFILE_ENABLED", "False")
+    _, headers = seed_user(app, email="resume-ok@example.com", resume=None, jd=None)
+
+    resp = app.test_client(use_cookies=False).post(
+        "/api/upload-resume",
+        headers=headers,
+        data={"file": (io.BytesIO(make_pdf(2)), "cv.pdf"), "job_description": "Backend role"},
+        content_type="multipart/form-data",
+    )
+    assert resp.status_code == 200, resp.get_json()
+    assert "Page 1 experience" in resp.get_json()["resume_text"]
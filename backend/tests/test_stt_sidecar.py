@@ -0,0 +1,60 @@
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("dotenv")  # config.settings needs it
+
+from tools.stt_sidecar import (  # noqa: E402
+    BatchingTranscriber, SidecarError, SidecarSTTClient, _make_handler, _ThreadingUnixHTTPServer,
+)
+
+
+class FakeManager:
+    """Echoes each request's sample count and records the batch sizes it was given."""
+
+    def __init__(self):
+        self.batches = []
+
+    def transcribe_batch(self, audios):
+        self.batches.append(len(audios))
+        return [f"{len(audio)} samples" for audio in audios]
+
+    def status(self):
+        return {"loaded": True, "model": "fake"}
+
+
+@pytest.fixture
+def sidecar():
+    manager = FakeManager()
+    transcriber = BatchingTranscriber(manager, workers=1, max_batch=8, batch_wait_ms=100, queue_size=16)
+    path = os.path.join(tempfile.mkdtemp(prefix="stt_"), "stt.sock")
+    server = _ThreadingUnixHTTPServer(path, _make_handler(transcriber, timeout=10))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield manager, SidecarSTTClient(f"unix://{path}", timeout=10)
+    server.shutdown()
+    server.server_close()
+
+
+def test_concurrent_requests_share_batches(sidecar):
+    manager, client = sidecar
+    sizes = [1600 * (i + 1) for i in range(6)]
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        texts = list(pool.map(lambda n: client.transcribe_pcm(np.zeros(n, dtype=np.float32)), sizes))
+
+    assert texts == [f"{n} samples" for n in sizes]
+    assert sum(manager.batches) == 6
+    assert max(manager.batches) > 1
+
+
+def test_health_and_errors(sidecar):
+    _, client = sidecar
+    assert client.health() == (200, {"loaded": True, "model": "fake", "queue_depth": 0})
+    with pytest.raises(SidecarError, match="Audio body required"):
+        client.transcribe_bytes(b"")
+    with pytest.raises(SidecarError, match="unreachable"):
+        SidecarSTTClient("unix:///nonexistent/stt.sock", timeout=1).health()
@@ -0,0 +1,45 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("dotenv")  # config.settings needs it
+
+from tools.whisper_stt import WhisperModelManager  # noqa: E402
+
+
+class OverlapDetectingModel:
+    """Stand-in model that records whether two calls were ever inside it at once."""
+
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.guard = threading.Lock()
+
+    def transcribe(self, audio, **options):
+        with self.guard:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.01)
+        with self.guard:
+            self.active -= 1
+        return {"text": str(audio)}
+
+
+def test_concurrent_transcribe_calls_do_not_overlap():
+    manager = WhisperModelManager("base")
+    manager._model = model = OverlapDetectingModel()
+
+    results = {}
+
+    def run(i):
+        results[i] = manager.transcribe(i)["text"]
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert model.max_active == 1
+    assert results == {i: str(i) for i in range(8)}
@@ -0,0 +1,159 @@
+import hashlib
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict
+
+
+logger = logging.getLogger(__name__)
+
+_KEY_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+class AudioCache:
+    """Content-addressed, size-bounded cache of synthesized audio files.
+
+    Files are named ``<sha256(text, voice, engine, format)>.<format>`` so identical
+    question texts share one file across users. Least-recently-used files are
+    evicted once the directory grows past ``max_bytes``. Recency is mirrored in
+    file mtimes, so the order survives restarts and is shared (approximately)
+    between worker processes pointing at the same directory.
+    """
+
+    def __init__(self, directory: str, url_prefix: str, max_bytes: int):
+        self.directory = directory
+        self.url_prefix = url_prefix.rstrip("/")
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, int]" = OrderedDict()  # filename -> size, LRU first
+        self._total = 0
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.evicted_bytes = 0
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def key(text: str, voice: str, engine: str, fmt: str) -> str:
+        h = hashlib.sha256()
+        for part in (engine, voice, fmt, text.strip()):
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def _load_index(self) -> None:
+        found = []
+        for name in os.listdir(self.directory):
+            stem, _, ext = name.partition(".")
+            if not _KEY_RE.match(stem) or "." in ext:
+                continue  # legacy q_<id>.mp3 files and stray temp files are left alone
+            try:
+                st = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            found.append((st.st_mtime, name, st.st_size))
+        for _, name, size in sorted(found):
+            self._entries[name] = size
+            self._total += size
+
+    def url_for(self, filename: str) -> str:
+        return f"{self.url_prefix}/{filename}"
+
+    def lookup(self, text: str, voice: str, engine: str, fmt: str):
+        """Return the URL if the audio is already cached, else None (no synthesis)."""
+        filename = f"{self.key(text, voice, engine, fmt)}.{fmt}"
+        if self._touch(filename):
+            return self.url_for(filename)
+        return None
+
+    def get_or_create(
+        self,
+        text: str,
+        voice: str,
+        engine: str,
+        fmt: str,
+        synthesize: Callable[[str], None],
+    ) -> str:
+        """Return the URL for ``text``, calling ``synthesize(path)`` only on a miss."""
+        filename = f"{self.key(text, voice, engine, fmt)}.{fmt}"
+        if self._touch(filename):
+            return self.url_for(filename)
+
+        # One synthesis per key even if several requests miss at once
+        with self._lock:
+            key_lock = self._inflight.setdefault(filename, threading.Lock())
+        with key_lock:
+            if self._touch(filename):
+                return self.url_for(filename)
+            path = os.path.join(self.directory, filename)
+            if os.path.exists(path):
+                # Written by another worker process: adopt it instead of re-synthesizing
+                self._add(filename, os.path.getsize(path))
+                with self._lock:
+                    self.hits += 1
+                    self._inflight.pop(filename, None)
+                return self.url_for(filename)
+            with self._lock:
+                self.misses += 1
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            try:
+                synthesize(tmp_path)
+                os.replace(tmp_path, path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            self._add(filename, os.path.getsize(path))
+        with self._lock:
+            self._inflight.pop(filename, None)
+        return self.url_for(filename)
+
+    def _touch(self, filename: str) -> bool:
+        path = os.path.join(self.directory, filename)
+        with self._lock:
+            if filename not in self._entries:
+                return False
+            if not os.path.exists(path):
+                # Evicted by another process
+                self._total -= self._entries.pop(filename)
+                return False
+            self._entries.move_to_end(filename)
+            self.hits += 1
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return True
+
+    def _add(self, filename: str, size: int) -> None:
+        with self._lock:
+            self._total -= self._entries.pop(filename, 0)
+            self._entries[filename] = size
+            self._total += size
+            while self._total > self.max_bytes and len(self._entries) > 1:
+                victim, vsize = self._entries.popitem(last=False)
+                self._total -= vsize
+                self.evictions += 1
+                self.evicted_bytes += vsize
+                try:
+                    os.remove(os.path.join(self.directory, victim))
+                except OSError:
+                    pass
+                logger.info("TTS cache evicted %s (%s bytes)", victim, vsize)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+                "evictions": self.evictions,
+                "evicted_bytes": self.evicted_bytes,
+                "files": len(self._entries),
+                "bytes": self._total,
+                "max_bytes": self.max_bytes,
+            }
@@ -0,0 +1,123 @@
+import subprocess
+import threading
+from typing import Iterable
+
+import numpy as np
+
+
+SAMPLE_RATE = 16000
+READ_BLOCK = 1 << 16
+
+
+class UploadTooLarge(ValueError):
+    pass
+
+
+class AudioDecodeError(ValueError):
+    pass
+
+
+def iter_stream(stream, block_size: int = READ_BLOCK) -> Iterable[bytes]:
+    """Yield blocks from a file-like object until EOF."""
+    while True:
+        block = stream.read(block_size)
+        if not block:
+            return
+        yield block
+
+
+def decode_audio(chunks: Iterable[bytes], max_bytes: int, sr: int = SAMPLE_RATE) -> np.ndarray:
+    """Decode encoded audio (webm/ogg/wav/...) into a mono float32 array at ``sr`` Hz.
+
+    Input blocks are piped straight into ffmpeg's stdin as they are read, so
+    nothing touches disk and the encoded upload is never held in memory as a
+    whole. ffmpeg emits float32 PCM, which is read into one growing buffer and
+    wrapped by NumPy without another copy. ``UploadTooLarge`` is raised as soon
+    as more than ``max_bytes`` of input has been seen.
+    """
+    cmd = [
+        "ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error",
+        "-threads", "0",
+        "-i", "pipe:0",
+        "-f", "f32le", "-acodec", "pcm_f32le", "-ac", "1", "-ar", str(sr),
+        "pipe:1",
+    ]
+    try:
+        proc = subprocess.Popen(
+            cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+    except FileNotFoundError as e:
+        raise AudioDecodeError("ffmpeg is not installed") from e
+
+    state = {"bytes": 0, "too_large": False, "error": None}
+
+    def feed():
+        try:
+            for block in chunks:
+                state["bytes"] += len(block)
+                if state["bytes"] > max_bytes:
+                    state["too_large"] = True
+                    proc.kill()
+                    return
+                proc.stdin.write(block)
+        except (BrokenPipeError, OSError) as e:
+            state["error"] = e  # ffmpeg exited early; its stderr explains why
+        except Exception as e:
+            state["error"] = e
+            proc.kill()
+        finally:
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
+
+    writer = threading.Thread(target=feed, name="audio-decode-feed", daemon=True)
+    writer.start()
+
+    buf = bytearray()
+    while True:
+        block = proc.stdout.read(READ_BLOCK)
+        if not block:
+            break
+        buf += block
+    stderr = proc.stderr.read()
+    proc.wait()
+    writer.join()
+
+    if state["too_large"]:
+        raise UploadTooLarge(f"Audio upload exceeds {max_bytes} bytes")
+    if proc.returncode != 0:
+        raise AudioDecodeError(f"Failed to decode audio: {stderr.decode(errors='replace').strip()}")
+    if state["error"] is not None and not isinstance(state["error"], OSError):
+        raise AudioDecodeError(str(state["error"]))
+    if not buf:
+        raise AudioDecodeError("Audio contains no samples")
+
+    usable = len(buf) - (len(buf) % 4)
+    # frombuffer over a bytearray is zero-copy and writable (torch.from_numpy needs that)
+    return np.frombuffer(memoryview(buf)[:usable], dtype=np.float32)
+
+
+def decode_file(path: str, start_seconds: float = 0.0, sr: int = SAMPLE_RATE) -> np.ndarray:
+    """Decode the audio in ``path`` from ``start_seconds`` on into a mono float32 array.
+
+    The offset is passed to ffmpeg as an input seek, so only the part after it
+    is decoded. For webm/opus the seek lands within a few milliseconds of the
+    requested point. An empty array is returned when nothing follows it.
+    """
+    cmd = [
+        "ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error",
+        "-threads", "0",
+        "-ss", f"{start_seconds:.3f}",
+        "-i", path,
+        "-f", "f32le", "-acodec", "pcm_f32le", "-ac", "1", "-ar", str(sr),
+        "pipe:1",
+    ]
+    try:
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except FileNotFoundError as e:
+        raise AudioDecodeError("ffmpeg is not installed") from e
+    if proc.returncode != 0:
+        raise AudioDecodeError(f"Failed to decode audio: {proc.stderr.decode(errors='replace').strip()}")
+    out = proc.stdout
+    return np.frombuffer(out[: len(out) - (len(out) % 4)], dtype=np.float32).copy()
@@ -0,0 +1,265 @@
+"""Local speech-to-text sidecar: one Whisper model shared by every web worker.
+
+Run it next to the web workers and point them at it with
+``STT_BACKEND=sidecar``::
+
+    python -m tools.stt_sidecar                              # http://127.0.0.1:8765
+    STT_SIDECAR_URL=unix:///tmp/stt.sock python -m tools.stt_sidecar
+
+Endpoints:
+    POST /transcribe   encoded audio bytes, or 16 kHz float32 PCM with
+                       ``Content-Type: application/x-pcm-f32le``
+                       -> {"text", "queue_ms", "infer_ms", "batch"}
+    GET  /health       model manager status (200 when loaded, 503 otherwise)
+
+Requests are put on a bounded queue. Inference threads drain it in
+micro-batches of up to ``STT_SIDECAR_MAX_BATCH`` requests and hand them to
+``WhisperModelManager.transcribe_batch``. A full queue answers 503 so callers
+can back off.
+"""
+import http.client
+import json
+import logging
+import os
+import queue
+import socket
+import socketserver
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+from urllib.parse import urlparse
+
+import numpy as np
+
+from config.settings import Settings
+from tools.audio_decode import AudioDecodeError, UploadTooLarge, decode_audio
+
+
+logger = logging.getLogger(__name__)
+
+
+PCM_CONTENT_TYPE = "application/x-pcm-f32le"
+
+
+class SidecarError(RuntimeError):
+    pass
+
+
+# ---------------- Client ----------------
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self._socket_path)
+        self.sock = sock
+
+
+class SidecarSTTClient:
+    """Sends audio to the sidecar over local HTTP or a Unix socket."""
+
+    def __init__(self, url: str, timeout: float):
+        self.url = url
+        self.timeout = timeout
+        parsed = urlparse(url)
+        self._unix_path = parsed.path if parsed.scheme == "unix" else None
+        self._host = parsed.hostname
+        self._port = parsed.port
+
+    def _connection(self) -> http.client.HTTPConnection:
+        if self._unix_path:
+            return _UnixHTTPConnection(self._unix_path, self.timeout)
+        return http.client.HTTPConnection(self._host, self._port, timeout=self.timeout)
+
+    def _request(
+        self, method: str, path: str, body: bytes = None, content_type: str = "application/octet-stream"
+    ) -> Tuple[int, Dict]:
+        conn = self._connection()
+        try:
+            headers = {"Content-Type": content_type} if body is not None else {}
+            conn.request(method, path, body=body, headers=headers)
+            resp = conn.getresponse()
+            return resp.status, json.loads(resp.read() or b"{}")
+        except (OSError, http.client.HTTPException) as e:
+            raise SidecarError(f"STT sidecar unreachable at {self.url}: {e}") from e
+        finally:
+            conn.close()
+
+    def transcribe_bytes(self, data: bytes, content_type: str = "application/octet-stream") -> str:
+        status, payload = self._request("POST", "/transcribe", data, content_type)
+        if status != 200:
+            raise SidecarError(payload.get("error") or f"STT sidecar returned {status}")
+        return payload["text"]
+
+    def transcribe_pcm(self, audio) -> str:
+        """Send an already-decoded 16 kHz float32 array (no re-encode, no temp file)."""
+        return self.transcribe_bytes(memoryview(audio).cast("B"), PCM_CONTENT_TYPE)
+
+    def transcribe_file(self, audio_path: str) -> str:
+        with open(audio_path, "rb") as f:
+            return self.transcribe_bytes(f.read())
+
+    def health(self) -> Tuple[int, Dict]:
+        return self._request("GET", "/health")
+
+
+# ---------------- Server ----------------
+
+class _Job:
+    __slots__ = ("audio", "future", "enqueued_at")
+
+    def __init__(self, audio):
+        self.audio = audio
+        self.future: Future = Future()
+        self.enqueued_at = time.perf_counter()
+
+
+class BatchingTranscriber:
+    """Bounded request queue drained by inference threads in micro-batches."""
+
+    def __init__(self, manager, workers: int, max_batch: int, batch_wait_ms: float, queue_size: int):
+        self.manager = manager
+        self.max_batch = max(1, max_batch)
+        self.batch_wait = batch_wait_ms / 1000.0
+        self._queue: "queue.Queue[_Job]" = queue.Queue(maxsize=queue_size)
+        self._threads = [
+            threading.Thread(target=self._loop, name=f"stt-infer-{i}", daemon=True)
+            for i in range(max(1, workers))
+        ]
+        for t in self._threads:
+            t.start()
+
+    def submit(self, audio) -> Future:
+        job = _Job(audio)
+        self._queue.put_nowait(job)  # raises queue.Full when saturated
+        return job.future
+
+    def _next_batch(self) -> List[_Job]:
+        batch = [self._queue.get()]
+        deadline = time.perf_counter() + self.batch_wait
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            try:
+                if remaining > 0:
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _loop(self) -> None:
+        while True:
+            batch = self._next_batch()
+            started = time.perf_counter()
+            try:
+                texts = self.manager.transcribe_batch([job.audio for job in batch])
+            except Exception as e:
+                logger.exception("STT sidecar batch failed size=%s", len(batch))
+                for job in batch:
+                    job.future.set_exception(e)
+                continue
+            infer_ms = (time.perf_counter() - started) * 1000
+            for job, text in zip(batch, texts):
+                job.future.set_result({
+                    "text": text,
+                    "queue_ms": (started - job.enqueued_at) * 1000,
+                    "infer_ms": infer_ms,
+                    "batch": len(batch),
+                })
+
+
+def _make_handler(transcriber: BatchingTranscriber, timeout: float):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send(self, status: int, payload: Dict) -> None:
+            body = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path != "/health":
+                return self._send(404, {"error": "Not found"})
+            status = transcriber.manager.status()
+            status["queue_depth"] = transcriber._queue.qsize()
+            self._send(200 if status["loaded"] else 503, status)
+
+        def do_POST(self):
+            if self.path != "/transcribe":
+                return self._send(404, {"error": "Not found"})
+            length = int(self.headers.get("Content-Length") or 0)
+            if length <= 0:
+                return self._send(400, {"error": "Audio body required"})
+            if length > Settings.ROUND1_MAX_UPLOAD_BYTES * 4:
+                return self._send(413, {"error": "Audio too large"})
+            body = self.rfile.read(length)
+            try:
+                if self.headers.get("Content-Type") == PCM_CONTENT_TYPE:
+                    audio = np.frombuffer(bytearray(body), dtype=np.float32)
+                else:
+                    audio = decode_audio([body], max_bytes=Settings.ROUND1_MAX_UPLOAD_BYTES)
+            except (AudioDecodeError, UploadTooLarge, ValueError) as e:
+                return self._send(400, {"error": str(e)})
+            try:
+                future = transcriber.submit(audio)
+            except queue.Full:
+                return self._send(503, {"error": "STT queue full"})
+            try:
+                self._send(200, future.result(timeout=timeout))
+            except Exception as e:
+                self._send(500, {"error": str(e)})
+
+        def log_message(self, fmt, *args):
+            logger.debug("STT sidecar %s", fmt % args)
+
+    return Handler
+
+
+class _ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ("unix", 0)
+
+
+def serve(url: str = None) -> None:
+    from tools.whisper_stt import model_manager
+
+    url = url or Settings.STT_SIDECAR_URL
+    model_manager.warmup()
+    transcriber = BatchingTranscriber(
+        model_manager,
+        workers=Settings.STT_SIDECAR_WORKERS,
+        max_batch=Settings.STT_SIDECAR_MAX_BATCH,
+        batch_wait_ms=Settings.STT_SIDECAR_BATCH_WAIT_MS,
+        queue_size=Settings.STT_SIDECAR_QUEUE_SIZE,
+    )
+    handler = _make_handler(transcriber, Settings.STT_SIDECAR_TIMEOUT)
+    parsed = urlparse(url)
+    if parsed.scheme == "unix":
+        if os.path.exists(parsed.path):
+            os.remove(parsed.path)
+        server = _ThreadingUnixHTTPServer(parsed.path, handler)
+    else:
+        server = ThreadingHTTPServer((parsed.hostname or "127.0.0.1", parsed.port or 8765), handler)
+    logger.info("STT sidecar listening on %s", url)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    serve()
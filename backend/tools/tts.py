@@ -1,7 +1,16 @@
 from gtts import gTTS
 
+ENGINE = "gtts"
+FORMAT = "mp3"
+
+
+def synthesize(text, path, lang="en", tld="com"):
+    """Render ``text`` to an mp3 at ``path``."""
+    tts = gTTS(text, lang=lang, tld=tld)
+    tts.save(path)
+
+
 def text_to_speech(text, filename="q1"):
-    tts = gTTS(text)
     path = f"static/audio/{filename}.mp3"
-    tts.save(path)
+    synthesize(text, path)
     return f"/static/audio/{filename}.mp3"
@@ -1,9 +1,217 @@
-import whisper
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
 
-class STT:
-    model = whisper.load_model("base")
+from config.settings import Settings, get_bool
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+logger = logging.getLogger(__name__)
+
+
+def _process_rss_bytes() -> Optional[int]:
+    """Current resident set size of this process (Linux), falling back to peak RSS."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        pass
+    if resource is None:
+        return None
+    try:
+        # ru_maxrss is KiB on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    except Exception:
+        return None
+
+
+class WhisperModelManager:
+    """Loads the Whisper model on first use (or on ``warmup()``) instead of at import.
+
+    Importing this module does not import ``whisper``/``torch``, so workers that
+    never transcribe (e.g. ones only serving /api/auth) never pay for the model.
+
+    Inference is serialized on one lock. Whisper's decoder installs its kv-cache
+    hooks on the shared model for each call, so two concurrent decodes would
+    read each other's cache. Job-queue workers, the ASGI STT pool, answer
+    streams and sidecar threads all queue on that lock.
+    """
+
+    def __init__(
+        self,
+        model_size: str,
+        device: Optional[str] = None,
+        threads: int = 0,
+        fp16: bool = False,
+        download_root: Optional[str] = None,
+    ):
+        self.model_size = model_size
+        self.device = device or None
+        self.threads = threads
+        self.fp16 = fp16
+        self.download_root = download_root or None
+        self._model = None
+        self._lock = threading.Lock()
+        self._infer_lock = threading.Lock()
+        self._loading = False
+        self._error: Optional[str] = None
+        self._load_seconds: Optional[float] = None
+        self._model_bytes: Optional[int] = None
+        self._rss_before: Optional[int] = None
+        self._rss_after: Optional[int] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._model is not None
+
+    def get_model(self):
+        if self._model is None:
+            self._load()
+        return self._model
+
+    def warmup(self) -> Dict[str, Any]:
+        """Load the model now (no-op if already loaded) and return ``status()``."""
+        self.get_model()
+        return self.status()
+
+    def _load(self) -> None:
+        with self._lock:
+            if self._model is not None:
+                return
+            self._loading = True
+            self._error = None
+            self._rss_before = _process_rss_bytes()
+            start = time.perf_counter()
+            try:
+                import torch
+                import whisper
+
+                if self.threads > 0:
+                    torch.set_num_threads(self.threads)
+                model = whisper.load_model(
+                    self.model_size, device=self.device, download_root=self.download_root
+                )
+            except Exception as e:
+                self._error = str(e)
+                logger.exception("STT model load failed size=%s", self.model_size)
+                raise
+            finally:
+                self._loading = False
+            self._load_seconds = time.perf_counter() - start
+            self._model_bytes = sum(p.numel() * p.element_size() for p in model.parameters())
+            self._rss_after = _process_rss_bytes()
+            self._model = model
+            logger.info(
+                "STT model loaded size=%s device=%s seconds=%.2f model_bytes=%s",
+                self.model_size,
+                getattr(model, "device", self.device),
+                self._load_seconds,
+                self._model_bytes,
+            )
 
+    def transcribe(self, audio, **options) -> Dict[str, Any]:
+        """Run Whisper on a file path or a 16 kHz mono float32 array."""
+        model = self.get_model()
+        options.setdefault("language", "en")
+        options.setdefault("fp16", self.fp16)
+        with self._infer_lock:
+            return model.transcribe(audio, **options)
+
+    def transcribe_batch(self, audios: List[Any]) -> List[str]:
+        """Transcribe several inputs with one forward pass where Whisper allows it.
+
+        Clips that fit in a single 30 s window are decoded together as one mel
+        batch. Longer clips need Whisper's sliding-window ``transcribe`` and
+        are run one at a time.
+        """
+        import whisper
+
+        model = self.get_model()
+        arrays = [whisper.load_audio(a) if isinstance(a, str) else a for a in audios]
+        texts: List[Optional[str]] = [None] * len(arrays)
+
+        short = [i for i, a in enumerate(arrays) if len(a) <= whisper.audio.N_SAMPLES]
+        if len(short) > 1:
+            import torch
+
+            mels = torch.stack([
+                whisper.log_mel_spectrogram(
+                    whisper.pad_or_trim(arrays[i]), n_mels=model.dims.n_mels
+                )
+                for i in short
+            ]).to(model.device)
+            options = whisper.DecodingOptions(
+                language="en", fp16=self.fp16, without_timestamps=True
+            )
+            with self._infer_lock:
+                results = whisper.decode(model, mels, options)
+            for i, res in zip(short, results):
+                texts[i] = res.text
+        for i, a in enumerate(arrays):
+            if texts[i] is None:
+                texts[i] = self.transcribe(a)["text"]
+        return texts
+
+    def status(self) -> Dict[str, Any]:
+        model = self._model
+        return {
+            "loaded": model is not None,
+            "loading": self._loading,
+            "error": self._error,
+            "model": self.model_size,
+            "device": str(getattr(model, "device", self.device or "auto")),
+            "threads": self.threads,
+            "fp16": self.fp16,
+            "load_seconds": self._load_seconds,
+            "model_bytes": self._model_bytes,
+            "rss_delta_bytes": (
+                self._rss_after - self._rss_before
+                if self._rss_after is not None and self._rss_before is not None
+                else None
+            ),
+            "rss_bytes": _process_rss_bytes(),
+        }
+
+
+model_manager = WhisperModelManager(
+    model_size=Settings.WHISPER_MODEL,
+    device=Settings.WHISPER_DEVICE,
+    threads=Settings.WHISPER_THREADS,
+    fp16=get_bool(Settings.WHISPER_FP16),
+    download_root=Settings.WHISPER_DOWNLOAD_ROOT,
+)
+
+
+_sidecar_client = None
+
+
+def get_sidecar_client():
+    """Client for the shared STT sidecar (``STT_BACKEND=sidecar``), or None in-process."""
+    global _sidecar_client
+    if Settings.STT_BACKEND != "sidecar":
+        return None
+    if _sidecar_client is None:
+        from tools.stt_sidecar import SidecarSTTClient
+
+        _sidecar_client = SidecarSTTClient(Settings.STT_SIDECAR_URL, Settings.STT_SIDECAR_TIMEOUT)
+    return _sidecar_client
+
+
+class STT:
     @staticmethod
-    def transcribe_audio(audio_path: str) -> str:
-        result = STT.model.transcribe(audio_path, language="en")
+    def transcribe_audio(audio) -> str:
+        """Transcribe a file path or a 16 kHz mono float32 NumPy array."""
+        client = get_sidecar_client()
+        if client is not None:
+            if isinstance(audio, str):
+                return client.transcribe_file(audio)
+            return client.transcribe_pcm(audio)
+        result = model_manager.transcribe(audio)
         return result["text"]
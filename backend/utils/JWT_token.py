@@ -32,8 +32,10 @@ def _build_payload(user_id: int, token_type: str, expires_in_seconds: int) -> di
 	return payload
 
 
-def create_access_token(user_id: int) -> str:
+def create_access_token(user_id: int, token_version: int = 0) -> str:
 	payload = _build_payload(user_id, "access", Settings.JWT_ACCESS_TOKEN_EXPIRES)
+	# Checked against users.token_version so logout / password change revoke outstanding tokens
+	payload["ver"] = int(token_version or 0)
 	token = jwt.encode(payload, get_jwt_secret(), algorithm="HS256")
 	# PyJWT>=2 returns a str
 	return token
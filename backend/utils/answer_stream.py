@@ -0,0 +1,208 @@
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List
+
+from config.settings import Settings
+from tools.audio_decode import decode_file
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, streams are only locked within one process
+    fcntl = None
+
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+
+# Fallback without fcntl: key -> [lock, holders]; an entry is dropped once nobody holds or waits on it
+_locks: Dict[str, List[Any]] = {}
+_locks_guard = threading.Lock()
+
+
+class _StreamLock:
+    """Exclusive lock on one answer stream, shared by all worker processes.
+
+    Holds an ``flock`` on ``<key>.lock`` next to the stream files, taken through
+    a fresh descriptor each time, so it excludes other threads of this process
+    as well. The lock file outlives ``discard`` (deleting it under a holder
+    would let a second process lock a new file) and is removed by
+    ``_prune_stale``; if that happens while we wait, the lock is retaken on
+    the new file.
+    """
+
+    def __init__(self, key: str, path: str):
+        self.key = key
+        self.path = path
+        self._fd = None
+
+    def __enter__(self):
+        if fcntl is None:
+            with _locks_guard:
+                entry = _locks.setdefault(self.key, [threading.Lock(), 0])
+                entry[1] += 1
+            entry[0].acquire()
+            return self
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        while True:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                if os.fstat(fd).st_ino == os.stat(self.path).st_ino:
+                    os.utime(fd)  # keeps _prune_stale away from a lock in use
+                    self._fd = fd
+                    return self
+            except FileNotFoundError:
+                pass
+            except BaseException:
+                os.close(fd)
+                raise
+            os.close(fd)
+
+    def __exit__(self, *exc):
+        if fcntl is None:
+            with _locks_guard:
+                entry = _locks[self.key]
+                entry[0].release()
+                entry[1] -= 1
+                if not entry[1]:
+                    del _locks[self.key]
+            return False
+        fd, self._fd = self._fd, None
+        os.close(fd)  # closing the descriptor releases the flock
+        return False
+
+
+class AnswerStreamError(ValueError):
+    pass
+
+
+class AnswerStream:
+    """Chunked answer upload with incremental transcription for one question.
+
+    Browser MediaRecorder chunks are not independently decodable (only the first
+    carries the container header), so chunks are appended to one file and the
+    audio after the last committed point is re-decoded on each chunk. Once
+    ``ANSWER_STREAM_SEGMENT_SECONDS`` of uncommitted audio has built up it is
+    transcribed. Every Whisper segment except the last (which may be cut
+    mid-word) is committed to the running transcript, so at the final chunk
+    only the tail still needs transcribing.
+
+    State lives next to the audio as JSON so any worker process can take the
+    next chunk, and ``lock`` serializes the chunks of one answer across those
+    processes. Incremental transcription needs the in-process model. With the
+    STT sidecar the whole answer is transcribed when the final chunk arrives.
+    """
+
+    def __init__(self, user_id: int, question_id: int):
+        self.key = f"u{user_id}_q{question_id}"
+        self.directory = Settings.ANSWER_STREAM_DIR
+        self.audio_path = os.path.join(self.directory, f"{self.key}.webm")
+        self.state_path = os.path.join(self.directory, f"{self.key}.json")
+        self.lock = _StreamLock(self.key, os.path.join(self.directory, f"{self.key}.lock"))
+
+    def _load_state(self) -> Dict[str, Any]:
+        try:
+            with open(self.state_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"next_seq": 0, "bytes": 0, "committed_samples": 0, "text": ""}
+
+    def _save_state(self, state: Dict[str, Any]) -> None:
+        tmp = f"{self.state_path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp, self.state_path)
+
+    def append(self, chunk: bytes, seq: int) -> Dict[str, Any]:
+        """Append chunk ``seq``; duplicates of already-stored chunks are ignored."""
+        os.makedirs(self.directory, exist_ok=True)
+        if seq == 0:
+            self.discard()
+            _prune_stale(self.directory)
+        state = self._load_state()
+        if seq < state["next_seq"]:
+            return state  # client retry of a chunk we already have
+        if seq > state["next_seq"]:
+            raise AnswerStreamError(f"Expected chunk {state['next_seq']}, got {seq}")
+        if state["bytes"] + len(chunk) > Settings.ANSWER_STREAM_MAX_BYTES:
+            raise AnswerStreamError("Answer audio exceeds the maximum upload size")
+        with open(self.audio_path, "ab") as f:
+            f.write(chunk)
+        state["bytes"] += len(chunk)
+        state["next_seq"] = seq + 1
+        self._save_state(state)
+        return state
+
+    def _decode_pending(self, state: Dict[str, Any]):
+        # Seek past the committed audio so each chunk only decodes the uncommitted tail
+        return decode_file(self.audio_path, start_seconds=state["committed_samples"] / SAMPLE_RATE)
+
+    def advance(self) -> str:
+        """Transcribe and commit finished segments if enough audio is pending."""
+        from tools.whisper_stt import get_sidecar_client, model_manager
+
+        state = self._load_state()
+        if get_sidecar_client() is not None or state["bytes"] == 0:
+            return state["text"]
+        try:
+            pending = self._decode_pending(state)
+        except Exception:
+            # A chunk boundary can leave the container briefly undecodable
+            logger.debug("ANSWER stream %s not decodable yet", self.key)
+            return state["text"]
+        if len(pending) < Settings.ANSWER_STREAM_SEGMENT_SECONDS * SAMPLE_RATE:
+            return state["text"]
+
+        segments = model_manager.transcribe(pending).get("segments") or []
+        if len(segments) < 2:
+            return state["text"]
+        done = segments[:-1]
+        state["text"] = " ".join(
+            part for part in (state["text"], " ".join(s["text"].strip() for s in done)) if part
+        )
+        state["committed_samples"] += int(done[-1]["end"] * SAMPLE_RATE)
+        self._save_state(state)
+        return state["text"]
+
+    def finish(self) -> str:
+        """Transcribe whatever has not been committed yet and return the full transcript."""
+        from tools.whisper_stt import STT, get_sidecar_client, model_manager
+
+        state = self._load_state()
+        if state["bytes"] == 0:
+            raise AnswerStreamError("No audio received")
+        if get_sidecar_client() is not None:
+            return STT.transcribe_audio(self.audio_path).strip()
+        pending = self._decode_pending(state)
+        tail = model_manager.transcribe(pending)["text"].strip() if len(pending) else ""
+        return " ".join(part for part in (state["text"], tail) if part)
+
+    def partial_text(self) -> str:
+        return self._load_state()["text"]
+
+    def discard(self) -> None:
+        for path in (self.audio_path, self.state_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def _prune_stale(directory: str) -> None:
+    """Delete abandoned streams older than ``ANSWER_STREAM_TTL`` seconds."""
+    cutoff = time.time() - Settings.ANSWER_STREAM_TTL
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return
+    for name in names:
+        path = os.path.join(directory, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,70 @@
+"""Negotiated gzip / brotli compression of JSON responses.
+
+``init_app`` adds an ``after_request`` hook that compresses a JSON body of at
+least ``COMPRESS_MIN_BYTES`` with the best encoding the client accepts:
+brotli when the optional ``brotli`` package is installed, else gzip. Streamed
+responses (SSE) and responses that already carry a Content-Encoding are left
+alone. ``Vary: Accept-Encoding`` is set either way so caches keep the variants
+apart.
+"""
+import gzip
+import logging
+
+from flask import request
+
+from config.settings import Settings
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE = {"application/json"}
+
+
+def choose_encoding(accept_encodings) -> str:
+    """Pick ``br``, ``gzip`` or ``""`` from a werkzeug Accept-Encoding header."""
+    if brotli is not None and accept_encodings.quality("br") > 0:
+        return "br"
+    if accept_encodings.quality("gzip") > 0:
+        return "gzip"
+    return ""
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=Settings.COMPRESS_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=Settings.COMPRESS_GZIP_LEVEL, mtime=0)
+
+
+def _compress_response(response):
+    if (
+        response.direct_passthrough
+        or response.is_streamed
+        or response.mimetype not in COMPRESSIBLE
+        or "Content-Encoding" in response.headers
+        or not 200 <= response.status_code < 300
+    ):
+        return response
+    response.vary.add("Accept-Encoding")
+    if (response.content_length or 0) < Settings.COMPRESS_MIN_BYTES:
+        return response
+    encoding = choose_encoding(request.accept_encodings)
+    if not encoding:
+        return response
+    body = response.get_data()
+    try:
+        compressed = compress(body, encoding)
+    except Exception:
+        logger.exception("Response compression failed encoding=%s", encoding)
+        return response
+    response.set_data(compressed)
+    response.headers["Content-Encoding"] = encoding
+    return response
+
+
+def init_app(app) -> None:
+    app.after_request(_compress_response)
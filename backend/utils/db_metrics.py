@@ -0,0 +1,157 @@
+"""Database timing per Flask request and per statement fingerprint.
+
+``install(app, engine)`` adds SQLAlchemy cursor events and Flask request hooks:
+
+* every statement is timed and observed in ``db_statement_duration_seconds``
+  under its fingerprint (the SQL with literals and ``IN`` lists collapsed);
+* statements slower than ``DB_SLOW_QUERY_MS`` are logged with their fingerprint
+  and endpoint;
+* each request's statement count and DB time go to per-endpoint histograms,
+  one ``DB request`` log line and a ``Server-Timing: db`` response header.
+
+With ``DB_METRICS_ENABLED`` off nothing is installed, so the cost is zero.
+"""
+import contextvars
+import logging
+import re
+import time
+from functools import lru_cache
+from typing import Dict, Optional
+
+from flask import request
+from sqlalchemy import event
+
+from config.settings import Settings
+from utils.metrics import registry
+
+
+logger = logging.getLogger(__name__)
+
+STATEMENT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+COUNT_BUCKETS = (1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+
+DB_STATEMENT_DURATION = registry.histogram(
+    "db_statement_duration_seconds", "SQL statement duration by fingerprint.", ["fingerprint"], STATEMENT_BUCKETS
+)
+DB_SLOW_STATEMENTS = registry.counter(
+    "db_slow_statements_total", "Statements slower than DB_SLOW_QUERY_MS.", ["endpoint", "fingerprint"]
+)
+DB_REQUEST_TIME = registry.histogram(
+    "db_request_time_seconds", "Total time spent in SQL per request.", ["endpoint"], STATEMENT_BUCKETS
+)
+DB_REQUEST_STATEMENTS = registry.histogram(
+    "db_request_statements", "SQL statements per request.", ["endpoint"], COUNT_BUCKETS
+)
+
+# Per-request totals; None outside a Flask request (job threads, startup)
+_request_stats: contextvars.ContextVar = contextvars.ContextVar("db_request_stats", default=None)
+
+_WS = re.compile(r"\s+")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_NAMED_PARAM = re.compile(r"%\(\w+\)s|(?<![:\w]):\w+|\$\d+")  # psycopg / named / numeric paramstyles
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """Normalize SQL so the same query shape maps to one label."""
+    fp = _WS.sub(" ", statement).strip()
+    fp = _STRING.sub("?", fp)
+    fp = _NAMED_PARAM.sub("?", fp)
+    fp = _NUMBER.sub("?", fp)
+    fp = _PLACEHOLDER_LIST.sub("(?...)", fp)
+    return fp[:200]
+
+
+def current_request_stats() -> Optional[Dict[str, float]]:
+    """Statement count and DB time of the running request so far, or None outside a request."""
+    return _request_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("db_metrics_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("db_metrics_start")
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+    fp = fingerprint(statement)
+    DB_STATEMENT_DURATION.observe(elapsed, fingerprint=fp)
+    stats = _request_stats.get()
+    if stats is not None:
+        stats["statements"] += 1
+        stats["db_s"] += elapsed
+    if elapsed * 1000.0 >= Settings.DB_SLOW_QUERY_MS:
+        endpoint = "-"
+        if stats is not None:
+            endpoint = stats["endpoint"]
+            stats["slow"] += 1
+        DB_SLOW_STATEMENTS.inc(endpoint=endpoint, fingerprint=fp)
+        logger.warning("DB slow statement endpoint=%s duration_ms=%.1f fingerprint=%s", endpoint, elapsed * 1000.0, fp)
+
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute; drop its start time
+    conn = exception_context.connection
+    starts = conn.info.get("db_metrics_start") if conn is not None else None
+    if starts:
+        starts.pop()
+
+
+def _start_request():
+    _request_stats.set({"endpoint": request.endpoint or "unknown", "statements": 0, "db_s": 0.0, "slow": 0})
+
+
+def _add_server_timing(response):
+    stats = _request_stats.get()
+    if stats is not None:
+        response.headers.add(
+            "Server-Timing", f'db;dur={stats["db_s"] * 1000.0:.1f};desc="{stats["statements"]} statements"'
+        )
+    return response
+
+
+def _finish_request(exc=None):
+    # Runs after a streamed body is fully sent, so SSE work is included
+    stats = _request_stats.get()
+    if stats is None:
+        return
+    _request_stats.set(None)
+    endpoint = stats["endpoint"]
+    DB_REQUEST_TIME.observe(stats["db_s"], endpoint=endpoint)
+    DB_REQUEST_STATEMENTS.observe(stats["statements"], endpoint=endpoint)
+    logger.info(
+        "DB request endpoint=%s method=%s statements=%d db_ms=%.1f slow=%d",
+        endpoint, request.method, stats["statements"], stats["db_s"] * 1000.0, stats["slow"],
+    )
+
+
+def install(app, engine) -> None:
+    """Register the engine events and request hooks on ``app``."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+    app.before_request(_start_request)
+    app.after_request(_add_server_timing)
+    app.teardown_request(_finish_request)
+
+
+def uninstall(app, engine) -> None:
+    """Remove everything ``install`` registered (used by the overhead benchmark)."""
+    for name, fn in (
+        ("before_cursor_execute", _before_cursor_execute),
+        ("after_cursor_execute", _after_cursor_execute),
+        ("handle_error", _handle_error),
+    ):
+        if event.contains(engine, name, fn):
+            event.remove(engine, name, fn)
+    for funcs, fn in (
+        (app.before_request_funcs, _start_request),
+        (app.after_request_funcs, _add_server_timing),
+        (app.teardown_request_funcs, _finish_request),
+    ):
+        if fn in funcs.get(None, []):
+            funcs[None].remove(fn)
@@ -0,0 +1,41 @@
+"""``?fields=`` sparse fieldsets for JSON payloads.
+
+An endpoint declares a default selection and, when its keys are fixed, the
+keys a client may ask for. Clients pick keys with ``?fields=a,b,c`` or get
+everything with ``?fields=*``. Unknown names are ignored, so old clients keep
+working when a field is renamed or removed.
+"""
+from typing import Any, Dict, FrozenSet, Iterable, Optional
+
+from flask import request
+
+
+ALL = "*"
+
+
+def requested_fields(
+    default: Optional[Iterable[str]], allowed: Optional[Iterable[str]] = None, param: str = "fields"
+) -> Optional[FrozenSet[str]]:
+    """Keys selected by the current request's ``param``; None means every key.
+
+    Without the parameter the ``default`` applies (None: everything).
+    ``allowed`` caps what can be selected (None: any key).
+    """
+    raw = request.args.get(param)
+    if raw is None or not raw.strip():
+        names = None if default is None else frozenset(default)
+    else:
+        names = frozenset(name.strip() for name in raw.split(",") if name.strip())
+        if ALL in names:
+            names = None
+    if allowed is None:
+        return names
+    allowed = frozenset(allowed)
+    return allowed if names is None else names & allowed
+
+
+def select(data: Optional[Dict[str, Any]], fields: Optional[FrozenSet[str]]) -> Optional[Dict[str, Any]]:
+    """Keep only ``fields`` of ``data`` (all of it when ``fields`` is None)."""
+    if data is None or fields is None:
+        return data
+    return {key: value for key, value in data.items() if key in fields}
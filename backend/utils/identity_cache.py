@@ -0,0 +1,118 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from config.settings import Settings
+
+
+# User.to_dict() keys an Identity can answer without loading the row
+IDENTITY_FIELDS = frozenset(("id", "name", "email"))
+
+
+class Identity:
+    """The few user fields authorization needs; stands in for ``User`` on ``g.current_user``."""
+
+    __slots__ = ("id", "name", "email", "token_version")
+
+    def __init__(self, id: int, name: str, email: str, token_version: int):
+        self.id = id
+        self.name = name
+        self.email = email
+        self.token_version = token_version or 0
+
+    def __repr__(self):
+        return f"<Identity {self.email} v{self.token_version}>"
+
+
+class IdentityCache:
+    """Small TTL + LRU map of ``user_id -> Identity``.
+
+    Entries are per process. ``invalidate`` drops one user immediately in this
+    worker. Other workers see a token version bump (logout, password change)
+    within ``ttl`` seconds at most, when their entry expires.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self._entries: "OrderedDict[int, tuple]" = OrderedDict()  # user_id -> (expires_at, Identity)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, user_id: int) -> Optional[Identity]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[user_id]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, identity: Identity) -> None:
+        with self._lock:
+            self._entries[identity.id] = (time.monotonic() + self.ttl, identity)
+            self._entries.move_to_end(identity.id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            if self._entries.pop(user_id, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+                "invalidations": self.invalidations,
+            }
+
+
+_cache: Optional[IdentityCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_identity_cache() -> IdentityCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = IdentityCache(Settings.AUTH_IDENTITY_CACHE_SIZE, Settings.AUTH_IDENTITY_CACHE_TTL)
+    return _cache
+
+
+def load_identity(user_id: int) -> Optional[Identity]:
+    """Fetch only the identity columns (never the resume/JD blobs) and cache the result."""
+    from models.user import User
+
+    row = (
+        User.query.with_entities(User.id, User.name, User.email, User.token_version)
+        .filter(User.id == user_id)
+        .first()
+    )
+    if row is None:
+        return None
+    identity = Identity(row.id, row.name, row.email, row.token_version)
+    get_identity_cache().put(identity)
+    return identity
+
+
+def invalidate_identity(user_id: int) -> None:
+    get_identity_cache().invalidate(user_id)
@@ -1,23 +1,46 @@
 from __future__ import annotations
 import json
-import os
 import random
-import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import logging
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage, HumanMessage
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import contains_eager, selectinload
 
+from config.settings import Settings, get_bool
 from models import db, Interview, InterviewRound, InterviewQuestion, User
 from chains.generate_questions import QuestionGeneratorChain
-from tools.tts import text_to_speech as tts_text_to_speech
+from chains.profile_extractor import render_profile
+from tools import tts
+from tools.audio_cache import AudioCache
 from tools.whisper_stt import STT
+from utils.llm_cache import get_llm_cache
+from utils.llm_metrics import (
+    _token_usage,
+    ainvoke_instrumented,
+    invoke_instrumented,
+    llm_call_context,
+    record_cache_hit,
+    record_parse_fallback,
+    run_blocking,
+    stream_instrumented,
+)
+from utils.json_stream import JSONStringFieldStream, extract_json_object
 from utils.prompts import (
+    BATCH_EVAL_PROMPT_VERSION,
+    BATCH_EVAL_SYSTEM_PROMPT,
+    BATCH_EVAL_USER_TEMPLATE,
+    EVAL_PROMPT_VERSION,
     EVAL_SYSTEM_PROMPT,
     EVAL_USER_TEMPLATE,
+    ROUND_SUMMARY_PROMPT_VERSION,
     ROUND_SUMMARY_SYSTEM,
     ROUND_SUMMARY_USER_TEMPLATE,
 )
@@ -28,49 +51,124 @@ logger = logging.getLogger(__name__)
 
 # Low temperature for more deterministic evaluation JSON
 llm = ChatOpenAI(model="gpt-3.5-turbo", temperature=0.2)
+# Every call made through ``llm`` expects a JSON object back
+json_llm = llm.bind(response_format={"type": "json_object"})
+
+
+def chat_llm():
+    """The model to invoke: provider-enforced JSON output unless ``LLM_JSON_MODE`` is off."""
+    return json_llm if get_bool(Settings.LLM_JSON_MODE) else llm
 
 # Passing criteria for Round 1 (percentage 0-100)
 PASS_THRESHOLD = 70
 
+# Keys a usable response of each call site must have. Responses without them
+# are parsed as a fallback and never cached, so one bad completion is not
+# replayed to every identical request.
+RESPONSE_KEYS = {
+    "evaluate_answer": ("score",),
+    "summarize_round": ("pass",),
+    "evaluate_round_batch": ("evaluations",),
+}
+
+_audio_cache: Optional[AudioCache] = None
+_audio_cache_lock = threading.Lock()
+
+
+def get_audio_cache() -> AudioCache:
+    """Return the process-wide TTS cache, indexing the audio directory on first use."""
+    global _audio_cache
+    if _audio_cache is None:
+        with _audio_cache_lock:
+            if _audio_cache is None:
+                _audio_cache = AudioCache(
+                    Settings.TTS_CACHE_DIR,
+                    Settings.TTS_CACHE_URL_PREFIX,
+                    Settings.TTS_CACHE_MAX_BYTES,
+                )
+    return _audio_cache
+
 
 class InterviewUtils:
     @staticmethod
-    def _strip_fences(s: str) -> str:
-        s = s.strip()
-        # Remove triple backtick fences like ```json ... ```
-        if s.startswith("```") and s.endswith("```"):
-            return s[3:-3].strip()
-        # Remove ```json ... ``` prefix/suffix if present
-        s = re.sub(r"^```(?:json|JSON)?\s*\n", "", s)
-        s = re.sub(r"\n```\s*$", "", s)
-        return s.strip()
+    def _cache_lookup(messages: List[Any], call_site: str, template_version: str, use_cache: bool):
+        """Return ``(cache, key, cached_content)``; ``key`` is None when the cache is off or bypassed."""
+        cache = get_llm_cache()
+        if cache is None:
+            return None, None, None
+        if not use_cache:
+            cache.note_bypass()
+            return cache, None, None
+        # response_format and any other kwargs bound to the model change what it returns
+        bound_kwargs = getattr(chat_llm(), "kwargs", None)
+        key = cache.make_key(llm.model_name, llm.temperature, template_version, messages, bound_kwargs)
+        cached = cache.get(key)
+        if cached is not None:
+            logger.info("LLM cache hit call_site=%s", call_site)
+            record_cache_hit(call_site, llm.model_name)
+        return cache, key, cached
 
     @staticmethod
-    def _parse_json_safely(text: Optional[str]) -> Optional[Dict[str, Any]]:
-        if not text:
-            return None
-        s = InterviewUtils._strip_fences(text)
-        # 1) Direct parse
-        try:
-            return json.loads(s)
-        except Exception:
-            pass
-        # 2) Extract largest {...} block
-        try:
-            matches = list(re.finditer(r"\{[\s\S]*\}", s))
-            if matches:
-                block = s[matches[0].start() : matches[-1].end()]
-                return json.loads(block)
-        except Exception:
-            pass
-        # 3) Extract first code fence content if any
-        try:
-            m = re.search(r"```(?:json|JSON)?\n([\s\S]*?)\n```", text)
-            if m:
-                return json.loads(m.group(1))
-        except Exception:
-            pass
-        return None
+    def _cache_store(cache, key: Optional[str], response, call_site: str) -> Optional[str]:
+        """Return the response text, caching it only when it parses for ``call_site``."""
+        content = getattr(response, "content", None)
+        if cache is not None and key is not None and content:
+            required = RESPONSE_KEYS.get(call_site, ())
+            if extract_json_object(content, required) is None:
+                logger.warning("LLM response not cached call_site=%s: no JSON object with %s", call_site, required)
+                return content
+            usage = _token_usage(response)
+            cache.put(key, content, call_site, llm.model_name, **usage)
+        return content
+
+    @staticmethod
+    def _invoke_llm(messages: List[Any], call_site: str, template_version: str, use_cache: bool = True) -> Optional[str]:
+        """Invoke the evaluator LLM, serving byte-identical requests from the response cache."""
+        cache, key, cached = InterviewUtils._cache_lookup(messages, call_site, template_version, use_cache)
+        if cached is not None:
+            return cached
+        response = invoke_instrumented(chat_llm(), messages, call_site)
+        return InterviewUtils._cache_store(cache, key, response, call_site)
+
+    @staticmethod
+    async def _ainvoke_llm(
+        messages: List[Any], call_site: str, template_version: str, use_cache: bool = True
+    ) -> Optional[str]:
+        """``_invoke_llm`` on the async client; the event loop is free while the model runs.
+
+        The SQLite cache lookup and store run on worker threads, as does the
+        ``llm_calls`` insert in ``ainvoke_instrumented``.
+        """
+        cache, key, cached = await run_blocking(
+            InterviewUtils._cache_lookup, messages, call_site, template_version, use_cache
+        )
+        if cached is not None:
+            return cached
+        response = await ainvoke_instrumented(chat_llm(), messages, call_site)
+        return await run_blocking(InterviewUtils._cache_store, cache, key, response, call_site)
+
+    @staticmethod
+    def _parse_json_safely(text: Optional[str], required: Tuple[str, ...] = ()) -> Optional[Dict[str, Any]]:
+        """First top-level JSON object in the model output that has the ``required`` keys, or None."""
+        return extract_json_object(text, required)
+
+    @staticmethod
+    def prompt_context(user: User) -> Tuple[str, str]:
+        """Return the ``(resume, jd)`` text to put in prompts.
+
+        Uses the compact candidate profile extracted at upload time when there is
+        one, and falls back to the raw resume and JD otherwise.
+        """
+        profile = getattr(user, "candidate_profile", None)
+        if profile and get_bool(Settings.CANDIDATE_PROFILE_ENABLED):
+            try:
+                resume, jd = render_profile(profile)
+                if resume and jd:
+                    return resume, jd
+            except Exception:
+                logger.exception("Failed to render candidate profile user_id=%s", getattr(user, "id", None))
+        return user.resume_text or "", user.job_description or ""
+
     @staticmethod
     def ensure_or_create_interview(user_id: int) -> Interview:
         """Fetch existing interview for user or create a new in-progress one."""
@@ -97,7 +195,14 @@ class InterviewUtils:
                 started_at=datetime.utcnow(),
             )
             db.session.add(round_obj)
-            db.session.commit()
+            try:
+                db.session.commit()
+            except IntegrityError:
+                # A concurrent request created it first (unique interview_id + round_number)
+                db.session.rollback()
+                round_obj = InterviewRound.query.filter_by(
+                    interview_id=interview.id, round_number=round_number
+                ).one()
         else:
             # If round exists but is pending, kick it to in_progress on use
             if round_obj.status == "pending":
@@ -108,7 +213,8 @@ class InterviewUtils:
         return round_obj
 
     @staticmethod
-    def generate_and_store_questions(user: User, round_obj: InterviewRound, num_q: int = 5) -> List[InterviewQuestion]:
+    def generate_question_texts(user: User, num_q: int = 5, round_id: Optional[int] = None) -> List[str]:
+        """Ask the question chain for ``num_q`` fresh questions and normalize them to strings."""
 
         # Ask chain for questions
         randomizer = f"{time.time()}-{random.randint(1000, 9999)}"
@@ -117,28 +223,69 @@ class InterviewUtils:
             logger.info(
                 "QGEN start user_id=%s round_id=%s num_q=%s resume_len=%s jd_len=%s",
                 getattr(user, "id", None),
-                getattr(round_obj, "id", None),
+                round_id,
                 num_q,
                 len(user.resume_text or ""),
                 len(user.job_description or ""),
             )
         except Exception:
             pass
+        resume, jd = InterviewUtils.prompt_context(user)
         qchain = QuestionGeneratorChain()
-        qset = qchain.generate_questions(
-            user.resume_text or "",
-            user.job_description or "",
-            "easy",
-            num_q,
-            randomizer,
-        )
+        with llm_call_context(getattr(user, "id", None), round_id):
+            qset = qchain.generate_questions(
+                resume,
+                jd,
+                "easy",
+                num_q,
+                randomizer,
+            )
+        return InterviewUtils._normalize_question_texts(qset, num_q)
+
+    @staticmethod
+    async def agenerate_question_texts(
+        resume: str, jd: str, num_q: int = 5, user_id: Optional[int] = None, round_id: Optional[int] = None
+    ) -> List[str]:
+        """Async ``generate_question_texts``; takes the prompt context so no ORM access is needed."""
+        randomizer = f"{time.time()}-{random.randint(1000, 9999)}"
+        logger.info("QGEN start (async) user_id=%s round_id=%s num_q=%s", user_id, round_id, num_q)
+        qchain = QuestionGeneratorChain()
+        with llm_call_context(user_id, round_id):
+            qset = await qchain.agenerate_questions(resume, jd, "easy", num_q, randomizer)
+        return InterviewUtils._normalize_question_texts(qset, num_q)
+
+    @staticmethod
+    def stream_question_texts(user: User, num_q: int = 5, round_id: Optional[int] = None) -> Iterator[str]:
+        """Streaming ``generate_question_texts``: yields each question string as soon as the
+        model has finished writing it, up to ``num_q``.
+        """
+        randomizer = f"{time.time()}-{random.randint(1000, 9999)}"
+        logger.info("QGEN start (stream) user_id=%s round_id=%s num_q=%s", getattr(user, "id", None), round_id, num_q)
+        resume, jd = InterviewUtils.prompt_context(user)
+        qchain = QuestionGeneratorChain()
+        produced = 0
+        with llm_call_context(getattr(user, "id", None), round_id):
+            for item in qchain.stream_questions(resume, jd, "easy", num_q, randomizer):
+                if isinstance(item, dict) and "questions" in item:
+                    # Unparseable stream: the chain fell back to parsing the whole response
+                    texts = InterviewUtils._normalize_question_texts(item, num_q - produced)
+                else:
+                    texts = InterviewUtils._normalize_question_texts({"questions": [item]}, 1)
+                # Keep draining past num_q so the call is still recorded with its token usage
+                for text in texts[:max(0, num_q - produced)]:
+                    produced += 1
+                    yield text
+
+    @staticmethod
+    def _normalize_question_texts(qset: Dict[str, Any], num_q: int) -> List[str]:
         # Debug: log raw LLM output (truncate to avoid huge logs)
         try:
             logger.debug("QGEN raw output=%s", json.dumps(qset)[:2000])
         except Exception:
             pass
+        if qset.get("error"):
+            record_parse_fallback("generate_questions")
         raw_questions = qset.get("questions", [])
-        created: List[InterviewQuestion] = []
 
         # Normalize to a list of question strings
         if isinstance(raw_questions, str):
@@ -158,27 +305,109 @@ class InterviewUtils:
                     break
         else:
             normalized = []
+        return normalized
+
+    @staticmethod
+    def generate_and_store_questions(
+        user: Optional[User], round_id: int, num_q: int = 5, texts: Optional[List[str]] = None
+    ) -> List[InterviewQuestion]:
+        """Persist ``texts`` (or a freshly generated set for ``user``) as the round's questions.
+
+        ``user`` is only read when ``texts`` is None, so callers that already
+        have the texts can pass None and skip loading it.
+        """
+        user_id = getattr(user, "id", None)
+        if texts is None:
+            texts = InterviewUtils.generate_question_texts(user, num_q, round_id)
+        created: List[InterviewQuestion] = []
 
         # Persist
-        for qtext in normalized:
-            iq = InterviewQuestion(round_id=round_obj.id, question_text=qtext)
+        for qtext in texts[:num_q]:
+            iq = InterviewQuestion(round_id=round_id, question_text=qtext)
             db.session.add(iq)
             created.append(iq)
         db.session.commit()
+        created = InterviewUtils.refresh_questions(created)
         # Debug: log result summary
         try:
-            logger.info(
-                "QGEN done user_id=%s round_id=%s created=%s", getattr(user, "id", None), getattr(round_obj, "id", None), len(created)
-            )
+            logger.info("QGEN done user_id=%s round_id=%s created=%s", user_id, round_id, len(created))
             if not created:
                 logger.warning("QGEN produced empty question set")
         except Exception:
             pass
         return created
 
+    @staticmethod
+    def load_question_context(
+        question_id: int, user_id: int, with_questions: bool = True
+    ) -> Optional[InterviewQuestion]:
+        """Load a question of ``user_id`` with its round, interview, user and documents in one statement.
+
+        With ``with_questions`` the round's questions come in a second
+        (selectin) statement. Returns None if the question does not exist or
+        belongs to someone else. Objects expired by an earlier commit are
+        refreshed, so this can also be used to re-load after a commit.
+        """
+        # One contains_eager chain over explicit joins. populate_existing() is left out on
+        # purpose: it would carry into the selectin load of the round's questions and
+        # reset this question's ``round``, bringing the lazy loads back. Expired objects
+        # are refreshed from the rows anyway.
+        round_path = contains_eager(InterviewQuestion.round)
+        options = [
+            round_path.contains_eager(InterviewRound.interview)
+            .contains_eager(Interview.user)
+            .contains_eager(User.documents)
+        ]
+        if with_questions:
+            options.append(round_path.selectinload(InterviewRound.questions))
+        return (
+            InterviewQuestion.query.join(InterviewQuestion.round)
+            .join(InterviewRound.interview)
+            .join(Interview.user)
+            .outerjoin(User.documents)
+            .options(*options)
+            .filter(InterviewQuestion.id == question_id, Interview.user_id == user_id)
+            .one_or_none()
+        )
+
+    @staticmethod
+    def load_round_context(user_id: int, round_number: int = 1) -> Optional[InterviewRound]:
+        """The user's round with its interview, user, documents and questions in two statements, or None."""
+        return (
+            InterviewRound.query.join(InterviewRound.interview)
+            .join(Interview.user)
+            .outerjoin(User.documents)
+            .options(
+                contains_eager(InterviewRound.interview).contains_eager(Interview.user).contains_eager(User.documents),
+                selectinload(InterviewRound.questions),
+            )
+            .filter(Interview.user_id == user_id, InterviewRound.round_number == round_number)
+            .order_by(Interview.id.asc())
+            .first()
+        )
+
+    @staticmethod
+    def refresh_questions(questions: List[InterviewQuestion]) -> List[InterviewQuestion]:
+        """Re-load questions expired by a commit in one statement instead of one per object."""
+        ids = [sa_inspect(q).identity[0] for q in questions]
+        if not ids:
+            return []
+        return (
+            InterviewQuestion.query.filter(InterviewQuestion.id.in_(ids))
+            .order_by(InterviewQuestion.id.asc())
+            .all()
+        )
+
     @staticmethod
     def get_next_unanswered(round_obj: InterviewRound) -> Optional[InterviewQuestion]:
-        """Return the next unanswered question for the given round (or None)."""
+        """Return the next unanswered question for the given round (or None).
+
+        Picks from ``round_obj.questions`` when they are already loaded (see
+        ``load_round_context``) instead of querying again.
+        """
+        if "questions" not in sa_inspect(round_obj).unloaded:
+            pending = [q for q in round_obj.questions if q.answer_text is None]
+            return min(pending, key=lambda q: q.id) if pending else None
         return (
             InterviewQuestion.query.filter_by(round_id=round_obj.id, answer_text=None)
             .order_by(InterviewQuestion.id.asc())
@@ -186,20 +415,81 @@ class InterviewUtils:
         )
 
     @staticmethod
-    def text_to_speech(text: str, filename: Optional[str] = None) -> str:
-        os.makedirs(os.path.join("static", "audio"), exist_ok=True)
-        safe_name = filename or f"q_{int(time.time())}_{random.randint(1000,9999)}"
-        audio_url = tts_text_to_speech(text, filename=safe_name)
-        return audio_url
+    def has_unanswered(round_id: int) -> bool:
+        """Whether the round still has an unanswered question, as committed in the database."""
+        return (
+            db.session.query(InterviewQuestion.id)
+            .filter_by(round_id=round_id, answer_text=None)
+            .first()
+            is not None
+        )
+
+    @staticmethod
+    def question_belongs_to(question_id: int, user_id: int) -> bool:
+        """Whether ``question_id`` exists and is ``user_id``'s; one indexed lookup, no rows loaded."""
+        return (
+            db.session.query(InterviewQuestion.id)
+            .join(InterviewQuestion.round)
+            .join(InterviewRound.interview)
+            .filter(InterviewQuestion.id == question_id, Interview.user_id == user_id)
+            .first()
+            is not None
+        )
+
+    @staticmethod
+    def text_to_speech(text: str) -> str:
+        """Return the audio URL for ``text``, synthesizing only on a cache miss."""
+        voice = f"{Settings.TTS_LANG}-{Settings.TTS_TLD}"
+        return get_audio_cache().get_or_create(
+            text,
+            voice,
+            tts.ENGINE,
+            tts.FORMAT,
+            lambda path: tts.synthesize(text, path, lang=Settings.TTS_LANG, tld=Settings.TTS_TLD),
+        )
+
+    @staticmethod
+    def cached_audio_url(text: str) -> Optional[str]:
+        """Return the cached audio URL for ``text`` without synthesizing, or None."""
+        voice = f"{Settings.TTS_LANG}-{Settings.TTS_TLD}"
+        return get_audio_cache().lookup(text, voice, tts.ENGINE, tts.FORMAT)
+
+    @staticmethod
+    def presynthesize_one(text: str) -> Optional[str]:
+        """``text_to_speech`` that logs and returns None on failure (synthesized lazily later)."""
+        try:
+            return InterviewUtils.text_to_speech(text)
+        except Exception:
+            logger.exception("TTS presynthesis failed; falling back to lazy synthesis")
+            return None
 
     @staticmethod
-    def speech_to_text(audio_path: str) -> str:
-        """Transcribe audio at the given file path to text using Whisper STT."""
-        return STT.transcribe_audio(audio_path)
+    def presynthesize_audio(questions: List[InterviewQuestion]) -> int:
+        """Synthesize audio for all questions concurrently and record their URLs.
+
+        A failed question keeps ``audio_url`` empty and is synthesized lazily later.
+        Returns the number of questions that got audio.
+        """
+        if not questions:
+            return 0
+        texts = [q.question_text for q in questions]
+        workers = max(1, min(Settings.TTS_PRESYNTH_WORKERS, len(texts)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tts-presynth") as pool:
+            urls = list(pool.map(InterviewUtils.presynthesize_one, texts))
+
+        for q, url in zip(questions, urls):
+            q.audio_url = url
+        db.session.commit()
+        return sum(1 for url in urls if url)
+
+    @staticmethod
+    def speech_to_text(audio) -> str:
+        """Transcribe a file path or decoded 16 kHz float32 array using Whisper STT."""
+        return STT.transcribe_audio(audio)
 
     @staticmethod
-    def evaluate_answer(question: str, answer: str, resume: str, jd: str) -> Dict[str, Any]:
-        messages = [
+    def _eval_messages(question: str, answer: str, resume: str, jd: str) -> List[Any]:
+        return [
             SystemMessage(content=EVAL_SYSTEM_PROMPT),
             HumanMessage(
                 content=EVAL_USER_TEMPLATE.format(
@@ -207,8 +497,9 @@ class InterviewUtils:
                 )
             ),
         ]
-        response = llm.invoke(messages)
-        parsed = InterviewUtils._parse_json_safely(getattr(response, "content", None))
+
+    @staticmethod
+    def _normalize_evaluation(parsed: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         # Sensible defaults if parsing fails
         if not parsed or not isinstance(parsed, dict):
             parsed = {
@@ -240,40 +531,83 @@ class InterviewUtils:
         return normalized
 
     @staticmethod
-    def summarize_round(round_obj: InterviewRound, user: User) -> Dict[str, Any]:
-        """Summarize round results via LLM and persist status to the DB."""
-        evaluations = [q.evaluation_json for q in round_obj.questions if q.evaluation_json]
+    def evaluate_answer(question: str, answer: str, resume: str, jd: str, use_cache: bool = True) -> Dict[str, Any]:
+        messages = InterviewUtils._eval_messages(question, answer, resume, jd)
+        content = InterviewUtils._invoke_llm(messages, "evaluate_answer", EVAL_PROMPT_VERSION, use_cache)
+        return InterviewUtils._evaluation_from_content(content)
+
+    @staticmethod
+    async def aevaluate_answer(question: str, answer: str, resume: str, jd: str, use_cache: bool = True) -> Dict[str, Any]:
+        messages = InterviewUtils._eval_messages(question, answer, resume, jd)
+        content = await InterviewUtils._ainvoke_llm(messages, "evaluate_answer", EVAL_PROMPT_VERSION, use_cache)
+        return InterviewUtils._evaluation_from_content(content)
+
+    @staticmethod
+    def stream_evaluation(
+        question: str, answer: str, resume: str, jd: str, use_cache: bool = True
+    ) -> Iterator[Tuple[str, Any]]:
+        """Streaming ``evaluate_answer``: yields ``("feedback", text_delta)`` as tokens arrive,
+        then ``("evaluation", normalized)``, the same dict ``evaluate_answer`` returns.
+        """
+        messages = InterviewUtils._eval_messages(question, answer, resume, jd)
+        cache, key, cached = InterviewUtils._cache_lookup(messages, "evaluate_answer", EVAL_PROMPT_VERSION, use_cache)
+        if cached is not None:
+            evaluation = InterviewUtils._evaluation_from_content(cached)
+            if evaluation["feedback"]:
+                yield "feedback", evaluation["feedback"]
+            yield "evaluation", evaluation
+            return
 
-        messages = [
+        feedback = JSONStringFieldStream("feedback")
+        merged = None
+        for chunk in stream_instrumented(chat_llm(), messages, "evaluate_answer"):
+            merged = chunk if merged is None else merged + chunk
+            delta = feedback.feed(chunk.content or "")
+            if delta:
+                yield "feedback", delta
+        content = InterviewUtils._cache_store(cache, key, merged, "evaluate_answer")
+        yield "evaluation", InterviewUtils._evaluation_from_content(content)
+
+    @staticmethod
+    def _evaluation_from_content(content: Optional[str]) -> Dict[str, Any]:
+        parsed = InterviewUtils._parse_json_safely(content, RESPONSE_KEYS["evaluate_answer"])
+        if not isinstance(parsed, dict):
+            record_parse_fallback("evaluate_answer")
+        return InterviewUtils._normalize_evaluation(parsed)
+
+    @staticmethod
+    def _summary_messages(evaluations: List[Dict[str, Any]], resume: str, jd: str) -> List[Any]:
+        return [
             SystemMessage(content=ROUND_SUMMARY_SYSTEM),
             HumanMessage(
                 content=ROUND_SUMMARY_USER_TEMPLATE.format(
                     evaluations=json.dumps(evaluations),
-                    resume=user.resume_text or "",
-                    jd=user.job_description or "",
+                    resume=resume,
+                    jd=jd,
                 )
             ),
         ]
-        response = llm.invoke(messages)
-        parsed = InterviewUtils._parse_json_safely(getattr(response, "content", None))
 
-        if not parsed or not isinstance(parsed, dict):
-            # Fallback: simple aggregate
-            if evaluations:
-                scores = [e.get("score", 0) for e in evaluations if isinstance(e, dict)]
-                avg10 = sum(scores) / max(1, len(scores))
-                percent = (avg10 / 10.0) * 100.0
-            else:
-                percent = 0.0
-            parsed = {
-                "overall_score": int(round(percent)),
-                "pass": percent >= PASS_THRESHOLD,
-                "strengths": [],
-                "gaps": [],
-                "recommendations": [],
-                "topic_breakdown": [],
-            }
+    @staticmethod
+    def _fallback_summary(evaluations: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Simple score aggregate used when the summary output cannot be parsed."""
+        if evaluations:
+            scores = [e.get("score", 0) for e in evaluations if isinstance(e, dict)]
+            avg10 = sum(scores) / max(1, len(scores))
+            percent = (avg10 / 10.0) * 100.0
+        else:
+            percent = 0.0
+        return {
+            "overall_score": int(round(percent)),
+            "pass": percent >= PASS_THRESHOLD,
+            "strengths": [],
+            "gaps": [],
+            "recommendations": [],
+            "topic_breakdown": [],
+        }
 
+    @staticmethod
+    def _finalize_round(round_obj: InterviewRound, parsed: Dict[str, Any]) -> Dict[str, Any]:
         # Persist outcome and mark round completion
         round_obj.result_json = parsed
         round_obj.status = "pass" if bool(parsed.get("pass")) else "fail"
@@ -283,3 +617,121 @@ class InterviewUtils:
         # Enrich with convenience flag for FE
         parsed["eligible_for_round_2"] = bool(parsed.get("pass"))
         return parsed
+
+    @staticmethod
+    def summarize_round(
+        round_obj: InterviewRound, user: User, use_cache: bool = True, content: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Summarize round results via LLM and persist status to the DB.
+
+        ``content`` is a model response already obtained for
+        ``completion_request`` (async path); the LLM is then not called again.
+        """
+        evaluations = [q.evaluation_json for q in round_obj.questions if q.evaluation_json]
+
+        if content is None:
+            resume, jd = InterviewUtils.prompt_context(user)
+            messages = InterviewUtils._summary_messages(evaluations, resume, jd)
+            with llm_call_context(user.id, round_obj.id):
+                content = InterviewUtils._invoke_llm(messages, "summarize_round", ROUND_SUMMARY_PROMPT_VERSION, use_cache)
+        parsed = InterviewUtils._parse_json_safely(content, RESPONSE_KEYS["summarize_round"])
+
+        if not parsed or not isinstance(parsed, dict):
+            record_parse_fallback("summarize_round")
+            parsed = InterviewUtils._fallback_summary(evaluations)
+        return InterviewUtils._finalize_round(round_obj, parsed)
+
+    @staticmethod
+    def _batch_messages(
+        pending: List[InterviewQuestion], previous: List[Dict[str, Any]], resume: str, jd: str
+    ) -> List[Any]:
+        answers = [
+            {"question_id": q.id, "question": q.question_text, "answer": q.answer_text or ""}
+            for q in pending
+        ]
+        return [
+            SystemMessage(content=BATCH_EVAL_SYSTEM_PROMPT),
+            HumanMessage(
+                content=BATCH_EVAL_USER_TEMPLATE.format(
+                    answers=json.dumps(answers, ensure_ascii=False),
+                    previous_evaluations=json.dumps(previous),
+                    resume=resume,
+                    jd=jd,
+                )
+            ),
+        ]
+
+    @staticmethod
+    def completion_request(round_obj: InterviewRound, user: User, deferred: bool) -> Tuple[List[Any], str, str]:
+        """``(messages, call_site, template_version)`` of the LLM call that completes a round.
+
+        Lets the async path await the model itself and then hand the response to
+        ``summarize_round`` / ``evaluate_round_batch`` via ``content``.
+        """
+        resume, jd = InterviewUtils.prompt_context(user)
+        if deferred:
+            answered = sorted(
+                (q for q in round_obj.questions if q.answer_text is not None), key=lambda q: q.id
+            )
+            pending = [q for q in answered if not q.evaluation_json]
+            if pending:
+                previous = [q.evaluation_json for q in answered if q.evaluation_json]
+                messages = InterviewUtils._batch_messages(pending, previous, resume, jd)
+                return messages, "evaluate_round_batch", BATCH_EVAL_PROMPT_VERSION
+        evaluations = [q.evaluation_json for q in round_obj.questions if q.evaluation_json]
+        return InterviewUtils._summary_messages(evaluations, resume, jd), "summarize_round", ROUND_SUMMARY_PROMPT_VERSION
+
+    @staticmethod
+    def evaluate_round_batch(
+        round_obj: InterviewRound, user: User, use_cache: bool = True, content: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Evaluate every not-yet-evaluated answer and summarize the round in one LLM call.
+
+        Used by the deferred evaluation mode. Each parsed evaluation goes through
+        the same normalization as ``evaluate_answer``, so the stored
+        ``evaluation_json`` has the same shape. Answers the model skipped are
+        evaluated one by one, and an unparseable summary falls back to the
+        score aggregate.
+        """
+        answered = sorted(
+            (q for q in round_obj.questions if q.answer_text is not None), key=lambda q: q.id
+        )
+        pending = [q for q in answered if not q.evaluation_json]
+        previous = [q.evaluation_json for q in answered if q.evaluation_json]
+        if not pending:
+            return InterviewUtils.summarize_round(round_obj, user, use_cache, content)
+
+        resume, jd = InterviewUtils.prompt_context(user)
+        if content is None:
+            messages = InterviewUtils._batch_messages(pending, previous, resume, jd)
+            with llm_call_context(user.id, round_obj.id):
+                content = InterviewUtils._invoke_llm(messages, "evaluate_round_batch", BATCH_EVAL_PROMPT_VERSION, use_cache)
+        parsed = InterviewUtils._parse_json_safely(content, RESPONSE_KEYS["evaluate_round_batch"])
+        if not isinstance(parsed, dict):
+            record_parse_fallback("evaluate_round_batch")
+            parsed = {}
+
+        by_id: Dict[int, Dict[str, Any]] = {}
+        for item in parsed.get("evaluations") or []:
+            try:
+                by_id[int(item.get("question_id"))] = item
+            except (AttributeError, TypeError, ValueError):
+                continue
+
+        for q in pending:
+            if q.id in by_id:
+                q.evaluation_json = InterviewUtils._normalize_evaluation(by_id[q.id])
+            else:
+                logger.warning("BATCH eval missing question_id=%s; evaluating individually", q.id)
+                record_parse_fallback("evaluate_round_batch")
+                with llm_call_context(user.id, round_obj.id):
+                    q.evaluation_json = InterviewUtils.evaluate_answer(
+                        q.question_text, q.answer_text or "", resume, jd, use_cache
+                    )
+        db.session.commit()
+
+        summary = parsed.get("summary")
+        if not isinstance(summary, dict) or "pass" not in summary:
+            record_parse_fallback("evaluate_round_batch")
+            summary = InterviewUtils._fallback_summary([q.evaluation_json for q in answered])
+        return InterviewUtils._finalize_round(round_obj, summary)
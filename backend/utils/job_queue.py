@@ -0,0 +1,169 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Set
+
+from config.settings import Settings
+from utils.sqlite_cache import SQLiteCache
+
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueueFull(RuntimeError):
+    """Raised when the number of queued + running jobs reaches the configured cap."""
+
+
+class JobStore(SQLiteCache):
+    """Job status and results in a SQLite file shared by every web worker.
+
+    A job runs in the worker that accepted it, but ``GET /jobs/<id>`` can land
+    on any worker, so the state lives here rather than in process memory.
+    Rows expire ``ttl`` seconds after their last update (see ``SQLiteCache``).
+    """
+
+    TABLE = "round1_jobs"
+    COLUMNS = (
+        ("owner_id", "INTEGER NOT NULL"),
+        ("status", "TEXT NOT NULL"),
+        ("result", "TEXT"),
+        ("error", "TEXT"),
+        ("submitted_at", "REAL NOT NULL"),
+        ("finished_at", "REAL"),
+    )
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        # Plain read: polling must not rewrite the row the way _get_row's hit bookkeeping does
+        try:
+            row = self._conn().execute(
+                f"SELECT owner_id, status, result, error, submitted_at, finished_at, created_at "
+                f"FROM {self.TABLE} WHERE key = ?",
+                (job_id,),
+            ).fetchone()
+        except sqlite3.Error:
+            logger.exception("%s read failed", self.TABLE)
+            return None
+        if not row or time.time() - row[6] > self.ttl:
+            return None
+        return {
+            "job_id": job_id,
+            "owner_id": row[0],
+            "status": row[1],
+            "result": json.loads(row[2]) if row[2] is not None else None,
+            "error": row[3],
+            "created_at": row[4],
+            "finished_at": row[5],
+        }
+
+    def put(self, job: Dict[str, Any]) -> None:
+        result = json.dumps(job["result"], default=str) if job["result"] is not None else None
+        self._put_row(
+            job["job_id"],
+            (job["owner_id"], job["status"], result, job["error"], job["created_at"], job["finished_at"]),
+        )
+
+
+class JobQueue:
+    """Bounded thread pool for background work with a shared job registry.
+
+    Each job runs inside a fresh app context so it can use ``db.session``.
+    Jobs move through ``queued -> running -> done | failed``; every transition
+    is written to the ``JobStore``, and finished jobs are kept for ``ttl``
+    seconds so clients can poll any worker for the result. The pending cap
+    counts this process's jobs, since those are the ones its pool has to run.
+    """
+
+    # How often get() re-reads the store while waiting on a job another worker runs
+    POLL_INTERVAL = 0.25
+
+    def __init__(self, max_workers: int, max_pending: int, ttl: int, store_path: str, max_entries: int):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="round1-job")
+        self._max_pending = max_pending
+        self._store = JobStore(store_path, ttl, max_entries)
+        self._active: Set[str] = set()
+        self._cond = threading.Condition()
+
+    def submit(self, app, owner_id: int, fn: Callable[..., Dict], *args) -> str:
+        with self._cond:
+            if len(self._active) >= self._max_pending:
+                raise JobQueueFull("Too many answers are being processed, retry shortly")
+            job_id = uuid.uuid4().hex
+            self._active.add(job_id)
+        self._store.put({
+            "job_id": job_id,
+            "owner_id": owner_id,
+            "status": "queued",
+            "result": None,
+            "error": None,
+            "created_at": time.time(),
+            "finished_at": None,
+        })
+        self._executor.submit(self._run, app, job_id, fn, args)
+        return job_id
+
+    def _run(self, app, job_id: str, fn: Callable[..., Dict], args) -> None:
+        self._update(job_id, status="running")
+        try:
+            with app.app_context():
+                result = fn(*args)
+            if isinstance(result, dict) and "error" in result:
+                self._update(job_id, status="failed", error=result["error"], result=result)
+            else:
+                self._update(job_id, status="done", result=result)
+        except Exception as e:
+            logger.exception("JOB failed job_id=%s", job_id)
+            self._update(job_id, status="failed", error=str(e))
+
+    def _update(self, job_id: str, **fields) -> None:
+        job = self._store.get(job_id)
+        if not job:
+            return
+        job.update(fields)
+        if job["status"] in ("done", "failed"):
+            job["finished_at"] = time.time()
+            with self._cond:
+                self._active.discard(job_id)
+        self._store.put(job)
+        with self._cond:
+            self._cond.notify_all()
+
+    def get(self, job_id: str, wait: float = 0) -> Optional[Dict[str, Any]]:
+        """Return a snapshot of the job, blocking up to ``wait`` seconds for it to finish.
+
+        Jobs run by this process wake the waiter as soon as they finish; jobs
+        run by another worker are re-read every ``POLL_INTERVAL`` seconds.
+        """
+        deadline = time.monotonic() + max(0.0, wait)
+        job = self._store.get(job_id)
+        while job and job["status"] in ("queued", "running"):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            with self._cond:
+                self._cond.wait(min(remaining, self.POLL_INTERVAL))
+            job = self._store.get(job_id)
+        return job
+
+
+_queue: Optional[JobQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """Return the process-wide job queue, creating it on first use."""
+    global _queue
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                _queue = JobQueue(
+                    max_workers=Settings.ROUND1_JOB_WORKERS,
+                    max_pending=Settings.ROUND1_JOB_MAX_PENDING,
+                    ttl=Settings.ROUND1_JOB_TTL,
+                    store_path=Settings.ROUND1_JOB_STORE_PATH,
+                    max_entries=Settings.ROUND1_JOB_MAX_ENTRIES,
+                )
+    return _queue
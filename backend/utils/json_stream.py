@@ -0,0 +1,289 @@
+import json
+import re
+from typing import Iterable, Optional
+
+
+# Characters that matter to brace matching outside / inside a string
+_STRUCTURAL = re.compile(r'\{+|[}"]')
+_STRING_SPECIAL = re.compile(r'["\\]')
+_OBJECT_START = re.compile(r'\{\s*["}]')
+# Prose up to the next block that may hold an object; "{this}" pairs are skipped with it
+_PROSE = re.compile(r'[^{]*(?:\{(?!\s*\})[^{}"]*\}[^{]*)*')
+
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+class JSONStringFieldStream:
+    """Incrementally extract one top-level string field from JSON arriving in pieces.
+
+    ``feed(text)`` returns the newly decoded characters of ``field``'s value,
+    so the value can be shown while the model is still writing the rest of the
+    object. It is a best-effort preview only: the final value always comes from
+    parsing the complete response.
+    """
+
+    def __init__(self, field: str):
+        self._key = re.compile(r'"%s"\s*:\s*"' % re.escape(field))
+        self._buf = ""
+        self._pos = 0
+        self._state = "search"  # search -> value -> done
+
+    @property
+    def done(self) -> bool:
+        return self._state == "done"
+
+    def feed(self, text: str) -> str:
+        if not text or self._state == "done":
+            return ""
+        self._buf += text
+        if self._state == "search":
+            m = self._key.search(self._buf)
+            if not m:
+                # Keep only a tail long enough to hold a key split across pieces
+                keep = len(self._key.pattern) + 16
+                self._buf = self._buf[-keep:]
+                return ""
+            self._state = "value"
+            self._pos = m.end()
+
+        out = []
+        buf, i = self._buf, self._pos
+        while i < len(buf):
+            ch = buf[i]
+            if ch == '"':
+                self._state = "done"
+                i += 1
+                break
+            if ch != "\\":
+                out.append(ch)
+                i += 1
+                continue
+            if i + 1 >= len(buf):
+                break  # escape split across pieces
+            esc = buf[i + 1]
+            if esc == "u":
+                decoded = self._unicode(buf, i)
+                if decoded is None:
+                    break
+                out.append(decoded[0])
+                i += decoded[1]
+                continue
+            out.append(_ESCAPES.get(esc, esc))
+            i += 2
+        self._buf, self._pos = buf[i:], 0
+        return "".join(out)
+
+    @staticmethod
+    def _unicode(buf: str, i: int) -> Optional[tuple]:
+        """Decode ``\\uXXXX`` (and a following low surrogate) at ``buf[i]``; None if incomplete."""
+        if i + 6 > len(buf):
+            return None
+        high = buf[i:i + 6]
+        code = int(high[2:], 16) if re.fullmatch(r"\\u[0-9a-fA-F]{4}", high) else None
+        if code is None:
+            return "�", 6
+        if 0xD800 <= code <= 0xDBFF:
+            if i + 12 > len(buf):
+                return None
+            return json.loads('"' + buf[i:i + 12] + '"'), 12
+        return chr(code), 6
+
+
+class JSONArrayItemStream:
+    """Incrementally parse the elements of one top-level array field, e.g. ``"questions": [...]``.
+
+    ``feed(text)`` returns the elements completed by ``text``, already decoded
+    with ``json.loads``. Elements that fail to decode are skipped. Scanning is
+    single-pass: every character is looked at once, tracking only nesting depth
+    and whether it is inside a string.
+    """
+
+    def __init__(self, field: str):
+        self._key = re.compile(r'"%s"\s*:\s*\[' % re.escape(field))
+        self._buf = ""
+        self._pos = 0          # next character to scan
+        self._start = None     # start of the element being scanned
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._state = "search"  # search -> items -> done
+
+    @property
+    def done(self) -> bool:
+        return self._state == "done"
+
+    def feed(self, text: str) -> list:
+        if not text or self._state == "done":
+            return []
+        self._buf += text
+        if self._state == "search":
+            m = self._key.search(self._buf)
+            if not m:
+                keep = len(self._key.pattern) + 16
+                self._buf = self._buf[-keep:]
+                return []
+            self._state = "items"
+            self._buf = self._buf[m.end():]
+            self._pos = 0
+
+        items = []
+        buf = self._buf
+        i = self._pos
+        while i < len(buf):
+            ch = buf[i]
+            if self._start is None:
+                if ch == "]":
+                    self._state = "done"
+                    break
+                if ch in " \t\r\n,":
+                    i += 1
+                    continue
+                self._start = i
+                self._depth = 0
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 0:
+                        self._emit(buf, i + 1, items)
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                if self._depth == 0:
+                    # A bare scalar ended by the closing bracket of the array
+                    self._emit(buf, i, items)
+                    self._state = "done"
+                    break
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit(buf, i + 1, items)
+            elif ch == "," and self._depth == 0:
+                self._emit(buf, i, items)
+            i += 1
+
+        # Drop everything already consumed, keeping a partial element
+        cut = self._start if self._start is not None else i
+        self._buf = buf[cut:]
+        self._pos = i - cut
+        if self._start is not None:
+            self._start = 0
+        return items
+
+    def _emit(self, buf: str, end: int, items: list) -> None:
+        raw = buf[self._start:end].strip()
+        self._start = None
+        if not raw:
+            return
+        try:
+            items.append(json.loads(raw))
+        except ValueError:
+            pass
+
+
+class JSONObjectStream:
+    """Pull complete top-level ``{...}`` objects out of text arriving in pieces.
+
+    Prose and code fences around an object are skipped. Braces are matched
+    in one pass, ignoring braces inside strings; the scan jumps between
+    structural characters with a regex, so ordinary text is not visited in
+    Python, and each piece is scanned once.
+
+    Only blocks that open at nesting depth 0 of the text are candidates. A
+    balanced block that does not decode to an object (``{this}`` in prose, a
+    single-quoted pseudo-JSON object) is dropped whole, objects nested inside
+    it included, so a malformed response never yields one of its inner dicts.
+    Scanning continues after the dropped block, so a long malformed output
+    still costs linear time.
+    """
+
+    def __init__(self):
+        self._parts = []       # pieces of the block currently open
+        self._depth = 0
+        self._in_string = False
+        self._escape = False   # the last piece ended on a backslash inside a string
+
+    def feed(self, text: str) -> list:
+        """Return the dicts completed by ``text``."""
+        if not text:
+            return []
+        n = len(text)
+        start = 0 if self._parts else None
+        objects = []
+        i = 0
+        while i < n:
+            if self._escape:
+                self._escape = False
+                i += 1
+                continue
+            if start is None:
+                # Outside any block only an opening brace matters
+                i = _PROSE.match(text, i).end()
+                if i >= n:
+                    break
+                start = i
+                self._depth = 0
+                self._in_string = False
+            m = (_STRING_SPECIAL if self._in_string else _STRUCTURAL).search(text, i)
+            if m is None:
+                break
+            i = m.start()
+            ch = text[i]
+            if ch == "\\":
+                if i + 1 >= n:
+                    self._escape = True
+                    break
+                i += 2
+                continue
+            if ch == '"':
+                self._in_string = not self._in_string
+            elif ch == "{":
+                self._depth += m.end() - i
+                i = m.end()
+                continue
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._parts.append(text[start:i + 1])
+                    raw, self._parts, start = "".join(self._parts), [], None
+                    value = None
+                    # An object opens with a key or closes at once
+                    if _OBJECT_START.match(raw):
+                        try:
+                            value = json.loads(raw)
+                        except ValueError:
+                            pass
+                    if isinstance(value, dict):
+                        objects.append(value)
+            i += 1
+        if start is not None:
+            self._parts.append(text[start:])
+        return objects
+
+
+def extract_json_object(text: Optional[str], required: Iterable[str] = ()) -> Optional[dict]:
+    """First top-level JSON object in ``text`` (bare, fenced or surrounded by prose), or None.
+
+    With ``required``, only an object that has all of those keys is accepted,
+    so a stray object in the output is not mistaken for the answer.
+    """
+    if not text:
+        return None
+    required = tuple(required)
+    stripped = text.strip()
+    if stripped.startswith("{"):
+        # Provider JSON mode and most plain outputs: a single object, decoded in C
+        try:
+            value = json.loads(stripped)
+        except ValueError:
+            value = None
+        if isinstance(value, dict):
+            return value if all(key in value for key in required) else None
+    for value in JSONObjectStream().feed(text):
+        if all(key in value for key in required):
+            return value
+    return None
@@ -0,0 +1,99 @@
+import hashlib
+import json
+import threading
+from typing import Any, Dict, List, Optional
+
+from config.settings import Settings, get_bool
+from utils.sqlite_cache import SQLiteCache
+
+
+class LLMCache(SQLiteCache):
+    """Persistent SQLite cache of LLM completions.
+
+    Keys hash the model name, temperature, the kwargs bound to the model (the
+    JSON output mode), prompt template version and the fully formatted
+    messages, so any change to a prompt, its inputs or the output mode misses.
+    Expiry, LRU eviction and connections are handled by ``SQLiteCache``.
+    """
+
+    TABLE = "llm_cache"
+    COLUMNS = (
+        ("call_site", "TEXT"),
+        ("model", "TEXT"),
+        ("content", "TEXT NOT NULL"),
+        ("prompt_tokens", "INTEGER DEFAULT 0"),
+        ("completion_tokens", "INTEGER DEFAULT 0"),
+    )
+
+    def __init__(self, path: str, ttl: int, max_entries: int):
+        super().__init__(path, ttl, max_entries)
+        self.bypassed = 0
+        self.saved_prompt_tokens = 0
+        self.saved_completion_tokens = 0
+
+    @staticmethod
+    def make_key(
+        model: str,
+        temperature: float,
+        template_version: str,
+        messages: List[Any],
+        bound_kwargs: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        payload = json.dumps(
+            {
+                "model": model,
+                "temperature": temperature,
+                "bound_kwargs": bound_kwargs or {},
+                "template_version": template_version,
+                "messages": [
+                    [getattr(m, "type", type(m).__name__), getattr(m, "content", str(m))]
+                    for m in messages
+                ],
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        row = self._get_row(key)
+        if row is None:
+            return None
+        with self._lock:
+            self.saved_prompt_tokens += row[3] or 0
+            self.saved_completion_tokens += row[4] or 0
+        return row[2]
+
+    def put(self, key: str, content: str, call_site: str, model: str,
+            prompt_tokens: int = 0, completion_tokens: int = 0) -> None:
+        self._put_row(key, (call_site, model, content, prompt_tokens, completion_tokens))
+
+    def note_bypass(self) -> None:
+        with self._lock:
+            self.bypassed += 1
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        with self._lock:
+            stats.update({
+                "bypassed": self.bypassed,
+                "saved_prompt_tokens": self.saved_prompt_tokens,
+                "saved_completion_tokens": self.saved_completion_tokens,
+            })
+        return stats
+
+
+_cache: Optional[LLMCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """Return the process-wide LLM cache, or None when ``LLM_CACHE_ENABLED`` is off."""
+    global _cache
+    if not get_bool(Settings.LLM_CACHE_ENABLED):
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LLMCache(Settings.LLM_CACHE_PATH, Settings.LLM_CACHE_TTL, Settings.LLM_CACHE_MAX_ENTRIES)
+    return _cache
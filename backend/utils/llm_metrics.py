@@ -0,0 +1,221 @@
+"""Instrumentation for every LLM invocation.
+
+``invoke_instrumented`` wraps ``runnable.invoke`` and records latency, token
+usage and status as Prometheus metrics. It also writes one ``llm_calls`` row
+per call so per-user and per-round totals can be queried later. The user and
+round come from ``llm_call_context``, which callers set around a unit of work.
+"""
+import asyncio
+import contextvars
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from flask import current_app
+from sqlalchemy import func
+
+from models import db, LLMCall
+from utils.metrics import registry
+
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.25, 0.5, 1, 2, 3, 5, 8, 13, 20, 30, 60)
+
+LLM_LATENCY = registry.histogram(
+    "llm_call_latency_seconds", "LLM call latency by call site.", ["call_site", "model", "status"], LATENCY_BUCKETS
+)
+LLM_CALLS = registry.counter("llm_calls_total", "LLM calls by call site and outcome.", ["call_site", "model", "status"])
+LLM_PROMPT_TOKENS = registry.counter("llm_prompt_tokens_total", "Prompt tokens reported by the provider.", ["call_site", "model"])
+LLM_COMPLETION_TOKENS = registry.counter(
+    "llm_completion_tokens_total", "Completion tokens reported by the provider.", ["call_site", "model"]
+)
+LLM_PARSE_FALLBACKS = registry.counter(
+    "llm_parse_fallbacks_total", "Model outputs that could not be parsed and fell back to defaults.", ["call_site"]
+)
+LLM_TTFT = registry.histogram(
+    "llm_time_to_first_token_seconds", "Time to the first streamed chunk.", ["call_site", "model"], LATENCY_BUCKETS
+)
+LLM_CACHE_HITS = registry.counter("llm_cache_hits_total", "LLM calls served from the response cache.", ["call_site"])
+
+_context: contextvars.ContextVar = contextvars.ContextVar("llm_call_context", default={})
+
+
+@contextmanager
+def llm_call_context(user_id: Optional[int] = None, round_id: Optional[int] = None):
+    """Attribute LLM calls made inside the block to ``user_id`` / ``round_id``."""
+    token = _context.set({"user_id": user_id, "round_id": round_id})
+    try:
+        yield
+    finally:
+        _context.reset(token)
+
+
+def _token_usage(response) -> Dict[str, int]:
+    """Prompt/completion token counts from a LangChain chat response (0 if unknown)."""
+    usage = getattr(response, "usage_metadata", None) or {}
+    if usage:
+        return {
+            "prompt_tokens": int(usage.get("input_tokens") or 0),
+            "completion_tokens": int(usage.get("output_tokens") or 0),
+        }
+    meta = (getattr(response, "response_metadata", None) or {}).get("token_usage") or {}
+    return {
+        "prompt_tokens": int(meta.get("prompt_tokens") or 0),
+        "completion_tokens": int(meta.get("completion_tokens") or 0),
+    }
+
+
+def _model_name(runnable) -> str:
+    # prompt | llm sequences keep the model on the last step; llm.bind(...) wraps it in ``bound``
+    for step in (runnable, getattr(runnable, "last", None)):
+        for candidate in (step, getattr(step, "bound", None)):
+            name = getattr(candidate, "model_name", None)
+            if isinstance(name, str):
+                return name
+    return "unknown"
+
+
+def _persist(call_site: str, model: str, status: str, usage: Dict[str, int], latency: float) -> None:
+    """Insert one ``llm_calls`` row on its own connection so the caller's session is untouched."""
+    ctx = _context.get()
+    try:
+        with db.engine.begin() as conn:
+            conn.execute(LLMCall.__table__.insert().values(
+                call_site=call_site,
+                model=model,
+                user_id=ctx.get("user_id"),
+                round_id=ctx.get("round_id"),
+                status=status,
+                prompt_tokens=usage.get("prompt_tokens", 0),
+                completion_tokens=usage.get("completion_tokens", 0),
+                latency_ms=latency * 1000.0,
+            ))
+    except Exception:
+        logger.exception("Failed to record LLM call call_site=%s", call_site)
+
+
+def _record_error(call_site: str, model: str, latency: float) -> None:
+    LLM_LATENCY.observe(latency, call_site=call_site, model=model, status="error")
+    LLM_CALLS.inc(call_site=call_site, model=model, status="error")
+    _persist(call_site, model, "error", {}, latency)
+
+
+def _record_ok(call_site: str, model: str, response, latency: float) -> None:
+    usage = _token_usage(response)
+    LLM_LATENCY.observe(latency, call_site=call_site, model=model, status="ok")
+    LLM_CALLS.inc(call_site=call_site, model=model, status="ok")
+    LLM_PROMPT_TOKENS.inc(usage["prompt_tokens"], call_site=call_site, model=model)
+    LLM_COMPLETION_TOKENS.inc(usage["completion_tokens"], call_site=call_site, model=model)
+    _persist(call_site, model, "ok", usage, latency)
+    logger.info(
+        "LLM call call_site=%s model=%s latency_ms=%.0f prompt_tokens=%s completion_tokens=%s",
+        call_site, model, latency * 1000.0, usage["prompt_tokens"], usage["completion_tokens"],
+    )
+
+
+def invoke_instrumented(runnable, payload: Any, call_site: str):
+    """``runnable.invoke(payload)`` with latency, token and outcome recording."""
+    model = _model_name(runnable)
+    start = time.perf_counter()
+    try:
+        response = runnable.invoke(payload)
+    except Exception:
+        _record_error(call_site, model, time.perf_counter() - start)
+        raise
+    _record_ok(call_site, model, response, time.perf_counter() - start)
+    return response
+
+
+def stream_instrumented(runnable, payload: Any, call_site: str) -> Iterator[Any]:
+    """``runnable.stream(payload)`` yielding chunks; records time to first chunk and, at the end,
+    the same latency/token metrics as ``invoke_instrumented`` (usage from the merged chunks).
+    """
+    model = _model_name(runnable)
+    start = time.perf_counter()
+    merged = None
+    try:
+        for chunk in runnable.stream(payload, stream_usage=True):
+            if merged is None:
+                LLM_TTFT.observe(time.perf_counter() - start, call_site=call_site, model=model)
+                merged = chunk
+            else:
+                merged = merged + chunk
+            yield chunk
+    except Exception:
+        _record_error(call_site, model, time.perf_counter() - start)
+        raise
+    _record_ok(call_site, model, merged, time.perf_counter() - start)
+
+
+async def run_blocking(fn, *args):
+    """Run ``fn(*args)`` on the loop's default executor, in a fresh app context of the current app.
+
+    Contextvars (``llm_call_context``) are carried over. The fresh app context
+    keeps the worker thread off the caller's database session.
+    """
+    app = current_app._get_current_object()
+    ctx = contextvars.copy_context()
+
+    def call():
+        with app.app_context():
+            return fn(*args)
+
+    return await asyncio.get_running_loop().run_in_executor(None, ctx.run, call)
+
+
+async def ainvoke_instrumented(runnable, payload: Any, call_site: str):
+    """``await runnable.ainvoke(payload)`` with the same recording as ``invoke_instrumented``.
+
+    The ``llm_calls`` insert runs through ``run_blocking``, so the event loop
+    never waits on the database. The caller must have an app context pushed.
+    """
+    model = _model_name(runnable)
+    start = time.perf_counter()
+    try:
+        response = await runnable.ainvoke(payload)
+    except Exception:
+        await run_blocking(_record_error, call_site, model, time.perf_counter() - start)
+        raise
+    await run_blocking(_record_ok, call_site, model, response, time.perf_counter() - start)
+    return response
+
+
+def record_cache_hit(call_site: str, model: str) -> None:
+    LLM_CACHE_HITS.inc(call_site=call_site)
+    LLM_CALLS.inc(call_site=call_site, model=model, status="cached")
+    _persist(call_site, model, "cached", {}, 0.0)
+
+
+def record_parse_fallback(call_site: str) -> None:
+    LLM_PARSE_FALLBACKS.inc(call_site=call_site)
+    logger.warning("LLM parse fallback call_site=%s", call_site)
+
+
+def llm_usage_totals(user_id: Optional[int] = None, round_id: Optional[int] = None) -> Dict[str, Any]:
+    """Per-call-site totals from ``llm_calls``, optionally filtered by user and/or round."""
+    query = db.session.query(
+        LLMCall.call_site,
+        func.count(LLMCall.id),
+        func.coalesce(func.sum(LLMCall.prompt_tokens), 0),
+        func.coalesce(func.sum(LLMCall.completion_tokens), 0),
+        func.coalesce(func.sum(LLMCall.latency_ms), 0.0),
+    )
+    if user_id is not None:
+        query = query.filter(LLMCall.user_id == user_id)
+    if round_id is not None:
+        query = query.filter(LLMCall.round_id == round_id)
+
+    by_site = {}
+    totals = {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0, "latency_ms": 0.0}
+    for site, calls, prompt, completion, latency in query.group_by(LLMCall.call_site).all():
+        by_site[site] = {
+            "calls": int(calls),
+            "prompt_tokens": int(prompt),
+            "completion_tokens": int(completion),
+            "latency_ms": float(latency),
+        }
+        for k, v in by_site[site].items():
+            totals[k] += v
+    return {"user_id": user_id, "round_id": round_id, "totals": totals, "by_call_site": by_site}
@@ -0,0 +1,100 @@
+"""Password hashing and verification on a dedicated process pool.
+
+Hashing is deliberately CPU-heavy. Running it in the request thread stalls the
+worker (and, for pure-Python parts, the GIL) during login bursts. Calls here
+block only the calling request while a child process does the work. At most
+``PASSWORD_HASH_MAX_PENDING`` calls are queued or running; past that, or when
+a call does not finish within ``PASSWORD_HASH_TIMEOUT``, ``PasswordHasherBusy``
+is raised so the route can answer 503 instead of piling up. A slot is freed
+when the child process finishes the call, not when the caller stops waiting.
+
+The pool uses the ``spawn`` start method: forking a threaded web worker is
+unsafe, and the children only need werkzeug.
+"""
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from typing import Optional
+
+from werkzeug.security import generate_password_hash, check_password_hash
+
+from config.settings import Settings
+
+
+class PasswordHasherBusy(RuntimeError):
+    """Too many hash/verify calls are already queued."""
+
+
+def _hash(password: str, method: str, salt_length: int) -> str:
+    return generate_password_hash(password, method=method, salt_length=salt_length)
+
+
+def _verify(pwhash: str, password: str) -> bool:
+    return check_password_hash(pwhash, password)
+
+
+_executor: Optional[ProcessPoolExecutor] = None
+_slots: Optional[threading.BoundedSemaphore] = None
+_lock = threading.Lock()
+
+
+def _get_executor() -> Optional[ProcessPoolExecutor]:
+    global _executor, _slots
+    if Settings.PASSWORD_HASH_WORKERS <= 0:
+        return None
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _slots = threading.BoundedSemaphore(max(1, Settings.PASSWORD_HASH_MAX_PENDING))
+                _executor = ProcessPoolExecutor(
+                    max_workers=Settings.PASSWORD_HASH_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _executor
+
+
+def _run(fn, *args):
+    executor = _get_executor()
+    if executor is None:
+        return fn(*args)
+    slots = _slots
+    if not slots.acquire(timeout=Settings.PASSWORD_HASH_TIMEOUT):
+        raise PasswordHasherBusy("Password hashing queue is full")
+    try:
+        future = executor.submit(fn, *args)
+    except BaseException:
+        slots.release()
+        raise
+    future.add_done_callback(lambda _: slots.release())
+    try:
+        return future.result(timeout=Settings.PASSWORD_HASH_TIMEOUT)
+    except FutureTimeout:
+        future.cancel()  # drops it if still queued; a running hash keeps its slot until done
+        raise PasswordHasherBusy("Password hashing timed out")
+
+
+def hash_password(password: str) -> str:
+    return _run(_hash, password, Settings.PASSWORD_HASH_METHOD, Settings.PASSWORD_SALT_LENGTH)
+
+
+def verify_password(pwhash: str, password: str) -> bool:
+    if not pwhash:
+        return False
+    return _run(_verify, pwhash, password)
+
+
+def needs_rehash(pwhash: str) -> bool:
+    """True when ``pwhash`` was made with a method/cost other than the configured one."""
+    if not pwhash or "$" not in pwhash:
+        return True
+    method, salt, _ = pwhash.split("$", 2)
+    return method != Settings.PASSWORD_HASH_METHOD or len(salt) != Settings.PASSWORD_SALT_LENGTH
+
+
+def shutdown() -> None:
+    """Stop the pool; the next call starts a new one with current settings."""
+    global _executor
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown(wait=True)
+            _executor = None
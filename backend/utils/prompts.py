@@ -45,6 +45,9 @@ Return JSON ONLY:
 """
 
 # ---------------- Answer Evaluation ----------------
+# Bump when the evaluation prompt changes so cached completions are not reused
+EVAL_PROMPT_VERSION = "1"
+
 EVAL_SYSTEM_PROMPT = """
 You are a fair but strict interview evaluator.
 Evaluate ONE candidate answer. Respond in JSON only:
@@ -73,6 +76,8 @@ Job Description: {jd}
 """
 
 # ---------------- Round Summary ----------------
+ROUND_SUMMARY_PROMPT_VERSION = "1"
+
 ROUND_SUMMARY_SYSTEM = """
 You are summarizing Round 1 interview performance.
 Return JSON only:
@@ -95,3 +100,51 @@ Evaluations: {evaluations}
 Resume: {resume}
 JD: {jd}
 """
+
+# ---------------- Batch Evaluation (deferred mode) ----------------
+BATCH_EVAL_PROMPT_VERSION = "1"
+
+BATCH_EVAL_SYSTEM_PROMPT = """
+You are a fair but strict interview evaluator.
+Evaluate EVERY candidate answer below, then summarize Round 1 performance.
+Respond in JSON only:
+
+{
+  "evaluations": [
+    {
+      "question_id": int,
+      "score": int (0-10),
+      "meets_requirement": boolean,
+      "feedback": "short actionable feedback",
+      "improvements": ["suggestion1","suggestion2"],
+      "dimensions": {
+        "relevance": int,
+        "clarity": int,
+        "depth": int,
+        "examples": int
+      }
+    }
+  ],
+  "summary": {
+    "overall_score": int (0-100),
+    "pass": boolean,
+    "strengths": [string],
+    "gaps": [string],
+    "recommendations": [string],
+    "topic_breakdown": [
+      {"topic": str, "avg_score": int}
+    ]
+  }
+}
+"""
+
+BATCH_EVAL_USER_TEMPLATE = """
+Answers to evaluate:
+{answers}
+
+Already evaluated answers (include in the summary only): {previous_evaluations}
+
+Context:
+Resume: {resume}
+Job Description: {jd}
+"""
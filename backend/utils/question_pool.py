@@ -0,0 +1,163 @@
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from config.settings import Settings
+from models import db, User, PregeneratedQuestionSet
+
+
+logger = logging.getLogger(__name__)
+
+
+def profile_hash(user: User) -> str:
+    """Fingerprint of the inputs a question set was generated from (resume + JD)."""
+    h = hashlib.sha256()
+    h.update((user.resume_text or "").encode("utf-8"))
+    h.update(b"\0")
+    h.update((user.job_description or "").encode("utf-8"))
+    return h.hexdigest()
+
+
+class QuestionPool:
+    """Per-(user, round) pool of pre-generated, unused question sets.
+
+    ``take`` pops a ready set so ``start_round_1`` does not wait on the LLM.
+    ``refill_async`` tops the pool back up to ``depth`` on a small background
+    pool. A set is stale when the resume/JD changed after it was generated or
+    when it is older than ``max_age`` seconds. Stale sets are discarded on take.
+    """
+
+    def __init__(self, depth: int, max_age: int, workers: int):
+        self.depth = depth
+        self.max_age = max_age
+        self._executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="qgen-pool")
+        self._inflight: Set[Tuple[int, int]] = set()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stale_discarded = 0
+        self.generated = 0
+        self.failures = 0
+
+    def _is_fresh(self, qset: PregeneratedQuestionSet, current_hash: str) -> bool:
+        if qset.source_hash != current_hash:
+            return False
+        if qset.created_at and datetime.utcnow() - qset.created_at > timedelta(seconds=self.max_age):
+            return False
+        return True
+
+    def take(self, user: User, round_number: int) -> Optional[List[str]]:
+        """Pop the oldest fresh set for ``user`` and drop any stale ones, or return None."""
+        current = profile_hash(user)
+        sets = (
+            PregeneratedQuestionSet.query.filter_by(user_id=user.id, round_number=round_number)
+            .order_by(PregeneratedQuestionSet.id.asc())
+            .all()
+        )
+        chosen = None
+        stale = 0
+        for qset in sets:
+            if not self._is_fresh(qset, current):
+                db.session.delete(qset)
+                stale += 1
+            elif chosen is None:
+                chosen = qset
+        if chosen is not None:
+            db.session.delete(chosen)
+        if chosen is not None or stale:
+            db.session.commit()
+
+        with self._lock:
+            self.stale_discarded += stale
+            if chosen is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return list(chosen.questions_json) if chosen is not None else None
+
+    def refill_async(self, app, user_id: int, round_number: int, num_q: int = 5) -> bool:
+        """Schedule a background top-up; returns False if one is already running for this key."""
+        if self.depth <= 0:
+            return False
+        key = (user_id, round_number)
+        with self._lock:
+            if key in self._inflight:
+                return False
+            self._inflight.add(key)
+        self._executor.submit(self._refill, app, user_id, round_number, num_q)
+        return True
+
+    def _refill(self, app, user_id: int, round_number: int, num_q: int) -> None:
+        from utils.interview_shared import InterviewUtils
+
+        try:
+            with app.app_context():
+                user = User.find_with_documents(user_id)
+                if not user or not user.resume_text or not user.job_description:
+                    return
+                current = profile_hash(user)
+                have = sum(
+                    1
+                    for qset in PregeneratedQuestionSet.query.filter_by(user_id=user_id, round_number=round_number)
+                    if self._is_fresh(qset, current)
+                )
+                for _ in range(self.depth - have):
+                    texts = InterviewUtils.generate_question_texts(user, num_q)
+                    if not texts:
+                        with self._lock:
+                            self.failures += 1
+                        break
+                    db.session.add(PregeneratedQuestionSet(
+                        user_id=user_id,
+                        round_number=round_number,
+                        questions_json=texts,
+                        source_hash=current,
+                    ))
+                    db.session.commit()
+                    with self._lock:
+                        self.generated += 1
+        except Exception:
+            logger.exception("QPOOL refill failed user_id=%s round=%s", user_id, round_number)
+            with self._lock:
+                self.failures += 1
+        finally:
+            with self._lock:
+                self._inflight.discard((user_id, round_number))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            takes = self.hits + self.misses
+            return {
+                "depth": self.depth,
+                "max_age": self.max_age,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / takes) if takes else 0.0,
+                "stale_discarded": self.stale_discarded,
+                "generated": self.generated,
+                "failures": self.failures,
+                "refills_in_flight": len(self._inflight),
+            }
+
+
+_pool: Optional[QuestionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_question_pool() -> Optional[QuestionPool]:
+    """Return the process-wide pool, or None when ``QUESTION_POOL_DEPTH`` is 0."""
+    global _pool
+    if Settings.QUESTION_POOL_DEPTH <= 0:
+        return None
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = QuestionPool(
+                    Settings.QUESTION_POOL_DEPTH,
+                    Settings.QUESTION_POOL_MAX_AGE,
+                    Settings.QUESTION_POOL_WORKERS,
+                )
+    return _pool
@@ -0,0 +1,42 @@
+import threading
+from typing import Optional
+
+from config.settings import Settings, get_bool
+from utils.sqlite_cache import SQLiteCache
+
+
+class ResumeTextCache(SQLiteCache):
+    """Persistent SQLite cache of extracted resume text, keyed by a hash of the file bytes.
+
+    The same CV uploaded by several accounts, or uploaded again, is parsed
+    once. Keys include the parser version, so a change to extraction misses.
+    Expiry and LRU eviction work as in ``LLMCache`` (see ``SQLiteCache``).
+    """
+
+    TABLE = "resume_text_cache"
+    COLUMNS = (("text", "TEXT NOT NULL"), ("size_bytes", "INTEGER"))
+
+    def get(self, key: str) -> Optional[str]:
+        row = self._get_row(key)
+        return row[0] if row else None
+
+    def put(self, key: str, text: str, size_bytes: int) -> None:
+        self._put_row(key, (text, size_bytes))
+
+
+_cache: Optional[ResumeTextCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_resume_cache() -> Optional[ResumeTextCache]:
+    """Return the process-wide resume text cache, or None when ``RESUME_CACHE_ENABLED`` is off."""
+    global _cache
+    if not get_bool(Settings.RESUME_CACHE_ENABLED):
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResumeTextCache(
+                    Settings.RESUME_CACHE_PATH, Settings.RESUME_CACHE_TTL, Settings.RESUME_CACHE_MAX_ENTRIES
+                )
+    return _cache
@@ -1,24 +1,138 @@
 import fitz  # PyMuPDF
 import docx2txt
+import hashlib
 import io
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional, Tuple
 
-def parse_pdf(file_stream):
-    doc = fitz.open(stream=file_stream.read(), filetype="pdf")
-    text = ""
-    for page in doc:
-        text += page.get_text()
-    return text
+from config.settings import Settings
+from utils.resume_cache import get_resume_cache
+
+logger = logging.getLogger(__name__)
+
+# Part of the cache key: bump when extraction output changes
+PARSER_VERSION = "2"
+READ_BLOCK = 1 << 16
+
+
+class ResumeTooLarge(ValueError):
+    pass
+
+
+def read_upload(file_stream, max_bytes: int) -> Tuple[bytes, str]:
+    """Read an upload block by block, hashing as it goes; returns ``(data, sha256 hex)``.
+
+    ``ResumeTooLarge`` is raised as soon as more than ``max_bytes`` have been
+    read, so no more than that is held in memory. A multipart upload has
+    already been parsed (and possibly spooled) by Werkzeug at this point; the
+    upload route bounds that with ``request.max_content_length``.
+    """
+    digest = hashlib.sha256()
+    blocks = []
+    size = 0
+    while True:
+        block = file_stream.read(READ_BLOCK)
+        if not block:
+            break
+        size += len(block)
+        if size > max_bytes:
+            raise ResumeTooLarge(f"Resume upload exceeds {max_bytes} bytes")
+        digest.update(block)
+        blocks.append(block)
+    return b"".join(blocks), digest.hexdigest()
+
+
+def _extract_pages(data: bytes, start: int, stop: int) -> str:
+    # Runs in a pool process too: every call opens its own document
+    with fitz.open(stream=data, filetype="pdf") as doc:
+        return "".join(doc[i].get_text() for i in range(start, stop))
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    # MuPDF is not thread-safe, so pages are spread over processes. "spawn" keeps
+    # the children clear of the web worker's threads and locks
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(
+                    max_workers=Settings.RESUME_PARSE_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _pool
+
+
+def _reset_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        # Reap the broken pool's processes and management thread before dropping it
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _page_ranges(page_count: int, parts: int) -> List[Tuple[int, int]]:
+    size, extra = divmod(page_count, parts)
+    ranges, start = [], 0
+    for i in range(parts):
+        stop = start + size + (1 if i < extra else 0)
+        if stop > start:
+            ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def parse_pdf(data: bytes) -> str:
+    with fitz.open(stream=data, filetype="pdf") as doc:
+        page_count = doc.page_count
+        workers = Settings.RESUME_PARSE_WORKERS
+        if workers < 2 or page_count < Settings.RESUME_PARALLEL_MIN_PAGES:
+            return "".join(page.get_text() for page in doc)
+
+    ranges = _page_ranges(page_count, workers)
+    try:
+        pool = _get_pool()
+        futures = [pool.submit(_extract_pages, data, start, stop) for start, stop in ranges]
+        return "".join(f.result() for f in futures)
+    except Exception as e:
+        if isinstance(e, BrokenProcessPool):
+            _reset_pool()
+        logger.exception("Parallel PDF extraction failed; parsing in-process")
+        return _extract_pages(data, 0, page_count)
+
+
+def parse_docx(data: bytes) -> str:
+    return docx2txt.process(io.BytesIO(data))
+
+
+PARSERS = {"pdf": parse_pdf, "docx": parse_docx}
 
-def parse_docx(file_stream):
-    return docx2txt.process(io.BytesIO(file_stream.read()))
 
 def parse_resume(file):
     filename = file.filename
     ext = filename.split('.')[-1].lower()
-    
-    if ext == 'pdf':
-        return {"text": parse_pdf(file.stream)}
-    elif ext == 'docx':
-        return {"text": parse_docx(file.stream)}
-    else:
+
+    parser = PARSERS.get(ext)
+    if parser is None:
         return {"error": "Unsupported file format. Use PDF or DOCX."}
+
+    data, sha256 = read_upload(file.stream, Settings.RESUME_MAX_BYTES)
+    cache = get_resume_cache()
+    key = f"{ext}:{PARSER_VERSION}:{sha256}"
+    if cache is not None:
+        text = cache.get(key)
+        if text is not None:
+            return {"text": text, "sha256": sha256, "cached": True}
+
+    text = parser(data)
+    if cache is not None:
+        cache.put(key, text, len(data))
+    return {"text": text, "sha256": sha256, "cached": False}
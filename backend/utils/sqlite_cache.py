@@ -0,0 +1,150 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteCache:
+    """Persistent key/value cache in one SQLite table, with a TTL and an LRU size cap.
+
+    Subclasses set ``TABLE`` and ``COLUMNS`` (the value columns and their SQL
+    types) and wrap ``_get_row`` / ``_put_row`` in their own ``get`` / ``put``.
+    Every table also has ``key``, ``created_at``, ``last_hit_at`` and ``hits``.
+    Entries expire ``ttl`` seconds after they are written. Once more than
+    ``max_entries`` are stored, the least recently hit ones are evicted. Each
+    thread gets its own connection, and WAL mode lets several worker processes
+    share the file.
+    """
+
+    TABLE = ""
+    COLUMNS: Sequence[Tuple[str, str]] = ()
+
+    # Evict at most once per this many writes to keep puts cheap
+    EVICT_EVERY = 50
+
+    def __init__(self, path: str, ttl: int, max_entries: int):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        columns = "".join(f"{name} {sql_type},\n" for name, sql_type in self.COLUMNS)
+        self._conn().execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {self.TABLE} (
+                key TEXT PRIMARY KEY,
+                {columns}
+                created_at REAL NOT NULL,
+                last_hit_at REAL NOT NULL,
+                hits INTEGER DEFAULT 0
+            )
+            """
+        )
+        # Files written before the table had a hits column
+        existing = {row[1] for row in self._conn().execute(f"PRAGMA table_info({self.TABLE})")}
+        if "hits" not in existing:
+            self._conn().execute(f"ALTER TABLE {self.TABLE} ADD COLUMN hits INTEGER DEFAULT 0")
+        self._conn().execute(
+            f"CREATE INDEX IF NOT EXISTS ix_{self.TABLE}_last_hit ON {self.TABLE} (last_hit_at)"
+        )
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _get_row(self, key: str) -> Optional[tuple]:
+        """The value columns of a live entry (marking it hit), or None; counts the hit or miss."""
+        now = time.time()
+        names = ", ".join(name for name, _ in self.COLUMNS)
+        try:
+            row = self._conn().execute(
+                f"SELECT {names}, created_at FROM {self.TABLE} WHERE key = ?", (key,)
+            ).fetchone()
+            if row and now - row[-1] > self.ttl:
+                self._conn().execute(f"DELETE FROM {self.TABLE} WHERE key = ?", (key,))
+                row = None
+            if row:
+                self._conn().execute(
+                    f"UPDATE {self.TABLE} SET last_hit_at = ?, hits = hits + 1 WHERE key = ?", (now, key)
+                )
+        except sqlite3.Error:
+            logger.exception("%s read failed", self.TABLE)
+            row = None
+        with self._lock:
+            if row:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return row[:-1] if row else None
+
+    def _put_row(self, key: str, values: Sequence[Any]) -> None:
+        """Store the value columns for ``key``; every ``EVICT_EVERY`` writes also runs ``evict``."""
+        now = time.time()
+        names = ", ".join(name for name, _ in self.COLUMNS)
+        placeholders = ", ".join("?" for _ in self.COLUMNS)
+        try:
+            self._conn().execute(
+                f"INSERT OR REPLACE INTO {self.TABLE} (key, {names}, created_at, last_hit_at, hits) "
+                f"VALUES (?, {placeholders}, ?, ?, 0)",
+                (key, *values, now, now),
+            )
+        except sqlite3.Error:
+            logger.exception("%s write failed", self.TABLE)
+            return
+        with self._lock:
+            self._writes += 1
+            evict = self._writes % self.EVICT_EVERY == 0
+        if evict:
+            self.evict()
+
+    def evict(self) -> int:
+        """Drop expired rows, then the least recently hit rows beyond ``max_entries``."""
+        conn = self._conn()
+        try:
+            removed = conn.execute(
+                f"DELETE FROM {self.TABLE} WHERE created_at < ?", (time.time() - self.ttl,)
+            ).rowcount
+            removed += conn.execute(
+                f"""
+                DELETE FROM {self.TABLE} WHERE key IN (
+                    SELECT key FROM {self.TABLE} ORDER BY last_hit_at DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            ).rowcount
+        except sqlite3.Error:
+            logger.exception("%s eviction failed", self.TABLE)
+            return 0
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        try:
+            entries = self._conn().execute(f"SELECT COUNT(*) FROM {self.TABLE}").fetchone()[0]
+        except sqlite3.Error:
+            entries = None
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+                "entries": entries,
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+            }
@@ -1,4 +1,5 @@
 import api from './client';
+import storage from '../utils/storage';
 
 const unwrap = (res) => res.data;
 const onError = (err) => {
@@ -11,6 +12,43 @@ const onError = (err) => {
   throw new Error(msg);
 };
 
+// POST and read a text/event-stream response; resolves with the data of the `resultEvent` event
+const postSSE = async (path, body, resultEvent, onEvent) => {
+  const headers = {};
+  const token = storage.getAccessToken?.();
+  if (token) headers.Authorization = `Bearer ${token}`;
+  const res = await fetch(`${api.defaults.baseURL}${path}`, {
+    method: "POST",
+    body,
+    headers,
+    credentials: "include",
+  });
+  if (!res.ok || !res.body) {
+    const data = await res.json().catch(() => ({}));
+    onError({ message: data.error, response: { status: res.status, data } });
+  }
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  let result = null;
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    let sep;
+    while ((sep = buffer.indexOf("\n\n")) !== -1) {
+      const block = buffer.slice(0, sep);
+      buffer = buffer.slice(sep + 2);
+      const name = block.match(/^event: (.*)$/m)?.[1];
+      const data = JSON.parse(block.match(/^data: (.*)$/m)?.[1] || "{}");
+      if (name === resultEvent) result = data;
+      if (name === "error") throw new Error(data.error || data.message || "Request failed");
+      onEvent?.(name, data);
+    }
+  }
+  return result;
+};
+
 export const round1Api = {
   start: () => api.post("/round1/start").then(unwrap).catch(onError),
   getQuestionAudio: () => api.get("/round1/get-question-audio").then(unwrap).catch(onError),
@@ -19,6 +57,22 @@ export const round1Api = {
     form.append("audio", audioBlob, "answer.webm");
     return api.post(`/round1/submit-answer/${questionId}`, form).then(unwrap).catch(onError);
   },
+  // SSE variant: onEvent(name, data) gets round, question ({ id, text, index }) as each one is stored, done, error
+  startStream: (onEvent) => postSSE("/round1/start/stream", undefined, "done", onEvent),
+  // SSE variant: onEvent(name, data) gets transcript, feedback ({ delta }), evaluation, result, error
+  submitAnswerStream: (questionId, audioBlob, onEvent) => {
+    const form = new FormData();
+    form.append("audio", audioBlob, "answer.webm");
+    return postSSE(`/round1/submit-answer/${questionId}/stream`, form, "result", onEvent);
+  },
+  sendAnswerChunk: (questionId, seq, chunkBlob, final = false) => {
+    const form = new FormData();
+    form.append("seq", String(seq));
+    form.append("final", final ? "true" : "false");
+    if (chunkBlob) form.append("audio", chunkBlob, `chunk-${seq}.webm`);
+    return api.post(`/round1/answer-chunk/${questionId}`, form).then(unwrap).catch(onError);
+  },
+  getJob: (jobId, wait = 20) => api.get(`/round1/jobs/${jobId}`, { params: { wait } }).then(unwrap).catch(onError),
   endInterview: () => api.post("/round1/end-interview").then(unwrap).catch(onError),
   getSummary: () => api.get("/round1/summary").then(unwrap).catch(onError),
   getInterviewStatus: () => api.get("/round1/get-interview-status").then(unwrap).catch(onError),
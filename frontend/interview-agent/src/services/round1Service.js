@@ -29,7 +29,12 @@ export const round1Service = {
   },
 
   async getNextQuestion() {
-    const data = await round1Api.getQuestionAudio();
+    let data = await round1Api.getQuestionAudio();
+    // A streaming start may still be generating the next question; retry after the hinted delay
+    while (data?.round_status === "generating") {
+      await new Promise((resolve) => setTimeout(resolve, (data.retry_after ?? 1) * 1000));
+      data = await round1Api.getQuestionAudio();
+    }
     if (data?.message === "No more questions") return { done: true };
     // Sample response: {"question_id": 10, "text": "...", "audio_url": "/static/audio/q_10.mp3"}
     const { question_id, text, audio_url } = data;
@@ -42,7 +47,16 @@ export const round1Service = {
   },
 
   async submitAnswer(questionId, audioBlob) {
-  const data = await round1Api.submitAnswer(questionId, audioBlob);
+  let data = await round1Api.submitAnswer(questionId, audioBlob);
+    // Async mode: server returns a job id; long-poll until the evaluation is ready
+    if (data?.job_id) {
+      let job = data;
+      while (job.status === "queued" || job.status === "running") {
+        job = await round1Api.getJob(data.job_id);
+      }
+      if (job.status !== "done") throw new Error(job.error || "Answer processing failed");
+      data = job.result;
+    }
     const { transcript, evaluation, completed, summary } = data;
     return { transcript, evaluation, completed, summary: summary || null };
   },
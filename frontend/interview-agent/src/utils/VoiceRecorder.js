@@ -1,6 +1,8 @@
 
 class VoiceRecorder {
-  constructor() {
+  constructor({ onChunk } = {}) {
+    // Optional callback for streamed uploads; receives each recorded blob as it arrives
+    this.onChunk = onChunk || null;
     this.mediaRecorder = null;
     this.audioChunks = [];
     this.stream = null;
@@ -26,6 +28,7 @@ class VoiceRecorder {
       this.mediaRecorder.ondataavailable = (event) => {
         if (event.data.size > 0) {
           this.audioChunks.push(event.data);
+          if (this.onChunk) this.onChunk(event.data);
         }
       };
       